@@ -4,22 +4,91 @@ Provides shared fixtures, hooks, and configuration for all test modules.
 """
 
 import pytest
-import yaml
 import os
+import json
+import time
 import logging
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from utils.logger import setup_logger
-from utils.screenshot_helper import ScreenshotHelper
+from utils.config_loader import load_config, shared_config_state, prime_config
+from utils.logger import setup_logger, shutdown_logger, merge_worker_logs
+from utils.browser_pool import BrowserPool
+from utils.driver_factory import create_driver
+from utils.network_control import NetworkController, DEFAULT_FIXTURES_DIR as DEFAULT_NETWORK_FIXTURES_DIR
+from utils.trace_capture import TraceCapture, write_capture, TRACE_SUFFIX, HAR_SUFFIX
+from utils.session_cassette import CassetteLibrary, MODES as CASSETTE_MODES, MODE_OFF, MODE_RECORD, MODE_REPLAY
+from utils.auth_cache import AuthSessionCache
+from utils.api_client import ApiClientPool
+from utils.integration_poller import IntegrationPoller
+from utils.fake_backend import FakeBackend
+from utils.test_data_manager import TestDataManager
+from utils.reason_index import ReasonHierarchyIndex
+from utils.test_data_provider import TestDataProvider, DEFAULT_DATA_CACHE_DIR
+from utils.test_scheduler import DurationStore, DurationSchedulerPlugin, DEFAULT_DURATIONS_FILE
+from utils.metrics_collector import MetricsCollector, thresholds_from_config, DEFAULT_METRICS_DIR, set_active_collector, get_active_collector
+from utils.perf_baseline import BaselineStore, DEFAULT_BASELINE_DB, current_commit
+from utils.screenshot_helper import ScreenshotHelper, configure_screenshot_writer, get_screenshot_writer
 from pages.login_page import LoginPage
 
 
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config", "config.yaml")
+
+# Authenticated session fixtures and the role each one logs in as
+ROLE_FIXTURES = {
+    'revenue_user_session': 'revenue_collection',
+    'customer_care_session': 'customer_care',
+}
+
+
+def _load_config_file():
+    """Get the configuration (parsed once per file version, with environment overlays)."""
+    return load_config(CONFIG_PATH)
+
+
+def pytest_addoption(parser):
+    """Register framework command line options."""
+    group = parser.getgroup("mobinet", "Mobinet NextGen automation")
+    group.addoption(
+        "--duration-schedule", action="store_true", default=False,
+        help="Pack tests onto xdist workers by recorded duration (use with --dist loadgroup)"
+    )
+    group.addoption(
+        "--fake-backend", action="store_true", default=False,
+        help="Run against the bundled local fake backend instead of environment.base_url"
+    )
+    group.addoption(
+        "--network-control", action="store_true", default=False,
+        help="Route browsers through selenium-wire so tests can stub, delay and record API calls"
+    )
+    group.addoption(
+        "--cassette-mode", choices=CASSETTE_MODES, default=None,
+        help="Record every browser request per test to a cassette, or replay cassettes offline (default: network.cassette_mode)"
+    )
+    group.addoption(
+        "--cassette-latency", default=None,
+        help="Replay delay: zero, recorded or a scale factor of the recorded time (default: network.cassette_latency)"
+    )
+    group.addoption(
+        "--trace-capture", action="store_true", default=False,
+        help="Capture a DevTools performance trace and HAR of every browser test (Chrome)"
+    )
+    group.addoption(
+        "--data-seed", type=int, default=None,
+        help="Run seed for generated test data (default: test_data.seed in config.yaml)"
+    )
+
+
+def _data_seed(config):
+    """Get the run seed for generated test data (same on the controller and every worker)."""
+    seed = config.getoption("data_seed")
+    if seed is None:
+        seed = _load_config_file().get('test_data', {}).get('seed', 0)
+    return seed
+
+
+def pytest_report_header(config):
+    """Show the data seed so a run's generated data can be reproduced."""
+    return f"mobinet test data seed: {_data_seed(config)} (reproduce with --data-seed)"
+
 def pytest_configure(config):
     """Configure pytest with custom settings."""
     # Create reports directory
@@ -30,76 +99,349 @@ def pytest_configure(config):
 
 
 @pytest.fixture(scope="session")
-def config_data():
-    """Load configuration data from YAML file."""
-    config_path = os.path.join(os.path.dirname(__file__), "config", "config.yaml")
-    with open(config_path, 'r', encoding='utf-8') as file:
-        return yaml.safe_load(file)
+def fake_backend(request):
+    """
+    Local stand-in for the application and /non-payment-reasons API.
+    Started on a free port per session (per xdist worker) when enabled by
+    --fake-backend or fake_backend.enabled; yields None otherwise.
+    """
+    raw_config = _load_config_file()
+    backend_config = raw_config.get('fake_backend', {})
+    
+    if not (request.config.getoption("fake_backend") or backend_config.get('enabled', False)):
+        yield None
+        return
+        
+    backend = FakeBackend(
+        users=raw_config['users'],
+        reason_hierarchies=TestDataManager(raw_config).generate_reason_hierarchy_data(),
+        default_contract_id=raw_config['test_data']['contracts']['valid_contract_id'],
+        latency_ms=backend_config.get('latency_ms', 0),
+        latency_jitter_ms=backend_config.get('latency_jitter_ms', 0),
+        error_rate=backend_config.get('error_rate', 0.0),
+        error_status=backend_config.get('error_status', 500),
+        seed=backend_config.get('seed', 0),
+        sync_delay_ms=backend_config.get('sync_delay_ms')
+    ).start()
+    
+    yield backend
+    
+    backend.stop()
+
+
+@pytest.fixture(scope="session")
+def config_data(fake_backend):
+    """Immutable configuration, with URLs pointing at the fake backend when it runs."""
+    data = _load_config_file()
+    
+    if fake_backend:
+        data = data.with_overrides({
+            'environment': {'base_url': fake_backend.base_url, 'api_base_url': fake_backend.api_base_url},
+            'external_systems': {
+                system: {'status_url': fake_backend.status_url(system)}
+                for system in data.get('external_systems', {})
+            }
+        })
+        
+    return data
 
 
 @pytest.fixture(scope="session") 
-def logger():
-    """Setup logger for test execution."""
-    return setup_logger()
+def logger(config_data):
+    """
+    Setup logger for test execution.
+    In queue mode records are written by a background listener, drained at session end.
+    """
+    logging_config = config_data.get('logging', {})
+    
+    test_logger = setup_logger(
+        level=getattr(logging, logging_config.get('level', 'INFO')),
+        mode=logging_config.get('mode', 'sync'),
+        batch_size=logging_config.get('batch_size', 200),
+        flush_interval=logging_config.get('flush_interval', 2.0),
+        caller_info=logging_config.get('caller_info', True)
+    )
+    
+    yield test_logger
+    
+    shutdown_logger(test_logger.name)
 
 
-@pytest.fixture(scope="function")
-def driver(config_data, logger, request):
+def pytest_sessionfinish(session, exitstatus):
+    """Merge per-worker log files once all xdist workers have finished."""
+    if not hasattr(session.config, 'workerinput'):
+        merge_worker_logs()
+
+
+def _network_config(config_data, config):
+    """
+    Network control settings, enabled by network.enabled or --network-control.
+    Recording or replaying session cassettes implies network control.
+    """
+    network_config = dict(config_data.get('network', {}))
+    for option in ("cassette_mode", "cassette_latency"):
+        if config.getoption(option) is not None:
+            network_config[option] = config.getoption(option)
+    network_config.setdefault('cassette_mode', MODE_OFF)
+
+    if config.getoption("network_control") or network_config['cassette_mode'] != MODE_OFF:
+        network_config['enabled'] = True
+    return network_config
+
+
+@pytest.fixture(scope="session")
+def session_cassettes(config_data, logger, request):
     """
-    Initialize WebDriver instance based on configuration.
-    Supports Chrome and Firefox browsers with configurable options.
+    Library of per-test browser session cassettes, or None unless recording or replaying.
+    Cassette URLs are relative to base_url and api_base_url, so replays work against any host.
     """
+    network_config = _network_config(config_data, request.config)
+    if network_config['cassette_mode'] == MODE_OFF:
+        return None
+
+    environment = config_data['environment']
+    return CassetteLibrary(
+        network_config.get('session_cassettes_dir', "reports/cassettes/sessions"),
+        mode=network_config['cassette_mode'],
+        roots={'base': environment['base_url'], 'api': environment['api_base_url']},
+        extra_volatile_patterns=network_config.get('volatile_patterns') or (),
+        latency=network_config.get('cassette_latency', "zero"),
+        logger=logger
+    )
+
+
+TRACE_CAPTURE_KEY = pytest.StashKey()
+
+
+def _trace_capture_config(config_data):
+    return config_data.get('performance', {}).get('trace_capture', {})
+
+
+def _captures_trace(item, config_data):
+    """Whether a test captures a trace (--trace-capture, performance.trace_capture.enabled or the marker)."""
+    return bool(
+        item.config.getoption("trace_capture")
+        or _trace_capture_config(config_data).get('enabled', False)
+        or item.get_closest_marker("trace_capture")
+    )
+
+
+def _create_browser_pool(config_data, logger, request, capture_config=None):
+    """Build a lazily filled browser pool; capture_config enables the performance log."""
     browser_config = config_data['browser']
-    browser_name = browser_config['name'].lower()
+    network_config = _network_config(config_data, request.config)
     
-    logger.info(f"Initializing {browser_name} browser")
+    environment = config_data['environment']
+    # Session cassettes cover the whole application, not just the API
+    scope_urls = None
+    if network_config['cassette_mode'] != MODE_OFF:
+        scope_urls = [environment['base_url'], environment['api_base_url']]
     
+    def new_browser():
+        driver_instance = create_driver(browser_config, logger, network_config, capture_config)
+        if network_config.get('enabled'):
+            driver_instance.network = NetworkController(
+                driver_instance,
+                environment['api_base_url'],
+                fixtures_dir=network_config.get('fixtures_dir', DEFAULT_NETWORK_FIXTURES_DIR),
+                logger=logger,
+                scope_urls=scope_urls
+            )
+        return driver_instance
+
+    return BrowserPool(
+        new_browser,
+        size=browser_config.get('pool_size', 1),
+        max_reuse=browser_config.get('max_reuse', 25),
+        max_js_heap_mb=browser_config.get('max_js_heap_mb'),
+        logger=logger
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_pool(config_data, logger, request):
+    """
+    Pool of warm WebDriver instances shared by all tests in the session.
+    Under pytest-xdist each worker gets its own pool.
+    """
+    pool = _create_browser_pool(config_data, logger, request)
+
+    yield pool
+
+    pool.shutdown()
+
+
+@pytest.fixture(scope="session")
+def trace_browser_pool(config_data, logger, request):
+    """
+    Pool of browsers logging trace events, used only by tests that capture traces.
+    ChromeDriver traces for a browser's whole life, so other tests never share these.
+    """
+    pool = _create_browser_pool(config_data, logger, request, _trace_capture_config(config_data))
+
+    yield pool
+
+    pool.shutdown()
+
+
+@pytest.fixture(scope="function")
+def driver(browser_pool, session_cassettes, config_data, logger, request):
+    """
+    Provide a WebDriver instance from the browser pool.
+    The browser is navigated to the base URL and returned to the pool after the test.
+    In cassette record mode the test's traffic is saved on teardown; in replay mode
+    it is served from the cassettes instead of the application.
+    """
+    captures_trace = _captures_trace(request.node, config_data)
+    pool = request.getfixturevalue("trace_browser_pool") if captures_trace else browser_pool
+
     try:
-        if browser_name == "chrome":
-            options = ChromeOptions()
-            if browser_config['headless']:
-                options.add_argument("--headless=new")
-            options.add_argument(f"--window-size={browser_config['window_size']}")
-            options.add_argument("--disable-web-security")
-            options.add_argument("--allow-running-insecure-content")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            
-            service = ChromeService(ChromeDriverManager().install())
-            driver_instance = webdriver.Chrome(service=service, options=options)
-            
-        elif browser_name == "firefox":
-            options = FirefoxOptions()
-            if browser_config['headless']:
-                options.add_argument("--headless")
-            options.add_argument(f"--width={browser_config['window_size'].split(',')[0]}")
-            options.add_argument(f"--height={browser_config['window_size'].split(',')[1]}")
-            
-            service = FirefoxService(GeckoDriverManager().install())
-            driver_instance = webdriver.Firefox(service=service, options=options)
-            
-        else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
+        driver_instance = pool.acquire()
+        network = getattr(driver_instance, 'network', None)
         
-        # Configure timeouts
-        driver_instance.implicitly_wait(browser_config['implicit_wait'])
-        driver_instance.set_page_load_timeout(browser_config['page_load_timeout'])
+        player = None
+        if session_cassettes is not None and session_cassettes.mode == MODE_REPLAY and network is not None:
+            player = session_cassettes.player(request.node.nodeid)
+            network.set_fallback(player)
         
+        # Canned API responses must be in place before the app loads
+        canned = request.node.get_closest_marker("canned_api")
+        if canned and network is not None:
+            latency_ms = canned.kwargs.get('latency_ms', 0)
+            for name in canned.args:
+                network.stub_from_fixture(name, delay_ms=latency_ms)
+
+        # Trace capture starts before navigation so the page load is included;
+        # it is stopped and reported in pytest_runtest_makereport
+        if captures_trace:
+            if TraceCapture.supported(driver_instance):
+                capture = TraceCapture(driver_instance, logger)
+                capture.start()
+                request.node.stash[TRACE_CAPTURE_KEY] = (capture, _trace_capture_config(config_data))
+            else:
+                logger.warning("Trace capture requested but the browser has no performance log")
+
         # Navigate to base URL
         driver_instance.get(config_data['environment']['base_url'])
         logger.info(f"Navigated to: {config_data['environment']['base_url']}")
-        
-        yield driver_instance
-        
+
     except Exception as e:
         logger.error(f"Failed to initialize driver: {str(e)}")
+        if 'driver_instance' in locals():
+            pool.discard(driver_instance)
         raise
-    
+
+    yield driver_instance
+
+    try:
+        # Capture not collected by the report hook (the test did not reach its call phase)
+        if TRACE_CAPTURE_KEY in request.node.stash:
+            del request.node.stash[TRACE_CAPTURE_KEY]
+
+        if player is not None and player.misses:
+            logger.warning(f"{len(player.misses)} requests had no recorded response in {request.node.nodeid}")
+        elif session_cassettes is not None and session_cassettes.mode == MODE_RECORD and network is not None:
+            try:
+                session_cassettes.record(request.node.nodeid, driver_instance.requests)
+            except Exception as e:
+                logger.warning(f"Failed to record session cassette: {str(e)}")
     finally:
-        if 'driver_instance' in locals():
-            logger.info("Closing browser")
-            driver_instance.quit()
+        pool.release(driver_instance)
+
+
+@pytest.fixture(scope="function")
+def network(driver):
+    """
+    Network control of the test's browser (stub, delay and record API calls).
+    Skips the test unless network control is enabled.
+    """
+    if getattr(driver, 'network', None) is None:
+        pytest.skip("Network control is disabled (enable network.enabled or --network-control)")
+    return driver.network
+
+
+@pytest.fixture(scope="session", autouse=True)
+def screenshot_writer(config_data, logger):
+    """
+    Background screenshot writer shared by all screenshot helpers in the session.
+    Pending screenshots are flushed to disk when the session ends.
+    """
+    reporting_config = config_data.get('reporting', {})
+    asynchronous = reporting_config.get('screenshot_mode', 'async') == 'async'
+    
+    writer = configure_screenshot_writer(
+        max_workers=reporting_config.get('screenshot_workers', 2) if asynchronous else 0,
+        max_pending=reporting_config.get('screenshot_queue_size', 16),
+        compress_level=reporting_config.get('screenshot_compress_level'),
+        logger=logger
+    )
+    
+    yield writer
+    
+    writer.shutdown()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def metrics_collector(config_data, fake_backend, logger, request):
+    """
+    Timing samples shared across iterations and tests, checked against the performance.*_max
+    limits and performance.thresholds.
+    Samples logged with TestLogger.performance(..., metric=...) are recorded too.
+    Raw samples are appended to the historical baseline store after each test, and at
+    session end a JSON summary is written per run (per worker under pytest-xdist).
+    """
+    performance_config = config_data.get('performance', {})
+    baseline_config = performance_config.get('baseline', {})
+    
+    workerinput = getattr(request.config, 'workerinput', {})
+    run_info = {
+        'run_id': os.environ.get('MOBINET_RUN_ID') or workerinput.get('testrunuid') or datetime.now().strftime('%Y%m%d_%H%M%S_%f'),
+        'worker': workerinput.get('workerid'),
+        'commit': current_commit(os.path.dirname(__file__)),
+        'browser': config_data['browser']['name'],
+        'environment': "fake-backend" if fake_backend else config_data['environment']['base_url']
+    }
+    
+    sample_sink = None
+    if baseline_config.get('enabled', True):
+        store = BaselineStore(baseline_config.get('path', DEFAULT_BASELINE_DB), logger)
+        
+        def sample_sink(samples):
+            # Appended after every test so raw samples are not held for the whole session
+            try:
+                store.append_run(
+                    run_info['run_id'],
+                    samples,
+                    commit=run_info['commit'],
+                    browser=run_info['browser'],
+                    environment=run_info['environment'],
+                    worker=run_info['worker']
+                )
+            except Exception as e:
+                logger.warning(f"Could not store performance baseline samples: {str(e)}")
+    
+    collector = MetricsCollector(
+        thresholds=thresholds_from_config(performance_config),
+        sample_sink=sample_sink,
+        logger=logger
+    )
+    set_active_collector(collector)
+    
+    yield collector
+    
+    set_active_collector(None)
+    collector.flush()
+    collector.write_summary(performance_config.get('metrics_dir', DEFAULT_METRICS_DIR), run_info=run_info)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def metrics_scope(metrics_collector, request):
+    """Scope threshold assertions to the samples recorded during the current test."""
+    metrics_collector.begin_test(request.node.nodeid)
+    
+    yield
+    
+    metrics_collector.end_test()
 
 
 @pytest.fixture(scope="function")
@@ -114,44 +456,122 @@ def login_page(driver, config_data, logger):
     return LoginPage(driver, config_data, logger)
 
 
-@pytest.fixture(scope="function")
-def revenue_user_session(driver, config_data, login_page, logger):
+@pytest.fixture(scope="session")
+def auth_cache(config_data, logger):
+    """Per-role cache of authenticated sessions, shared by all tests in the session."""
+    auth_config = config_data.get('auth', {})
+    return AuthSessionCache(
+        config_data['environment']['base_url'],
+        max_age=auth_config.get('session_max_age', 1800),
+        logger=logger
+    )
+
+
+def _authenticate(role_key, driver, login_page, auth_cache, config_data, logger):
     """
-    Provides authenticated session with Revenue Collection role.
-    Automatically logs in with revenue collection credentials.
+    Authenticate the browser for a role.
+    Restores a cached session when available and falls back to the UI login flow.
     """
-    user_config = config_data['users']['revenue_collection']
+    user_config = config_data['users'][role_key]
+    use_cache = config_data.get('auth', {}).get('cache_sessions', True)
     
-    logger.info(f"Logging in as Revenue Collection user: {user_config['username']}")
+    if use_cache and auth_cache.restore(driver, role_key):
+        if login_page.is_session_active():
+            logger.info(f"{user_config['role']} session restored from cache")
+            return
+            
+        logger.warning(f"Cached {user_config['role']} session rejected, falling back to UI login")
+        auth_cache.invalidate(role_key)
+        driver.delete_all_cookies()
+    
+    logger.info(f"Logging in as {user_config['role']} user: {user_config['username']}")
     
     login_page.login(user_config['username'], user_config['password'])
     
     # Verify successful login
-    assert login_page.is_login_successful(), "Revenue Collection user login failed"
+    assert login_page.is_login_successful(), f"{user_config['role']} user login failed"
+    
+    logger.info(f"{user_config['role']} user login successful")
     
-    logger.info("Revenue Collection user login successful")
+    if use_cache:
+        auth_cache.capture(driver, role_key)
+
+
+@pytest.fixture(scope="function")
+def revenue_user_session(driver, config_data, login_page, auth_cache, logger):
+    """
+    Provides authenticated session with Revenue Collection role.
+    Logs in through the UI once per session and restores the cached session afterwards.
+    """
+    _authenticate('revenue_collection', driver, login_page, auth_cache, config_data, logger)
     return driver
 
 
 @pytest.fixture(scope="function")
-def customer_care_session(driver, config_data, login_page, logger):
+def customer_care_session(driver, config_data, login_page, auth_cache, logger):
     """
     Provides authenticated session with Customer Care role.
-    Automatically logs in with customer care credentials.
+    Logs in through the UI once per session and restores the cached session afterwards.
     """
-    user_config = config_data['users']['customer_care']
-    
-    logger.info(f"Logging in as Customer Care user: {user_config['username']}")
-    
-    login_page.login(user_config['username'], user_config['password'])
-    
-    # Verify successful login  
-    assert login_page.is_login_successful(), "Customer Care user login failed"
-    
-    logger.info("Customer Care user login successful")
+    _authenticate('customer_care', driver, login_page, auth_cache, config_data, logger)
     return driver
 
 
+@pytest.fixture(scope="session")
+def api_clients(config_data, auth_cache, logger):
+    """
+    Authenticated API clients per role, shared by the session.
+    Reuse the cookies of the role's cached browser session, or log in over HTTP.
+    """
+    pool = ApiClientPool(config_data, auth_cache, logger)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def api_client(api_clients):
+    """API client authenticated as the Revenue Collection user."""
+    return api_clients.for_role('revenue_collection')
+
+
+@pytest.fixture(scope="function")
+def integration_poller(config_data, api_client, logger):
+    """Concurrent poller of the external systems' sync status endpoints, using the API client's session."""
+    return IntegrationPoller.from_config(config_data, session=api_client.session, logger=logger)
+
+
+@pytest.fixture(scope="session")
+def test_data_provider(config_data, logger, request):
+    """
+    Seeded test data shared by the session: one Faker per worker, per-test seeds
+    derived from the run seed and node ID, datasets memoized on disk.
+    """
+    data_config = config_data.get('test_data', {})
+    return TestDataProvider(
+        config_data,
+        run_seed=_data_seed(request.config),
+        cache_dir=data_config.get('cache_dir', DEFAULT_DATA_CACHE_DIR) if data_config.get('cache', True) else None,
+        logger=logger
+    )
+
+
+@pytest.fixture(scope="function")
+def test_data_manager(test_data_provider, request):
+    """TestDataManager seeded for the current test (identical data on every worker and rerun)."""
+    return test_data_provider.manager(request.node.nodeid)
+
+
+@pytest.fixture(scope="session")
+def reason_index(config_data, fake_backend):
+    """
+    Reason hierarchy index built once per session: from the fake backend's reason
+    codes when it runs, otherwise from the generated reason hierarchies.
+    """
+    if fake_backend:
+        return ReasonHierarchyIndex.from_codes(fake_backend.codes)
+    return ReasonHierarchyIndex.from_hierarchies(TestDataManager(config_data).generate_reason_hierarchy_data())
+
+
 @pytest.fixture(scope="function")
 def test_contracts(config_data):
     """Provides test contract data for test scenarios."""
@@ -169,36 +589,94 @@ def pytest_runtest_makereport(item, call):
     """
     Hook to capture screenshots on test failures.
     Executed after each test to determine outcome.
+    Traces captured during the test are written next to the screenshot and attached.
     """
     outcome = yield
     report = outcome.get_result()
     
-    if report.when == "call" and report.failed:
+    if report.when != "call":
+        return
+
+    # Generate artifact filenames with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    test_name = item.name.replace(" ", "_").replace("::", "_")
+    
+    if report.failed:
         # Access driver from the test
         driver = None
         if hasattr(item, 'funcargs'):
             driver = item.funcargs.get('driver')
         
         if driver:
-            # Generate screenshot filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            test_name = item.name.replace(" ", "_").replace("::", "_")
             screenshot_path = f"screenshots/FAILED_{test_name}_{timestamp}.png"
             
             try:
-                driver.save_screenshot(screenshot_path)
+                png_bytes = driver.get_screenshot_as_png()
+                get_screenshot_writer().submit(screenshot_path, lambda: png_bytes)
                 # Attach screenshot to Allure report if available
                 try:
                     import allure
-                    allure.attach.file(screenshot_path, 
-                                     name=f"Failed Test Screenshot - {test_name}",
-                                     attachment_type=allure.attachment_type.PNG)
+                    allure.attach(png_bytes,
+                                  name=f"Failed Test Screenshot - {test_name}",
+                                  attachment_type=allure.attachment_type.PNG)
                 except ImportError:
                     pass  # Allure not available, skip attachment
                     
             except Exception as e:
                 logging.error(f"Failed to capture screenshot: {str(e)}")
 
+    if TRACE_CAPTURE_KEY in item.stash:
+        capture, capture_config = item.stash[TRACE_CAPTURE_KEY]
+        del item.stash[TRACE_CAPTURE_KEY]
+        prefix = "FAILED_" if report.failed else ""
+        _report_trace_capture(item, report, capture, capture_config, f"screenshots/{prefix}{test_name}_{timestamp}")
+
+
+def _report_trace_capture(item, report, capture, capture_config, base_path):
+    """Collect a test's trace and HAR, keep them per performance.trace_capture.keep and report the overhead."""
+    keep = capture_config.get('keep', 'failed')
+
+    try:
+        result = capture.stop(title=item.nodeid)
+        overhead = result.overhead
+        paths = ()
+        if report.failed or keep == 'always':
+            trace_path, har_path, write_time = write_capture(
+                result, base_path, compress_level=capture_config.get('compress_level', 6)
+            )
+            overhead += write_time
+            paths = (trace_path, har_path)
+    except Exception as e:
+        logging.error(f"Failed to collect trace capture: {str(e)}")
+        return
+
+    summary = {
+        'overhead_ms': round(overhead * 1000, 1),
+        'overhead_pct': round(overhead / report.duration * 100, 2) if report.duration else None,
+        'trace_events': result.trace_events,
+        'har_entries': result.har_entries,
+        'artifacts': list(paths),
+    }
+    item.user_properties.append(("trace_capture", summary))
+    logging.info(
+        f"Trace capture: {result.trace_events} trace events, {result.har_entries} requests, "
+        f"overhead {summary['overhead_ms']}ms ({summary['overhead_pct']}% of the test)"
+    )
+
+    collector = get_active_collector()
+    if collector is not None:
+        collector.record("trace_capture_overhead", overhead, test=item.nodeid)
+
+    try:
+        import allure
+        for path, suffix in zip(paths, (TRACE_SUFFIX, HAR_SUFFIX)):
+            allure.attach.file(path, name=os.path.basename(path), extension=suffix.lstrip("."))
+        allure.attach(json.dumps(summary, indent=2),
+                      name="Trace capture overhead",
+                      attachment_type=allure.attachment_type.JSON)
+    except ImportError:
+        pass  # Allure not available, skip attachment
+
 
 def pytest_collection_modifyitems(config, items):
     """
@@ -227,34 +705,75 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "hierarchical: Tests for hierarchical reason selection")
     config.addinivalue_line("markers", "validation: Tests for form validation")
     config.addinivalue_line("markers", "performance: Tests for performance requirements") 
+    config.addinivalue_line("markers", "trace_capture: Capture a DevTools performance trace and HAR of the test")
     config.addinivalue_line("markers", "integration: Tests for external system integration")
     config.addinivalue_line("markers", "security: Tests for security and access control")
     config.addinivalue_line("markers", "rbac: Tests for role-based access control")
     config.addinivalue_line("markers", "smoke: Smoke tests for critical functionality")
     config.addinivalue_line("markers", "regression: Regression tests for existing functionality")
+    config.addinivalue_line("markers", "canned_api: Serve the named tests/fixtures/network responses instead of the backend when network control is enabled (latency_ms= adds delay)")
+    
+    # xdist workers reuse the configuration parsed by the controller
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput and 'mobinet_config' in workerinput:
+        prime_config(workerinput['mobinet_config'])
+    
+    # Duration-aware scheduling for pytest-xdist
+    scheduling_config = _load_config_file().get('scheduling', {})
+    config.pluginmanager.register(
+        DurationSchedulerPlugin(
+            config,
+            DurationStore(scheduling_config.get('durations_file') or DEFAULT_DURATIONS_FILE),
+            role_fixtures=ROLE_FIXTURES,
+            login_cost=scheduling_config.get('login_cost', 8),
+            default_duration=scheduling_config.get('default_duration', 10)
+        ),
+        "duration_scheduler"
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the parsed configuration to each xdist worker so it does not parse the YAML again."""
+    node.workerinput['mobinet_config'] = shared_config_state(CONFIG_PATH)
 
 
 # Performance monitoring fixture
 @pytest.fixture(scope="function")
-def performance_monitor():
-    """Monitor performance metrics during test execution."""
-    import psutil
-    import time
+def performance_monitor(request, config_data, logger):
+    """
+    Profile resource usage of the pytest worker, the driver service and the browser
+    process tree during the test. The time series and peak/mean summary are attached
+    to the report (Allure attachment and user property 'resource_profile').
+    """
+    from utils.resource_profiler import ResourceProfiler
     
-    start_time = time.time()
-    start_memory = psutil.virtual_memory().used
+    sampling_config = config_data.get('performance', {}).get('resource_sampling', {})
+    driver = request.getfixturevalue('driver') if 'driver' in request.fixturenames else None
     
-    yield
+    profiler = ResourceProfiler(driver, interval=sampling_config.get('interval', 0.5), logger=logger)
+    start_time = time.time()
+    profiler.start()
     
-    end_time = time.time()
-    end_memory = psutil.virtual_memory().used
+    yield profiler
     
-    execution_time = end_time - start_time
-    memory_usage = end_memory - start_memory
+    profile = profiler.stop()
+    execution_time = time.time() - start_time
     
     # Log performance metrics
-    logging.info(f"Test execution time: {execution_time:.2f} seconds")
-    logging.info(f"Memory usage change: {memory_usage / 1024 / 1024:.2f} MB")
+    logger.info(f"Test execution time: {execution_time:.2f} seconds")
+    logger.info(f"Resource usage - {profile.describe()}")
+    
+    profile_data = profile.to_dict()
+    request.node.user_properties.append(("resource_profile", profile_data['summary']))
+    
+    try:
+        import allure
+        allure.attach(json.dumps(profile_data, indent=2),
+                      name="Resource profile",
+                      attachment_type=allure.attachment_type.JSON)
+    except ImportError:
+        pass  # Allure not available, skip attachment
 
 
 # Test data cleanup fixture
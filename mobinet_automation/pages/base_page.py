@@ -3,7 +3,6 @@ Base page object model for Mobinet NextGen automation.
 Provides common functionality shared across all page objects.
 """
 
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import Select
@@ -13,10 +12,64 @@ from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     ElementNotInteractableException,
-    StaleElementReferenceException
+    StaleElementReferenceException,
+    WebDriverException
 )
-from utils.wait_helpers import WaitHelpers
+from utils.wait_helpers import WaitHelpers, FIND_ELEMENTS_JS, ACTIVITY_TRACKER_JS
 from utils.screenshot_helper import ScreenshotHelper
+from utils.browser_timing import BrowserTimingCollector
+
+
+# Resolves a dict of named (By, value) locators in the page and reports the state
+# of every match in a single round-trip.
+PROBE_ELEMENTS_SCRIPT = FIND_ELEMENTS_JS + """
+var locators = arguments[0], results = {};
+Object.keys(locators).forEach(function (name) {
+    var elements = findAll(locators[name][0], locators[name][1]);
+    var visible = elements.filter(isVisible);
+    var first = visible[0] || elements[0];
+    results[name] = {
+        present: elements.length > 0,
+        visible: visible.length > 0,
+        count: elements.length,
+        visible_count: visible.length,
+        text: first ? (first.innerText || first.textContent || '').trim() : '',
+        texts: visible.map(function (e) { return (e.innerText || e.textContent || '').trim(); }),
+        value: first && 'value' in first ? first.value : null,
+        enabled: first ? !first.disabled : false
+    };
+});
+return results;
+"""
+
+# Returns the options of a dropdown unless the DOM version still matches the caller's cache.
+# Selecting an option changes properties, not the DOM, so the selected index is part of the version.
+DROPDOWN_SNAPSHOT_SCRIPT = FIND_ELEMENTS_JS + ACTIVITY_TRACKER_JS + """
+var activity = window.__mobinetActivity;
+var dropdown = findAll(arguments[0], arguments[1])[0];
+var version = activity.documentId + ':' + activity.mutations + ':' + (dropdown ? dropdown.selectedIndex : -1);
+if (version === arguments[2]) return {version: version, unchanged: true};
+
+if (!dropdown || !isVisible(dropdown)) return {version: version, visible: false, options: []};
+
+return {
+    version: version,
+    visible: true,
+    options: Array.prototype.map.call(dropdown.getElementsByTagName('option'), function (option) {
+        return {
+            value: option.value,
+            text: (option.text || '').trim(),
+            disabled: option.disabled,
+            selected: option.selected
+        };
+    })
+};
+"""
+
+ABSENT_PROBE_STATE = {
+    'present': False, 'visible': False, 'count': 0, 'visible_count': 0,
+    'text': '', 'texts': [], 'value': None, 'enabled': False
+}
 
 
 class BasePage:
@@ -39,12 +92,16 @@ class BasePage:
         self.logger = logger
         self.wait_helpers = WaitHelpers(driver, logger=logger)
         self.screenshot_helper = ScreenshotHelper(driver, logger) if logger else None
+        self.browser_timing = BrowserTimingCollector(driver, logger)
         
         # Default timeout values
         self.default_timeout = config_data.get('browser', {}).get('explicit_wait', 20) if config_data else 20
         self.short_timeout = 5
         self.long_timeout = 30
         
+        # Dropdown option snapshots keyed by locator: (DOM version, options)
+        self._option_snapshots = {}
+        
     def find_element(self, locator, timeout=None, description=""):
         """
         Enhanced element finding with wait and error handling.
@@ -61,7 +118,7 @@ class BasePage:
         
         try:
             if self.logger:
-                self.logger.debug(f"Finding element: {locator} - {description}")
+                self.logger.debug("Finding element: %s - %s", locator, description)
                 
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(locator)
@@ -117,13 +174,16 @@ class BasePage:
             
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Brief pause for scroll completion
+            self.wait_helpers.wait_for_element_stable(element)
+            
+            # Count requests the click starts
+            self.wait_helpers.install_activity_tracker()
             
             # Try regular click first
             try:
                 element.click()
                 if self.logger:
-                    self.logger.debug(f"Clicked element: {locator} - {description}")
+                    self.logger.debug("Clicked element: %s - %s", locator, description)
             except ElementNotInteractableException:
                 # Fallback to JavaScript click
                 if self.logger:
@@ -163,7 +223,7 @@ class BasePage:
                     self.logger.warning(f"Text verification failed. Expected: '{text}', Got: '{entered_text}'")
                     
             if self.logger:
-                self.logger.debug(f"Entered text '{text}' in element: {locator} - {description}")
+                self.logger.debug("Entered text '%s' in element: %s - %s", text, locator, description)
                 
         self.wait_helpers.retry_on_stale_element(enter_text_action)
         
@@ -189,14 +249,17 @@ class BasePage:
             
             select = Select(dropdown_element)
             
+            # Count requests the change handler starts
+            self.wait_helpers.install_activity_tracker()
+            
             if option_value:
                 select.select_by_value(option_value)
                 if self.logger:
-                    self.logger.debug(f"Selected dropdown option by value: {option_value}")
+                    self.logger.debug("Selected dropdown option by value: %s", option_value)
             elif option_text:
                 select.select_by_visible_text(option_text)
                 if self.logger:
-                    self.logger.debug(f"Selected dropdown option by text: {option_text}")
+                    self.logger.debug("Selected dropdown option by text: %s", option_text)
             else:
                 raise ValueError("Either option_value or option_text must be provided")
                 
@@ -270,6 +333,104 @@ class BasePage:
         except:
             return False
             
+    def probe_elements(self, locators):
+        """
+        Read the state of several elements in one script call.
+        
+        Args:
+            locators (dict): Mapping of name to (By strategy, locator string)
+            
+        Returns:
+            dict: Mapping of name to state dict with keys present, visible, count,
+                  visible_count, text, texts (visible elements), value and enabled
+        """
+        try:
+            results = self.driver.execute_script(
+                PROBE_ELEMENTS_SCRIPT,
+                {name: list(locator) for name, locator in locators.items()}
+            )
+        except WebDriverException as e:
+            if self.logger:
+                self.logger.warning(f"Element probe failed: {str(e)}")
+            results = {}
+            
+        return {name: results.get(name, dict(ABSENT_PROBE_STATE)) for name in locators}
+        
+    def wait_for_probe(self, locators, state="visible", match="any", timeout=None):
+        """
+        Poll several elements until any or all of them reach a state.
+        
+        Args:
+            locators (dict): Mapping of name to (By strategy, locator string)
+            state (str): Probe key to test ('present', 'visible' or 'enabled')
+            match (str): 'any' or 'all'
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            dict: Probe results when the condition matched, None on timeout
+        """
+        timeout = timeout or self.short_timeout
+        combine = all if match == "all" else any
+        
+        def probe_matched(driver):
+            results = self.probe_elements(locators)
+            return results if combine(result[state] for result in results.values()) else False
+            
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(probe_matched)
+        except TimeoutException:
+            if self.logger:
+                self.logger.debug("Probe timed out waiting for %s %s: %s", match, state, list(locators))
+            return None
+            
+    def is_element_absent(self, locator, timeout=None, settle_ms=200):
+        """
+        Check that an element is not visible, without waiting out a full timeout.
+        Returns as soon as the element is visible (False) or the page has settled
+        for settle_ms with the element still hidden (True).
+        
+        Args:
+            locator (tuple): Element locator
+            timeout (int): Maximum time to wait for the page to settle (optional)
+            settle_ms (int): Quiet period required before absence is trusted
+            
+        Returns:
+            bool: True if element is absent or hidden
+        """
+        timeout = timeout or self.short_timeout
+        
+        def absence_decided(driver):
+            if self.probe_elements({'target': locator})['target']['visible']:
+                return 'visible'
+            state = self.wait_helpers.get_activity_state()
+            if (state and state['ready'] and state['pending'] == 0 and
+                    state['quietFor'] >= settle_ms):
+                return 'absent'
+            return False
+            
+        try:
+            outcome = WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(absence_decided)
+        except TimeoutException:
+            # Page never settled; trust the current state
+            outcome = 'visible' if self.probe_elements({'target': locator})['target']['visible'] else 'absent'
+            
+        if self.logger:
+            self.logger.debug("Absence check for %s: %s", locator, outcome)
+            
+        return outcome == 'absent'
+        
+    def assert_element_absent(self, locator, description="", timeout=None):
+        """
+        Assert that an element is not visible once the page has settled.
+        
+        Args:
+            locator (tuple): Element locator
+            description (str): Description for the assertion message
+            timeout (int): Maximum time to wait for the page to settle (optional)
+        """
+        assert self.is_element_absent(locator, timeout), \
+            f"Element should not be visible: {description or locator}"
+            
     def wait_for_page_title(self, expected_title, timeout=None):
         """
         Wait for page title to match expected value.
@@ -288,7 +449,7 @@ class BasePage:
                 EC.title_contains(expected_title)
             )
             if self.logger:
-                self.logger.debug(f"Page title contains: {expected_title}")
+                self.logger.debug("Page title contains: %s", expected_title)
             return True
         except TimeoutException:
             if self.logger:
@@ -309,7 +470,7 @@ class BasePage:
         try:
             element = self.wait_helpers.wait_for_element_visible(locator, timeout)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Brief pause for scroll completion
+            self.wait_helpers.wait_for_element_stable(element)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Failed to scroll to element: {str(e)}")
@@ -328,7 +489,7 @@ class BasePage:
             element = self.wait_helpers.wait_for_element_visible(locator, timeout)
             actions = ActionChains(self.driver)
             actions.move_to_element(element).perform()
-            time.sleep(0.5)  # Brief pause for hover effects
+            self.wait_helpers.wait_for_dom_quiescent(quiet_ms=100, timeout=self.short_timeout)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Failed to hover over element: {str(e)}")
@@ -359,7 +520,7 @@ class BasePage:
             frame = self.find_element(frame_locator)
             self.driver.switch_to.frame(frame)
             if self.logger:
-                self.logger.debug(f"Switched to frame: {frame_locator}")
+                self.logger.debug("Switched to frame: %s", frame_locator)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Failed to switch to frame: {str(e)}")
@@ -396,30 +557,81 @@ class BasePage:
         if loading_locator:
             self.wait_helpers.wait_for_element_to_disappear(loading_locator, timeout)
             
-    def get_all_dropdown_options(self, dropdown_locator, timeout=None):
+    def wait_for_ui_settled(self, quiet_ms=200, timeout=None):
         """
-        Get all options from a dropdown.
+        Wait until network requests have finished and the DOM has stopped changing.
         
         Args:
-            dropdown_locator (tuple): Dropdown element locator
+            quiet_ms (int): Required quiet period in milliseconds
             timeout (int): Custom timeout (optional)
             
         Returns:
-            list: List of option texts
+            bool: True if the UI settled
+        """
+        return self.wait_helpers.wait_for_ui_settled(quiet_ms, timeout or self.default_timeout)
+        
+    def get_dropdown_options_snapshot(self, dropdown_locator, timeout=None):
+        """
+        Get value, text, disabled and selected state for every dropdown option in one script call.
+        Snapshots are memoized per (locator, DOM version and selected index): while neither
+        changed the browser only reports its version and no option data is transferred.
+        
+        Args:
+            dropdown_locator (tuple): Dropdown element locator
+            timeout (int): Custom timeout for the dropdown to become visible (optional)
+            
+        Returns:
+            list: List of option dicts with keys value, text, disabled and selected
         """
         timeout = timeout or self.default_timeout
+        cached = self._option_snapshots.get(dropdown_locator)
+        known_version = cached[0] if cached else None
         
+        def snapshot_ready(driver):
+            result = driver.execute_script(DROPDOWN_SNAPSHOT_SCRIPT, *dropdown_locator, known_version)
+            if result.get('unchanged') or result.get('visible'):
+                return result
+            return False
+            
         try:
-            dropdown_element = self.wait_helpers.wait_for_element_visible(
-                dropdown_locator, timeout
-            )
+            result = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(snapshot_ready)
+        except (TimeoutException, WebDriverException) as e:
+            if self.logger:
+                self.logger.error(f"Failed to get dropdown options: {dropdown_locator} - {str(e)}")
+            return []
             
-            select = Select(dropdown_element)
-            options = select.options
+        if result.get('unchanged'):
+            if self.logger:
+                self.logger.debug("Dropdown options unchanged, using cached snapshot: %s", dropdown_locator)
+            return cached[1]
             
-            return [option.text.strip() for option in options if option.text.strip()]
+        self._option_snapshots[dropdown_locator] = (result['version'], result['options'])
+        return result['options']
+        
+    def get_selected_text(self, dropdown_locator, timeout=None):
+        """
+        Get the text of the selected dropdown option.
+        
+        Args:
+            dropdown_locator (tuple): Dropdown element locator
+            timeout (int): Custom timeout (optional)
             
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Failed to get dropdown options: {str(e)}")
-            return []
\ No newline at end of file
+        Returns:
+            str: Selected option text, or None if nothing is selected
+        """
+        options = self.get_dropdown_options_snapshot(dropdown_locator, timeout)
+        return next((option['text'] for option in options if option['selected'] and option['value']), None)
+        
+    def get_all_dropdown_options(self, dropdown_locator, timeout=None):
+        """
+        Get all options from a dropdown.
+        
+        Args:
+            dropdown_locator (tuple): Dropdown element locator
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            list: List of option texts
+        """
+        options = self.get_dropdown_options_snapshot(dropdown_locator, timeout)
+        return [option['text'] for option in options if option['text']]
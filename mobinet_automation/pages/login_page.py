@@ -3,8 +3,9 @@ Login page object for Mobinet NextGen authentication.
 Handles user authentication with different roles and error scenarios.
 """
 
-import time
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 
 
@@ -113,8 +114,8 @@ class LoginPage(BasePage):
                 timeout=30
             )
             
-        # Additional wait for page transition
-        time.sleep(2)
+        # Wait for page transition to complete
+        self.wait_for_ui_settled()
         
     def login(self, username, password):
         """
@@ -192,12 +193,24 @@ class LoginPage(BasePage):
         Returns:
             bool: True if login was successful
         """
-        # Check for dashboard or user menu
-        dashboard_visible = self.is_element_visible(self.DASHBOARD_CONTAINER, timeout=10)
-        user_menu_visible = self.is_element_visible(self.USER_MENU, timeout=5)
+        locators = {
+            'dashboard': self.DASHBOARD_CONTAINER,
+            'user_menu': self.USER_MENU,
+            'login_button': self.LOGIN_BUTTON
+        }
+        
+        # Wait for dashboard or user menu, then read all post-login state in one probe
+        self.wait_for_probe(
+            {'dashboard': self.DASHBOARD_CONTAINER, 'user_menu': self.USER_MENU},
+            timeout=10
+        )
+        results = self.probe_elements(locators)
+        
+        dashboard_visible = results['dashboard']['visible']
+        user_menu_visible = results['user_menu']['visible']
         
         # Check that we're not still on login page
-        login_button_hidden = not self.is_element_visible(self.LOGIN_BUTTON, timeout=3)
+        login_button_hidden = not results['login_button']['visible']
         
         success = (dashboard_visible or user_menu_visible) and login_button_hidden
         
@@ -207,6 +220,44 @@ class LoginPage(BasePage):
             
         return success
         
+    def is_session_active(self, timeout=5):
+        """
+        Quickly check whether the browser holds an authenticated session.
+        Returns as soon as either post-login elements or the login form are shown.
+        
+        Args:
+            timeout (int): Maximum time to wait for the page to settle
+            
+        Returns:
+            bool: True if post-login elements are visible
+        """
+        script = """
+            function shown(id) {
+                var el = document.getElementById(id);
+                return !!(el && el.offsetParent !== null);
+            }
+            if (shown(arguments[0]) || shown(arguments[1])) return 'authenticated';
+            if (shown(arguments[2])) return 'login';
+            return null;
+        """
+        
+        try:
+            state = WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script(
+                    script,
+                    self.DASHBOARD_CONTAINER[1],
+                    self.USER_MENU[1],
+                    self.LOGIN_BUTTON[1]
+                )
+            )
+        except TimeoutException:
+            state = None
+            
+        if self.logger:
+            self.logger.debug(f"Session state check: {state}")
+            
+        return state == 'authenticated'
+        
     def get_error_message(self):
         """
         Get error message displayed on login failure.
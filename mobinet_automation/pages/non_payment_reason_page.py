@@ -3,7 +3,6 @@ Non-Payment Reason Management page object for Mobinet NextGen.
 Handles hierarchical reason selection, form validation, appointments, and service disconnection.
 """
 
-import time
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
@@ -118,6 +117,14 @@ class NonPaymentReasonPage(BasePage):
         # Wait for any loading indicators to disappear
         self.wait_for_loading_to_complete()
         
+        # Level 1 codes are fetched when the form opens; the placeholder alone is not loaded
+        self.wait_helpers.install_activity_tracker()
+        self.wait_helpers.wait_for_dropdown_options_loaded(
+            self.LEVEL1_DROPDOWN,
+            minimum_options=2,
+            timeout=self.long_timeout
+        )
+        
         if self.logger:
             self.logger.info("Non-Payment Reason page loaded successfully")
             
@@ -135,20 +142,25 @@ class NonPaymentReasonPage(BasePage):
             self.logger.info(f"Selecting Level 1 reason: {reason_text}")
             
         try:
-            # Wait for Level 1 dropdown to be loaded with options
+            # Wait for Level 1 dropdown to be loaded with options (beyond the placeholder)
             self.wait_helpers.wait_for_dropdown_options_loaded(
                 self.LEVEL1_DROPDOWN,
-                minimum_options=1
+                minimum_options=2
             )
             
+            if self.get_selected_text(self.LEVEL1_DROPDOWN) == reason_text:
+                return True
+                
+            previous_level2 = self.wait_helpers.get_dropdown_option_values(self.LEVEL2_DROPDOWN)
             success = self.select_dropdown_option(
                 self.LEVEL1_DROPDOWN,
                 option_text=reason_text
             )
             
             if success:
-                # Wait for Level 2 dropdown to become enabled
-                time.sleep(1)  # Brief pause for UI update
+                # Every Level 1 reason has Level 2 reasons: wait for them to replace the old list
+                success = self.wait_helpers.wait_for_options_replaced(self.LEVEL2_DROPDOWN, previous_level2)
+                self.wait_for_ui_settled()
                 
                 if self.logger:
                     self.logger.info(f"Level 1 reason selected successfully: {reason_text}")
@@ -160,12 +172,14 @@ class NonPaymentReasonPage(BasePage):
                 self.logger.error(f"Failed to select Level 1 reason: {str(e)}")
             return False
             
-    def select_level2_reason(self, reason_text):
+    def select_level2_reason(self, reason_text, expect_level3=None):
         """
         Select Level 2 reason from dropdown.
         
         Args:
             reason_text (str): Text of the reason to select
+            expect_level3 (bool): Whether the reason has Level 3 reasons; when True the
+                Level 3 options are awaited, when unknown (None) the request is awaited
             
         Returns:
             bool: True if selection was successful
@@ -177,17 +191,23 @@ class NonPaymentReasonPage(BasePage):
             # Wait for Level 2 dropdown to be enabled and loaded
             self.wait_helpers.wait_for_dropdown_options_loaded(
                 self.LEVEL2_DROPDOWN,
-                minimum_options=1
+                minimum_options=2
             )
             
+            if self.get_selected_text(self.LEVEL2_DROPDOWN) == reason_text:
+                return True
+                
+            previous_level3 = self.wait_helpers.get_dropdown_option_values(self.LEVEL3_DROPDOWN)
             success = self.select_dropdown_option(
                 self.LEVEL2_DROPDOWN,
                 option_text=reason_text
             )
             
             if success:
-                # Wait for Level 3 dropdown to appear (if applicable)
-                time.sleep(1)  # Brief pause for UI update
+                # Wait for the Level 3 request and, if expected, the Level 3 options
+                if expect_level3:
+                    success = self.wait_helpers.wait_for_options_replaced(self.LEVEL3_DROPDOWN, previous_level3)
+                self.wait_for_ui_settled()
                 
                 if self.logger:
                     self.logger.info(f"Level 2 reason selected successfully: {reason_text}")
@@ -366,7 +386,7 @@ class NonPaymentReasonPage(BasePage):
             
             # If "Option 2" selected, verify second option box appears
             if success and "Option 2" in option_text:
-                time.sleep(1)  # Brief pause for UI update
+                self.wait_for_ui_settled()
                 option2_visible = self.is_element_visible(self.DISCONNECT_OPTION2_BOX, timeout=5)
                 
                 if self.logger:
@@ -406,7 +426,7 @@ class NonPaymentReasonPage(BasePage):
             
             # If specific date option selected, verify date picker appears
             if success and "Cancel disconnect schedule" not in option_text:
-                time.sleep(1)  # Brief pause for UI update
+                self.wait_for_ui_settled()
                 date_picker_visible = self.is_element_visible(self.DISCONNECT_DATE_PICKER, timeout=5)
                 
                 if self.logger:
@@ -474,7 +494,7 @@ class NonPaymentReasonPage(BasePage):
                 self.click_element(date_cell_locator, description=f"Disconnect date cell for {date_str}")
                 
                 # Wait for third option box to appear
-                time.sleep(1)
+                self.wait_for_ui_settled()
                 option3_visible = self.is_element_visible(self.DISCONNECT_OPTION3_BOX, timeout=5)
                 
                 if self.logger:
@@ -584,8 +604,8 @@ class NonPaymentReasonPage(BasePage):
         # Wait for AJAX completion
         self.wait_helpers.wait_for_ajax_complete()
         
-        # Additional brief pause for UI updates
-        time.sleep(2)
+        # Wait for the response to be rendered
+        self.wait_for_ui_settled()
         
     def is_form_submission_successful(self):
         """
@@ -594,14 +614,19 @@ class NonPaymentReasonPage(BasePage):
         Returns:
             bool: True if submission was successful
         """
-        # Look for success message
-        success_visible = self.is_element_visible(self.SUCCESS_MESSAGE, timeout=5)
+        locators = {
+            'success': self.SUCCESS_MESSAGE,
+            'history': self.REASON_HISTORY_SECTION,
+            'errors': self.ERROR_MESSAGES,
+            'validation': self.VALIDATION_ERROR
+        }
         
-        # Check if we're redirected to history page
-        history_visible = self.is_element_visible(self.REASON_HISTORY_SECTION, timeout=5)
+        # Wait for any outcome (success message, history or errors) in one poll loop
+        results = self.wait_for_probe(locators, timeout=self.short_timeout) or self.probe_elements(locators)
         
-        # Verify no validation errors present
-        no_errors = not self.has_validation_errors()
+        success_visible = results['success']['visible']
+        history_visible = results['history']['visible']
+        no_errors = not (results['errors']['visible'] or results['validation']['visible'])
         
         return success_visible or (history_visible and no_errors)
         
@@ -612,8 +637,11 @@ class NonPaymentReasonPage(BasePage):
         Returns:
             bool: True if validation errors are present
         """
-        return (self.is_element_visible(self.ERROR_MESSAGES, timeout=3) or 
-                self.is_element_visible(self.VALIDATION_ERROR, timeout=3))
+        results = self.wait_for_probe(
+            {'errors': self.ERROR_MESSAGES, 'validation': self.VALIDATION_ERROR},
+            timeout=3
+        )
+        return results is not None
         
     def get_validation_errors(self):
         """
@@ -622,24 +650,11 @@ class NonPaymentReasonPage(BasePage):
         Returns:
             list: List of error messages
         """
-        error_messages = []
+        locators = {'errors': self.ERROR_MESSAGES, 'validation': self.VALIDATION_ERROR}
         
-        try:
-            error_elements = self.find_elements(self.ERROR_MESSAGES, timeout=3)
-            for element in error_elements:
-                if element.is_displayed():
-                    error_messages.append(element.text.strip())
-                    
-            validation_elements = self.find_elements(self.VALIDATION_ERROR, timeout=3)
-            for element in validation_elements:
-                if element.is_displayed():
-                    error_messages.append(element.text.strip())
-                    
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Could not retrieve error messages: {str(e)}")
-                
-        return error_messages
+        results = self.wait_for_probe(locators, state="present", timeout=3) or self.probe_elements(locators)
+        
+        return results['errors']['texts'] + results['validation']['texts']
         
     def get_all_level1_options(self):
         """Get all available Level 1 reason options."""
@@ -663,6 +678,14 @@ class NonPaymentReasonPage(BasePage):
         """Check if disconnect options are visible (Revenue Collection role check)."""
         return self.is_element_visible(self.DISCONNECT_OPTION1_BOX, timeout=3)
         
+    def is_level3_dropdown_absent(self):
+        """Check that Level 3 dropdown is hidden once the page has settled."""
+        return self.is_element_absent(self.LEVEL3_DROPDOWN, timeout=3)
+        
+    def is_disconnect_options_absent(self):
+        """Check that disconnect options are hidden once the page has settled (non-Revenue roles)."""
+        return self.is_element_absent(self.DISCONNECT_OPTION1_BOX, timeout=3)
+        
     def reset_form(self):
         """Reset the form to initial state."""
         if self.logger:
@@ -674,8 +697,8 @@ class NonPaymentReasonPage(BasePage):
                 description="Reset form button"
             )
             
-            # Brief pause for form reset
-            time.sleep(1)
+            # Wait for form reset to render
+            self.wait_for_ui_settled()
             
             if self.logger:
                 self.logger.info("Form reset successfully")
@@ -8,20 +8,22 @@ import argparse
 import os
 import sys
 import subprocess
-import yaml
+from datetime import datetime
 from pathlib import Path
 
+# Make framework packages (utils, pages) importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 
 def load_config():
-    """Load test configuration from config.yaml."""
-    config_path = Path(__file__).parent.parent / "config" / "config.yaml"
+    """Load test configuration from config.yaml (shared cached loader, environment overlays applied)."""
+    from utils.config_loader import load_config as load_framework_config, DEFAULT_CONFIG_PATH
     
-    if not config_path.exists():
-        print(f"Configuration file not found: {config_path}")
+    if not os.path.exists(DEFAULT_CONFIG_PATH):
+        print(f"Configuration file not found: {DEFAULT_CONFIG_PATH}")
         sys.exit(1)
         
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return load_framework_config(DEFAULT_CONFIG_PATH)
 
 
 def create_directories():
@@ -63,14 +65,22 @@ def build_pytest_command(args, config):
     # Parallel execution
     if args.parallel:
         cmd.extend(["-n", str(args.parallel)])
+        if args.duration_schedule:
+            cmd.extend(["--dist", "loadgroup", "--duration-schedule"])
         
-    # Browser configuration
-    if args.browser:
+    # Browser configuration (read back as overlays by utils.config_loader)
+    if args.browser and args.browser_explicit:
         os.environ["SELENIUM_BROWSER"] = args.browser
         
     if args.headless:
         os.environ["HEADLESS"] = "true"
         
+    if args.fake_backend:
+        cmd.append("--fake-backend")
+        
+    if args.trace_capture:
+        cmd.append("--trace-capture")
+        
     # Reporting
     if args.html_report:
         cmd.extend(["--html", f"reports/html/{args.html_report}"])
@@ -130,8 +140,8 @@ def run_regression_tests(config):
     return subprocess.run(cmd)
 
 
-def run_performance_tests(config):
-    """Run performance test suite."""
+def run_performance_tests(config, trace_capture=False):
+    """Run performance test suite (optionally with DevTools trace and HAR capture)."""
     print("⚡ Running Performance Tests...")
     
     cmd = [
@@ -142,6 +152,8 @@ def run_performance_tests(config):
         "--durations", "10",
         "-v"
     ]
+    if trace_capture:
+        cmd.append("--trace-capture")
     
     return subprocess.run(cmd)
 
@@ -161,6 +173,55 @@ def run_integration_tests(config):
     return subprocess.run(cmd)
 
 
+def warm_driver_cache(args):
+    """Resolve driver binaries and record them in the local lockfile (for CI images)."""
+    from utils.driver_resolver import DriverResolver
+
+    print("🔧 Pre-warming WebDriver binary cache...")
+
+    browsers = [args.browser] if args.browser_explicit else ["chrome", "firefox"]
+    resolved = DriverResolver().warm(browsers)
+
+    for browser, driver_path in resolved.items():
+        status = driver_path or "not available"
+        print(f"   {browser}: {status}")
+
+    return 0 if any(resolved.values()) else 1
+
+
+def compare_with_baseline(args, config):
+    """Compare this run's performance samples with previous runs and print regressions."""
+    from utils.perf_baseline import BaselineStore, DEFAULT_BASELINE_DB
+
+    baseline_config = config.get('performance', {}).get('baseline', {})
+    store = BaselineStore(baseline_config.get('path', DEFAULT_BASELINE_DB))
+
+    comparisons = store.compare(
+        os.environ.get("MOBINET_RUN_ID"),
+        last_runs=args.baseline_runs or baseline_config.get('compare_runs', 5),
+        alpha=baseline_config.get('alpha', 0.01),
+        min_change=baseline_config.get('min_change', 0.1)
+    )
+
+    print("📈 Performance baseline comparison:")
+    if not comparisons:
+        print("   No performance samples recorded for this run")
+        return []
+
+    for comparison in comparisons:
+        if comparison['p_value'] is None:
+            print(f"   {comparison['metric']}: median {comparison['median']:.3f}s "
+                  f"(baseline has {comparison['baseline_samples']} samples, not compared)")
+            continue
+
+        status = "REGRESSED" if comparison['regressed'] else "ok"
+        change = f"{comparison['change'] * 100:+.1f}%" if comparison['change'] is not None else "n/a"
+        print(f"   {comparison['metric']}: median {comparison['median']:.3f}s vs {comparison['baseline_median']:.3f}s "
+              f"({change}, p={comparison['p_value']:.4f}) {status}")
+
+    return [comparison for comparison in comparisons if comparison['regressed']]
+
+
 def generate_allure_report():
     """Generate and serve Allure report."""
     print("📊 Generating Allure Report...")
@@ -198,9 +259,14 @@ Examples:
   %(prog)s --method test_mandatory_fields    # Run specific test method
   
   %(prog)s --browser firefox --headless      # Run with Firefox headless
+  %(prog)s --fake-backend --headless         # Run hermetically against the local fake backend
   %(prog)s --parallel 4                      # Run with 4 parallel workers
+  %(prog)s --parallel 4 --duration-schedule  # Balance workers by recorded test durations
   
   %(prog)s --html report.html --allure       # Generate HTML and Allure reports
+  %(prog)s --performance --compare-baseline  # Flag significant regressions against previous runs
+  
+  %(prog)s --warm-drivers                    # Pre-resolve driver binaries (CI images)
         """
     )
     
@@ -232,11 +298,15 @@ Examples:
                               default='chrome', help='Browser to use for testing')
     browser_group.add_argument('--headless', action='store_true',
                               help='Run browser in headless mode')
+    browser_group.add_argument('--fake-backend', action='store_true',
+                              help='Run against the bundled local fake backend (no network)')
     
     # Execution options
     execution_group = parser.add_argument_group('Execution Options')
     execution_group.add_argument('--parallel', type=int,
                                 help='Number of parallel workers')
+    execution_group.add_argument('--duration-schedule', action='store_true',
+                                help='Balance parallel workers using recorded test durations')
     execution_group.add_argument('--maxfail', type=int, default=10,
                                 help='Stop after N failures')
     execution_group.add_argument('--fail-fast', action='store_true',
@@ -263,8 +333,22 @@ Examples:
                                 help='Generate JSON report with filename')
     reporting_group.add_argument('--serve-allure', action='store_true',
                                 help='Generate and serve Allure report')
+    reporting_group.add_argument('--trace-capture', action='store_true',
+                                help='Capture DevTools performance traces and HARs (Chrome; kept for failed tests)')
+    reporting_group.add_argument('--compare-baseline', action='store_true',
+                                help='Compare performance samples with previous runs (Mann-Whitney)')
+    reporting_group.add_argument('--run-id',
+                                help='Store performance samples under an existing run ID (default: a new run)')
+    reporting_group.add_argument('--baseline-runs', type=int,
+                                help='Number of previous runs forming the baseline (default: config)')
+    
+    # Environment setup
+    setup_group = parser.add_argument_group('Environment Setup')
+    setup_group.add_argument('--warm-drivers', action='store_true',
+                            help='Resolve WebDriver binaries into the local lockfile and exit')
     
     args = parser.parse_args()
+    args.browser_explicit = any(arg == '--browser' or arg.startswith('--browser=') for arg in sys.argv[1:])
     
     # Load configuration
     config = load_config()
@@ -273,17 +357,24 @@ Examples:
     create_directories()
     
     # Handle special cases
+    if args.warm_drivers:
+        sys.exit(warm_driver_cache(args))
+        
     if args.serve_allure:
         generate_allure_report()
         return
     
+    # Tag this run so its performance samples can be compared with previous runs
+    # (a fresh ID per invocation; --run-id continues an earlier run explicitly)
+    os.environ["MOBINET_RUN_ID"] = args.run_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    
     # Execute test suites
     if args.smoke:
         result = run_smoke_tests(config)
     elif args.regression:
         result = run_regression_tests(config)
     elif args.performance:
-        result = run_performance_tests(config) 
+        result = run_performance_tests(config, trace_capture=args.trace_capture)
     elif args.integration:
         result = run_integration_tests(config)
     else:
@@ -297,6 +388,12 @@ Examples:
         print("📊 Allure results generated in: reports/allure-results")
         print("To view report, run: allure serve reports/allure-results")
     
+    if args.compare_baseline:
+        regressions = compare_with_baseline(args, config)
+        if regressions and result.returncode == 0:
+            print(f"❌ {len(regressions)} metric(s) regressed significantly against the baseline")
+            sys.exit(1)
+    
     # Exit with test result code
     sys.exit(result.returncode)
 
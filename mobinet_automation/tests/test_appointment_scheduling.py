@@ -5,10 +5,9 @@ Covers TC-003: Payment Appointment Scheduling test scenarios.
 
 import pytest
 import allure
-import time
 from datetime import datetime, timedelta
+from selenium.webdriver.common.by import By
 from pages.non_payment_reason_page import NonPaymentReasonPage
-from utils.test_data_manager import TestDataManager
 from utils.logger import log_test_start, log_test_end
 
 
@@ -21,9 +20,9 @@ class TestAppointmentScheduling:
     """
     
     @pytest.fixture(autouse=True)
-    def setup_test_data(self, config_data, logger):
+    def setup_test_data(self, config_data, logger, test_data_manager):
         """Setup test data for appointment scheduling tests."""
-        self.test_data_manager = TestDataManager(config_data, logger)
+        self.test_data_manager = test_data_manager
         
     @allure.story("Date Selection Functionality")
     @allure.title("TC-003.1: Date Selection Functionality")
@@ -68,7 +67,7 @@ class TestAppointmentScheduling:
             )
             
             # Wait for calendar to appear
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             # Test current date selection
             test_logger.step("Test current date selection")
@@ -95,7 +94,7 @@ class TestAppointmentScheduling:
                 non_payment_page.APPOINTMENT_DATE_PICKER,
                 description="Click appointment date picker for past date test"
             )
-            time.sleep(1)
+            non_payment_page.wait_for_ui_settled()
             
             # Attempt to select past date
             success = non_payment_page.select_appointment_date(yesterday)
@@ -109,7 +108,7 @@ class TestAppointmentScheduling:
             valid_date = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
             non_payment_page.select_appointment_date(valid_date)
             
-            time.sleep(2)  # Wait for time picker to appear
+            non_payment_page.wait_for_ui_settled()  # Wait for time picker to appear
             
             time_picker_visible = non_payment_page.is_element_visible(
                 non_payment_page.APPOINTMENT_TIME_PICKER,
@@ -187,7 +186,7 @@ class TestAppointmentScheduling:
                     non_payment_page.APPOINTMENT_DATE_PICKER,
                     description=f"Open date picker for {scenario['name']}"
                 )
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
                 # Attempt to select date
                 success = non_payment_page.select_appointment_date(date_str)
@@ -202,7 +201,7 @@ class TestAppointmentScheduling:
                     assert not success, f"Date should be restricted: {scenario['name']}"
                     
                 # Brief pause between scenarios
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
             # Test edge case: Far future date
             test_logger.step("Test far future date (6 months ahead)")
@@ -213,7 +212,7 @@ class TestAppointmentScheduling:
                 non_payment_page.APPOINTMENT_DATE_PICKER,
                 description="Open date picker for far future date"
             )
-            time.sleep(1)
+            non_payment_page.wait_for_ui_settled()
             
             success = non_payment_page.select_appointment_date(far_future_str)
             test_logger.verification("Verify far future date handling")
@@ -260,7 +259,7 @@ class TestAppointmentScheduling:
             assert success, f"Failed to select appointment date: {appointment_date}"
             
             # Wait for time picker to appear
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             test_logger.verification("Verify time picker appears after date selection")
             time_picker_visible = non_payment_page.is_element_visible(
@@ -373,7 +372,7 @@ class TestAppointmentScheduling:
             success = non_payment_page.select_appointment_date(test_date)
             assert success, f"Failed to select test date: {test_date}"
             
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             test_time = "10:00"
             success = non_payment_page.select_appointment_time(test_time)
@@ -387,7 +386,7 @@ class TestAppointmentScheduling:
             if len(level1_options) > 1:
                 # Select different Level 1 reason
                 non_payment_page.select_level1_reason(level1_options[-1])
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 # Verify appointment date/time persistence
                 # Note: This would require specific element value checking
@@ -403,7 +402,7 @@ class TestAppointmentScheduling:
                 
                 # Try to select today with morning time
                 non_payment_page.select_appointment_date(today)
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 success = non_payment_page.select_appointment_time(morning_time)
                 test_logger.verification("Verify past time on current date handling")
@@ -428,7 +427,7 @@ class TestAppointmentScheduling:
             valid_time = "14:00"  # Mid-afternoon
             
             non_payment_page.select_appointment_date(valid_date)
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             non_payment_page.select_appointment_time(valid_time)
             
             # Add notes
@@ -465,19 +464,19 @@ class TestAppointmentScheduling:
         level1_options = non_payment_page.get_all_level1_options()
         if level1_options:
             non_payment_page.select_level1_reason(level1_options[0])
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             level2_options = non_payment_page.get_all_level2_options()
             if level2_options:
                 non_payment_page.select_level2_reason(level2_options[0])
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
     @allure.story("Date Picker Performance")
     @allure.title("Date Picker Loading Performance")
     @allure.description("Test date picker component loading performance")
     @pytest.mark.appointment
     @pytest.mark.performance
-    def test_date_picker_performance(self, revenue_user_session, config_data, logger, performance_monitor):
+    def test_date_picker_performance(self, revenue_user_session, config_data, logger, performance_monitor, metrics_collector):
         """
         Test date picker performance characteristics.
         
@@ -502,42 +501,41 @@ class TestAppointmentScheduling:
             
             loading_times = []
             
+            timing = non_payment_page.browser_timing
+            
             for i in range(5):  # Test 5 iterations
-                start_time = time.time()
-                
-                # Click to open date picker
-                non_payment_page.click_element(
-                    non_payment_page.APPOINTMENT_DATE_PICKER,
-                    description=f"Open date picker - iteration {i+1}"
-                )
-                
-                # Wait for date picker to fully load
-                date_picker_loaded = non_payment_page.wait_helpers.wait_for_date_picker_loaded(
-                    (By.CLASS_NAME, "date-picker-calendar"),
-                    timeout=10
-                )
-                
-                load_time = time.time() - start_time
+                with timing.measure("date_picker_open") as open_timing:
+                    # Click to open date picker
+                    non_payment_page.click_element(
+                        non_payment_page.APPOINTMENT_DATE_PICKER,
+                        description=f"Open date picker - iteration {i+1}"
+                    )
+                    
+                    # Wait for date picker to fully load
+                    date_picker_loaded = non_payment_page.wait_helpers.wait_for_date_picker_loaded(
+                        (By.CLASS_NAME, "date-picker-calendar"),
+                        timeout=10
+                    )
+                    
+                # Browser-side render latency; Selenium-observed time is logged alongside
+                assert open_timing.captured, "Browser timings of date_picker_open were not captured"
+                load_time = open_timing.browser_ms / 1000
                 loading_times.append(load_time)
                 
-                test_logger.performance(f"Date picker loading iteration {i+1}", load_time)
+                test_logger.data(open_timing.describe())
+                test_logger.performance(f"Date picker loading iteration {i+1}", load_time, metric="date_picker_open")
                 
                 # Close date picker for next iteration
                 # This may require clicking outside or pressing Escape
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
             # Calculate performance metrics
             avg_load_time = sum(loading_times) / len(loading_times)
             max_load_time = max(loading_times)
             
-            # Verify performance requirements
-            performance_threshold = 3.0  # 3 seconds threshold
-            
-            test_logger.verification(f"Verify average date picker load time < {performance_threshold}s")
-            assert avg_load_time < performance_threshold, f"Average load time {avg_load_time:.2f}s exceeds threshold"
-            
-            test_logger.verification(f"Verify maximum date picker load time < {performance_threshold * 1.5}s")
-            assert max_load_time < performance_threshold * 1.5, f"Maximum load time {max_load_time:.2f}s exceeds threshold"
+            # Verify performance requirements (performance.thresholds: date_picker_open)
+            test_logger.verification("Verify date picker load times meet configured thresholds")
+            metrics_collector.assert_thresholds("date_picker_open")
             
             test_logger.result(f"Date picker performance test completed - Avg: {avg_load_time:.2f}s, Max: {max_load_time:.2f}s", True)
             
@@ -5,9 +5,7 @@ Covers TC-002: Form Validation test scenarios.
 
 import pytest
 import allure
-import time
 from pages.non_payment_reason_page import NonPaymentReasonPage
-from utils.test_data_manager import TestDataManager
 from utils.logger import log_test_start, log_test_end
 
 
@@ -20,9 +18,9 @@ class TestFormValidation:
     """
     
     @pytest.fixture(autouse=True)
-    def setup_test_data(self, config_data, logger):
+    def setup_test_data(self, config_data, logger, test_data_manager):
         """Setup test data for form validation tests."""
-        self.test_data_manager = TestDataManager(config_data, logger)
+        self.test_data_manager = test_data_manager
         self.invalid_data_scenarios = self.test_data_manager.generate_invalid_data_scenarios()
         
     @allure.story("Mandatory Field Validation")
@@ -71,7 +69,7 @@ class TestFormValidation:
             # Test 2: Submit with only Level 1 selected
             test_logger.step("Test submission with only Level 1 reason selected")
             non_payment_page.reset_form()
-            time.sleep(1)
+            non_payment_page.wait_for_ui_settled()
             
             # Get Level 1 options and select first one
             level1_options = non_payment_page.get_all_level1_options()
@@ -90,11 +88,11 @@ class TestFormValidation:
             # Test 3: Submit with Level 1 and Level 2 but missing notes
             test_logger.step("Test submission with reasons but missing notes")
             non_payment_page.reset_form()
-            time.sleep(1)
+            non_payment_page.wait_for_ui_settled()
             
             if level1_options:
                 non_payment_page.select_level1_reason(level1_options[0])
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 level2_options = non_payment_page.get_all_level2_options()
                 if level2_options:
@@ -112,7 +110,7 @@ class TestFormValidation:
             # Test 4: Test Level 3 validation (if applicable)
             test_logger.step("Test Level 3 validation when applicable")
             non_payment_page.reset_form()
-            time.sleep(1)
+            non_payment_page.wait_for_ui_settled()
             
             # Find a hierarchy that requires Level 3
             hierarchies = self.test_data_manager.generate_reason_hierarchy_data()
@@ -122,12 +120,12 @@ class TestFormValidation:
                 # Select Level 1 and Level 2 to trigger Level 3
                 if level3_hierarchy.level1 in level1_options:
                     non_payment_page.select_level1_reason(level3_hierarchy.level1)
-                    time.sleep(2)
+                    non_payment_page.wait_for_ui_settled()
                     
                     level2_options = non_payment_page.get_all_level2_options()
                     if level3_hierarchy.level2 in level2_options:
-                        non_payment_page.select_level2_reason(level3_hierarchy.level2)
-                        time.sleep(2)
+                        non_payment_page.select_level2_reason(level3_hierarchy.level2, expect_level3=True)
+                        non_payment_page.wait_for_ui_settled()
                         
                         # Check if Level 3 becomes visible and is required
                         if non_payment_page.is_level3_dropdown_visible():
@@ -180,12 +178,12 @@ class TestFormValidation:
                 
             # Select valid Level 1 and Level 2 reasons
             non_payment_page.select_level1_reason(level1_options[0])
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             level2_options = non_payment_page.get_all_level2_options()
             if level2_options:
                 non_payment_page.select_level2_reason(level2_options[0])
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
             # Test 1: Empty notes field
             test_logger.step("Test with empty notes field")
@@ -263,12 +261,12 @@ class TestFormValidation:
             level1_options = non_payment_page.get_all_level1_options()
             if level1_options:
                 non_payment_page.select_level1_reason(level1_options[0])
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 level2_options = non_payment_page.get_all_level2_options()
                 if level2_options:
                     non_payment_page.select_level2_reason(level2_options[0])
-                    time.sleep(1)
+                    non_payment_page.wait_for_ui_settled()
                     
             special_cases = [
                 ("special_characters_notes", "Special characters in notes"),
@@ -314,15 +312,15 @@ class TestFormValidation:
                     
                 # Reset for next test
                 non_payment_page.reset_form()
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
                 # Re-select reasons for next iteration
                 if level1_options and len(special_cases) > 1:
                     non_payment_page.select_level1_reason(level1_options[0])
-                    time.sleep(1)
+                    non_payment_page.wait_for_ui_settled()
                     if level2_options:
                         non_payment_page.select_level2_reason(level2_options[0])
-                        time.sleep(1)
+                        non_payment_page.wait_for_ui_settled()
                         
             test_logger.result("Special characters validation test completed successfully", True)
             
@@ -378,7 +376,7 @@ class TestFormValidation:
                 
                 # Reset form
                 non_payment_page.reset_form()
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
                 # Setup scenario
                 if scenario["setup"]:
@@ -423,19 +421,19 @@ class TestFormValidation:
         level1_options = non_payment_page.get_all_level1_options()
         if level1_options:
             non_payment_page.select_level1_reason(level1_options[0])
-            time.sleep(1)
+            non_payment_page.wait_for_ui_settled()
             
     def _setup_reasons_no_notes(self, non_payment_page):
         """Helper method to setup reason selections without notes."""
         level1_options = non_payment_page.get_all_level1_options()
         if level1_options:
             non_payment_page.select_level1_reason(level1_options[0])
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             level2_options = non_payment_page.get_all_level2_options()
             if level2_options:
                 non_payment_page.select_level2_reason(level2_options[0])
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
     @allure.story("Form State Management")
     @allure.title("Form State and Reset Validation")
@@ -461,7 +459,7 @@ class TestFormValidation:
             level1_options = non_payment_page.get_all_level1_options()
             if level1_options:
                 non_payment_page.select_level1_reason(level1_options[0])
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
                 test_notes = "Test notes for state management"
                 non_payment_page.enter_notes(test_notes)
@@ -478,7 +476,7 @@ class TestFormValidation:
             # Test form reset
             test_logger.step("Test form reset functionality")
             non_payment_page.reset_form()
-            time.sleep(1)
+            non_payment_page.wait_for_ui_settled()
             
             # Verify form is reset
             test_logger.verification("Verify form state after reset")
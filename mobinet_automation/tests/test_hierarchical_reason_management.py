@@ -5,9 +5,8 @@ Covers TC-001: Hierarchical Reason Management test scenarios.
 
 import pytest
 import allure
-import time
 from pages.non_payment_reason_page import NonPaymentReasonPage
-from utils.test_data_manager import TestDataManager
+from utils.browser_timing import CODES_BY_LEVEL_REQUESTS
 from utils.logger import log_test_start, log_test_end
 
 
@@ -20,9 +19,9 @@ class TestHierarchicalReasonManagement:
     """
     
     @pytest.fixture(autouse=True)
-    def setup_test_data(self, config_data, logger):
+    def setup_test_data(self, config_data, logger, test_data_manager):
         """Setup test data for hierarchical reason tests."""
-        self.test_data_manager = TestDataManager(config_data, logger)
+        self.test_data_manager = test_data_manager
         self.reason_hierarchies = self.test_data_manager.generate_reason_hierarchy_data()
         
     @allure.story("Level 1 Reason Selection")
@@ -125,7 +124,7 @@ class TestHierarchicalReasonManagement:
                 assert success, f"Failed to select Level 1 reason: {level1_reason}"
                 
                 # Wait for Level 2 to load
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 # Get Level 2 options
                 level2_options = non_payment_page.get_all_level2_options()
@@ -142,7 +141,7 @@ class TestHierarchicalReasonManagement:
                     assert success, f"Failed to select Level 2 reason: {level2_reason}"
                     
                     # Verify Level 3 becomes available (if applicable)
-                    time.sleep(2)
+                    non_payment_page.wait_for_ui_settled()
                     level3_visible = non_payment_page.is_level3_dropdown_visible()
                     test_logger.verification(f"Level 3 dropdown visibility: {level3_visible}")
                     
@@ -154,7 +153,7 @@ class TestHierarchicalReasonManagement:
                 different_level1 = level1_options[1]
                 non_payment_page.select_level1_reason(different_level1)
                 
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 # Verify Level 2 options changed
                 new_level2_options = non_payment_page.get_all_level2_options()
@@ -198,7 +197,7 @@ class TestHierarchicalReasonManagement:
             non_payment_page.navigate_to_non_payment_reason_page()
             
             test_logger.verification("Verify Level 3 dropdown is hidden initially")
-            level3_initially_hidden = not non_payment_page.is_level3_dropdown_visible()
+            level3_initially_hidden = non_payment_page.is_level3_dropdown_absent()
             assert level3_initially_hidden, "Level 3 dropdown should be hidden initially"
             
             # Get test data with 3-level hierarchy
@@ -216,8 +215,8 @@ class TestHierarchicalReasonManagement:
             assert success, f"Failed to select Level 1 reason: {test_hierarchy.level1}"
             
             test_logger.verification("Verify Level 3 remains hidden after Level 1 selection")
-            time.sleep(2)
-            level3_still_hidden = not non_payment_page.is_level3_dropdown_visible()
+            non_payment_page.wait_for_ui_settled()
+            level3_still_hidden = non_payment_page.is_level3_dropdown_absent()
             # Note: This may depend on specific business rules
             
             test_logger.step(f"Select Level 2 reason: {test_hierarchy.level2}")
@@ -225,7 +224,7 @@ class TestHierarchicalReasonManagement:
             assert success, f"Failed to select Level 2 reason: {test_hierarchy.level2}"
             
             test_logger.verification("Verify Level 3 dropdown appears after Level 2 selection")
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             level3_visible = non_payment_page.is_level3_dropdown_visible()
             
             if level3_visible:
@@ -262,12 +261,13 @@ class TestHierarchicalReasonManagement:
     @allure.description("Test complete hierarchical reason selection flow with all levels")
     @pytest.mark.hierarchical
     @pytest.mark.integration
-    def test_complete_hierarchical_flow(self, revenue_user_session, config_data, logger):
+    def test_complete_hierarchical_flow(self, revenue_user_session, config_data, logger, reason_index):
         """
         Test complete hierarchical reason selection flow.
         
-        Covers multiple reason hierarchies and validates the complete flow
-        from Level 1 through Level 3 selection.
+        Walks every complete path of the reason hierarchy index and validates the
+        flow from Level 1 through Level 3 selection. Paths are grouped by Level 1
+        and Level 2, so only the levels that change between paths are reselected.
         """
         test_logger = log_test_start("Complete Hierarchical Reason Flow")
         
@@ -277,36 +277,40 @@ class TestHierarchicalReasonManagement:
             test_logger.step("Navigate to Non-Payment Reason screen")
             non_payment_page.navigate_to_non_payment_reason_page()
             
-            # Test multiple hierarchical flows
-            test_hierarchies = self.reason_hierarchies[:3]  # Test first 3 for efficiency
+            paths = reason_index.enumerate_paths()
+            current_level1 = current_level2 = None
             
-            for i, hierarchy in enumerate(test_hierarchies):
-                test_logger.step(f"Testing hierarchy {i+1}: {hierarchy.level1}")
+            for i, path in enumerate(paths):
+                level1, level2, level3 = (path + (None, None))[:3]
+                test_logger.step(f"Testing path {i+1}/{len(paths)}: {' > '.join(path)}")
                 
-                # Reset form before each test
-                if i > 0:
-                    non_payment_page.reset_form()
-                    time.sleep(1)
+                # Level 1 selection (resets the lower levels)
+                if level1 != current_level1:
+                    success = non_payment_page.select_level1_reason(level1)
+                    assert success, f"Failed to select Level 1: {level1}"
+                    current_level1, current_level2 = level1, None
                     
-                # Level 1 selection
-                success = non_payment_page.select_level1_reason(hierarchy.level1)
-                assert success, f"Failed to select Level 1: {hierarchy.level1}"
-                
-                time.sleep(2)  # Wait for Level 2 to load
-                
-                # Level 2 selection
-                success = non_payment_page.select_level2_reason(hierarchy.level2)
-                assert success, f"Failed to select Level 2: {hierarchy.level2}"
-                
-                # Level 3 selection (if available)
-                if hierarchy.level3:
-                    time.sleep(2)  # Wait for Level 3 to load
+                    non_payment_page.wait_for_ui_settled()  # Wait for Level 2 to load
                     
-                    if non_payment_page.is_level3_dropdown_visible():
-                        success = non_payment_page.select_level3_reason(hierarchy.level3)
-                        # Note: May not assert on success as Level 3 options depend on actual data
-                        
-                test_logger.verification(f"Completed hierarchy selection for: {hierarchy.level1}")
+                if not level2:
+                    test_logger.verification(f"Completed hierarchy selection for: {level1}")
+                    continue
+                    
+                # Level 2 selection (waits for the Level 3 codes when the index has any)
+                requires_level3 = reason_index.requires_level3(level1, level2)
+                if level2 != current_level2:
+                    success = non_payment_page.select_level2_reason(level2, expect_level3=requires_level3)
+                    assert success, f"Failed to select Level 2: {level2}"
+                    current_level2 = level2
+                    
+                # Level 3 selection (required wherever the index has Level 3 reasons)
+                if requires_level3:
+                    assert non_payment_page.is_level3_dropdown_visible(), \
+                        f"Level 3 dropdown not visible for: {level1} > {level2}"
+                    success = non_payment_page.select_level3_reason(level3)
+                    assert success, f"Failed to select Level 3: {level3}"
+                    
+                test_logger.verification(f"Completed hierarchy selection for: {' > '.join(path)}")
                 
             test_logger.result("Complete hierarchical flow test completed successfully", True)
             
@@ -322,7 +326,7 @@ class TestHierarchicalReasonManagement:
     @allure.description("Verify hierarchical reason selection meets performance requirements")
     @pytest.mark.hierarchical
     @pytest.mark.performance
-    def test_hierarchical_reason_performance(self, revenue_user_session, config_data, logger, performance_monitor):
+    def test_hierarchical_reason_performance(self, revenue_user_session, config_data, logger, performance_monitor, metrics_collector):
         """
         Test hierarchical reason selection performance.
         
@@ -335,52 +339,45 @@ class TestHierarchicalReasonManagement:
         try:
             non_payment_page = NonPaymentReasonPage(revenue_user_session, config_data, logger)
             
-            test_logger.step("Navigate to Non-Payment Reason screen")
-            non_payment_page.navigate_to_non_payment_reason_page()
-            
             performance_data = []
             num_iterations = 10
+            timing = non_payment_page.browser_timing
             
             for i in range(num_iterations):
                 test_logger.step(f"Performance test iteration {i+1}/{num_iterations}")
                 
-                # Reset form
-                if i > 0:
-                    non_payment_page.reset_form()
+                # Measure Level 1 loading (opening the screen fetches the Level 1 codes)
+                with timing.measure("level1_load", requests=CODES_BY_LEVEL_REQUESTS) as level1_timing:
+                    non_payment_page.navigate_to_non_payment_reason_page()
+                    non_payment_page.wait_for_ui_settled()
+                    level1_options = non_payment_page.get_all_level1_options()
                     
-                # Measure Level 1 loading time
-                start_time = time.time()
-                level1_options = non_payment_page.get_all_level1_options()
-                level1_load_time = time.time() - start_time
+                level2_timing = level3_timing = None
                 
-                # Select Level 1
+                # Select Level 1 and measure Level 2 loading it triggers
                 if level1_options:
-                    non_payment_page.select_level1_reason(level1_options[0])
-                    
-                    # Measure Level 2 loading time
-                    start_time = time.time()
-                    level2_options = non_payment_page.get_all_level2_options()
-                    level2_load_time = time.time() - start_time
-                    
-                    # Select Level 2 if available
-                    if level2_options:
-                        non_payment_page.select_level2_reason(level2_options[0])
+                    with timing.measure("level2_load", requests=CODES_BY_LEVEL_REQUESTS) as level2_timing:
+                        non_payment_page.select_level1_reason(level1_options[0])
+                        level2_options = non_payment_page.get_all_level2_options()
                         
-                        # Measure Level 3 loading time (if applicable)
-                        level3_load_time = 0
-                        if non_payment_page.is_level3_dropdown_visible():
-                            start_time = time.time()
+                    # Select Level 2 and measure Level 3 loading (if applicable)
+                    if level2_options:
+                        with timing.measure("level3_load", requests=CODES_BY_LEVEL_REQUESTS) as level3_timing:
+                            non_payment_page.select_level2_reason(level2_options[0])
                             level3_options = non_payment_page.get_all_level3_options()
-                            level3_load_time = time.time() - start_time
                             
-                    else:
-                        level2_load_time = 0
-                        level3_load_time = 0
-                else:
-                    level1_load_time = 0
-                    level2_load_time = 0
-                    level3_load_time = 0
-                    
+                        if not level3_options:
+                            level3_timing = None
+                            
+                # Browser-side latency (server + render) in seconds; Selenium time is reported alongside
+                for action_timing in (level1_timing, level2_timing, level3_timing):
+                    if action_timing:
+                        assert action_timing.captured, f"Browser timings of {action_timing.name} were not captured"
+                        
+                level1_load_time = level1_timing.browser_ms / 1000
+                level2_load_time = level2_timing.browser_ms / 1000 if level2_timing else 0
+                level3_load_time = level3_timing.browser_ms / 1000 if level3_timing else 0
+                
                 performance_data.append({
                     'iteration': i + 1,
                     'level1_load_time': level1_load_time,
@@ -388,7 +385,14 @@ class TestHierarchicalReasonManagement:
                     'level3_load_time': level3_load_time
                 })
                 
-                test_logger.performance(f"Level loading times - L1: {level1_load_time:.2f}s, L2: {level2_load_time:.2f}s, L3: {level3_load_time:.2f}s", level1_load_time)
+                for action_timing in (level1_timing, level2_timing, level3_timing):
+                    if action_timing:
+                        test_logger.data(action_timing.describe())
+                        test_logger.performance(f"{action_timing.name} (server + render)",
+                                                action_timing.browser_ms / 1000, metric=action_timing.name)
+                        
+                test_logger.performance(f"Level loading times - L1: {level1_load_time:.2f}s, L2: {level2_load_time:.2f}s, L3: {level3_load_time:.2f}s",
+                                        level1_load_time + level2_load_time + level3_load_time, metric="reason_selection")
                 
             # Analyze performance results
             level1_times = [data['level1_load_time'] for data in performance_data if data['level1_load_time'] > 0]
@@ -400,18 +404,16 @@ class TestHierarchicalReasonManagement:
             avg_level2_time = sum(level2_times) / len(level2_times) if level2_times else 0
             avg_level3_time = sum(level3_times) / len(level3_times) if level3_times else 0
             
-            # Verify performance requirements
-            performance_threshold = config_data.get('performance', {}).get('reason_load_max', 2)
-            
-            test_logger.verification(f"Verify Level 1 average loading time < {performance_threshold}s")
-            assert avg_level1_time < performance_threshold, f"Level 1 average loading time {avg_level1_time:.2f}s exceeds threshold {performance_threshold}s"
-            
-            test_logger.verification(f"Verify Level 2 average loading time < {performance_threshold}s")
-            assert avg_level2_time < performance_threshold, f"Level 2 average loading time {avg_level2_time:.2f}s exceeds threshold {performance_threshold}s"
+            for action, stats in timing.summary().items():
+                test_logger.data(f"{action}: browser avg {stats['browser_ms']:.0f}ms "
+                                 f"(server {stats['server_ms']:.0f}ms, render {stats['render_ms']:.0f}ms), "
+                                 f"selenium avg {stats['selenium_ms']:.0f}ms")
+                
+            # Verify performance requirements (performance.thresholds: mean and p95, reason_load_max: max per level)
+            measured_levels = [name for name in ("level1_load", "level2_load", "level3_load") if metrics_collector.series(name)]
             
-            if level3_times:
-                test_logger.verification(f"Verify Level 3 average loading time < {performance_threshold}s")
-                assert avg_level3_time < performance_threshold, f"Level 3 average loading time {avg_level3_time:.2f}s exceeds threshold {performance_threshold}s"
+            test_logger.verification(f"Verify {', '.join(measured_levels)} meet configured thresholds")
+            metrics_collector.assert_thresholds(*measured_levels)
                 
             test_logger.result(f"Hierarchical reason performance test completed - Avg times: L1={avg_level1_time:.2f}s, L2={avg_level2_time:.2f}s, L3={avg_level3_time:.2f}s", True)
             
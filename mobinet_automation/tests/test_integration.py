@@ -6,11 +6,10 @@ Covers TC-006: External System Synchronization and TC-007: Data Mapping.
 import pytest
 import allure
 import time
-import requests
-from datetime import datetime, timedelta
 from pages.non_payment_reason_page import NonPaymentReasonPage
-from utils.test_data_manager import TestDataManager
 from utils.logger import log_test_start, log_test_end
+from utils.api_client import CHANNEL
+from utils.browser_timing import SUBMIT_REQUESTS
 
 
 @allure.epic("Non-Payment Reason Management")
@@ -23,66 +22,49 @@ class TestIntegration:
     """
     
     @pytest.fixture(autouse=True)
-    def setup_test_data(self, config_data, logger):
+    def setup_test_data(self, config_data, logger, test_data_manager, test_data_provider, request):
         """Setup test data for integration tests."""
-        self.test_data_manager = TestDataManager(config_data, logger)
+        self.test_data_manager = test_data_manager
+        self.test_data_provider = test_data_provider
+        self.nodeid = request.node.nodeid
         self.external_systems = config_data.get('external_systems', {})
+        self.contract_id = config_data['test_data']['contracts']['valid_contract_id']
         
     @allure.story("Customer Debt Management Tool Integration")
     @allure.title("TC-006.1: Customer Debt Management Tool Data Synchronization")
     @allure.description("Verify data synchronization with Customer Debt Management Tool")
     @pytest.mark.integration
     @pytest.mark.smoke
-    def test_customer_debt_management_integration(self, revenue_user_session, config_data, logger):
+    def test_customer_debt_management_integration(self, api_client, integration_poller, config_data, logger):
         """
         Test Customer Debt Management Tool integration.
         
+        The form itself is covered by the UI tests, so the record is submitted
+        and verified over the API.
+        
         Test Steps:
-        1. Complete non-payment reason form with all fields
-        2. Submit form
-        3. Verify data is sent to Customer Debt Management Tool
-        4. Check that reason categories are properly mapped
-        5. Verify appointment date/time synchronization
-        6. Confirm disconnect date synchronization (for Revenue Collection)
+        1. Submit a complete non-payment reason with all fields
+        2. Verify data is sent to Customer Debt Management Tool
+        3. Check that reason categories are properly mapped
+        4. Verify appointment date/time synchronization
+        5. Confirm disconnect date synchronization (for Revenue Collection)
         """
         test_logger = log_test_start("Customer Debt Management Tool Integration")
         
         try:
-            non_payment_page = NonPaymentReasonPage(revenue_user_session, config_data, logger)
-            
-            test_logger.step("Navigate to Non-Payment Reason screen")
-            non_payment_page.navigate_to_non_payment_reason_page()
-            
-            # Setup complete form data
-            test_data = self._setup_complete_form_data(non_payment_page, test_logger, include_disconnect=True)
-            
-            test_logger.step("Submit complete non-payment reason form")
-            
-            # Record submission timestamp for integration verification
-            submission_time = datetime.now().isoformat()
-            
-            success = non_payment_page.submit_form()
-            
-            test_logger.verification("Verify form submission succeeds")
-            
-            if not success:
-                errors = non_payment_page.get_validation_errors()
-                test_logger.warning(f"Form submission failed with errors: {errors}")
-                # Skip integration testing if form submission fails
-                pytest.skip("Form submission failed - cannot test integration")
+            test_data = self._submit_via_api(api_client, test_logger, include_disconnect=True)
                 
             # Wait for integration processing
             test_logger.step("Wait for external system integration processing")
-            integration_timeout = self.external_systems.get('customer_debt_management', {}).get('timeout', 10)
-            time.sleep(integration_timeout)
+            sync_statuses = self._wait_for_sync(integration_poller, test_data, test_logger, 'customer_debt_management')
             
             # Verify integration with Customer Debt Management Tool
             test_logger.step("Verify data synchronization with Customer Debt Management Tool")
             
-            # Mock integration verification (in real implementation, this would query the external system)
             integration_verified = self._verify_customer_debt_management_sync(
                 test_data, 
-                submission_time, 
+                self._fetch_record(api_client, test_data), 
+                sync_statuses,
                 test_logger
             )
             
@@ -100,7 +82,6 @@ class TestIntegration:
             
         except Exception as e:
             test_logger.error("Customer Debt Management Tool integration test failed", e)
-            non_payment_page.take_screenshot("Customer_Debt_Management_Integration_Failed")
             raise
         finally:
             log_test_end("Customer Debt Management Tool Integration", True)
@@ -109,7 +90,7 @@ class TestIntegration:
     @allure.title("TC-006.2: Customer Management System Data Flow")
     @allure.description("Verify Customer Management System data flow and synchronization")
     @pytest.mark.integration
-    def test_customer_management_system_integration(self, revenue_user_session, config_data, logger):
+    def test_customer_management_system_integration(self, api_client, integration_poller, config_data, logger):
         """
         Test Customer Management System integration.
         
@@ -123,34 +104,17 @@ class TestIntegration:
         test_logger = log_test_start("Customer Management System Integration")
         
         try:
-            non_payment_page = NonPaymentReasonPage(revenue_user_session, config_data, logger)
-            
-            test_logger.step("Navigate to Non-Payment Reason screen")
-            non_payment_page.navigate_to_non_payment_reason_page()
-            
-            # Setup complete form data
-            test_data = self._setup_complete_form_data(non_payment_page, test_logger)
-            
-            test_logger.step("Submit complete non-payment reason information")
-            
-            submission_time = datetime.now().isoformat()
-            success = non_payment_page.submit_form()
-            
-            if not success:
-                errors = non_payment_page.get_validation_errors()
-                test_logger.warning(f"Form submission failed: {errors}")
-                pytest.skip("Form submission failed - cannot test integration")
+            test_data = self._submit_via_api(api_client, test_logger)
                 
             # Wait for integration processing
-            integration_timeout = self.external_systems.get('customer_management', {}).get('timeout', 10)
-            time.sleep(integration_timeout)
+            sync_statuses = self._wait_for_sync(integration_poller, test_data, test_logger, 'customer_management')
             
             test_logger.step("Verify Customer Management System integration")
             
-            # Mock integration verification
             cms_integration = self._verify_customer_management_sync(
                 test_data,
-                submission_time,
+                self._fetch_record(api_client, test_data),
+                sync_statuses,
                 test_logger
             )
             
@@ -170,7 +134,6 @@ class TestIntegration:
             
         except Exception as e:
             test_logger.error("Customer Management System integration test failed", e)
-            non_payment_page.take_screenshot("Customer_Management_System_Integration_Failed")
             raise
         finally:
             log_test_end("Customer Management System Integration", True)
@@ -179,7 +142,7 @@ class TestIntegration:
     @allure.title("TC-006.3: Multi-System Integration Data Consistency")
     @allure.description("Verify data consistency across all integrated systems")
     @pytest.mark.integration
-    def test_multi_system_integration_consistency(self, revenue_user_session, config_data, logger):
+    def test_multi_system_integration_consistency(self, api_client, integration_poller, config_data, logger):
         """
         Test multi-system integration consistency.
         
@@ -188,46 +151,27 @@ class TestIntegration:
         2. Verify same data appears correctly in all three systems
         3. Update existing reason information
         4. Verify updates propagate to all systems
-        5. Check data consistency after system refresh
+        5. Check data consistency when the record is read again
         """
         test_logger = log_test_start("Multi-System Integration Consistency")
         
         try:
-            non_payment_page = NonPaymentReasonPage(revenue_user_session, config_data, logger)
-            
-            test_logger.step("Navigate to Non-Payment Reason screen")
-            non_payment_page.navigate_to_non_payment_reason_page()
-            
-            # Setup complete form data
-            test_data = self._setup_complete_form_data(non_payment_page, test_logger, include_disconnect=True)
-            
-            test_logger.step("Submit complete non-payment reason information")
-            
-            submission_time = datetime.now().isoformat()
-            success = non_payment_page.submit_form()
-            
-            if not success:
-                errors = non_payment_page.get_validation_errors()
-                pytest.skip(f"Form submission failed: {errors}")
+            test_data = self._submit_via_api(api_client, test_logger, include_disconnect=True)
                 
-            # Wait for all integrations to complete
-            max_timeout = max(
-                self.external_systems.get('customer_debt_management', {}).get('timeout', 10),
-                self.external_systems.get('customer_management', {}).get('timeout', 10),
-                self.external_systems.get('customer_care_platform', {}).get('timeout', 10)
-            )
-            time.sleep(max_timeout + 2)  # Extra buffer
+            # Wait for all integrations to complete (polled concurrently, bounded by the slowest system)
+            sync_statuses = self._wait_for_sync(integration_poller, test_data, test_logger)
             
             test_logger.step("Verify data consistency across all systems")
+            record = self._fetch_record(api_client, test_data)
             
             # Verify Customer Debt Management Tool
-            cdm_data = self._verify_customer_debt_management_sync(test_data, submission_time, test_logger)
+            cdm_data = self._verify_customer_debt_management_sync(test_data, record, sync_statuses, test_logger)
             
             # Verify Customer Management System
-            cms_data = self._verify_customer_management_sync(test_data, submission_time, test_logger)
+            cms_data = self._verify_customer_management_sync(test_data, record, sync_statuses, test_logger)
             
             # Verify Customer Care Platform
-            ccp_data = self._verify_customer_care_platform_sync(test_data, submission_time, test_logger)
+            ccp_data = self._verify_customer_care_platform_sync(test_data, record, sync_statuses, test_logger)
             
             test_logger.verification("Verify data appears correctly in all systems")
             
@@ -249,24 +193,20 @@ class TestIntegration:
             test_logger.verification("Verify update propagation (if supported)")
             # Note: This may require separate update functionality testing
             
-            # Test system refresh consistency
-            test_logger.step("Test data consistency after system refresh")
-            
-            # Refresh page and verify data persistence
-            non_payment_page.refresh_page()
-            non_payment_page.wait_for_non_payment_page_load()
+            # Test consistency when the record is read again
+            test_logger.step("Test data consistency after re-reading the record")
             
-            # Re-verify integration after refresh
-            refreshed_cdm_data = self._verify_customer_debt_management_sync(test_data, submission_time, test_logger)
+            refreshed_cdm_data = self._verify_customer_debt_management_sync(
+                test_data, self._fetch_record(api_client, test_data), sync_statuses, test_logger
+            )
             
             test_logger.verification("Verify data consistency after refresh")
-            assert refreshed_cdm_data.get('data_present', False), "Data should remain consistent after page refresh"
+            assert refreshed_cdm_data.get('data_present', False), "Data should remain consistent after refresh"
             
             test_logger.result("Multi-system integration consistency test completed successfully", True)
             
         except Exception as e:
             test_logger.error("Multi-system integration consistency test failed", e)
-            non_payment_page.take_screenshot("Multi_System_Integration_Consistency_Failed")
             raise
         finally:
             log_test_end("Multi-System Integration Consistency", True)
@@ -275,12 +215,12 @@ class TestIntegration:
     @allure.title("TC-007.1: Automatic Field Population Verification")
     @allure.description("Verify automatic field mapping per specification")
     @pytest.mark.integration
-    def test_automatic_field_population(self, revenue_user_session, config_data, logger):
+    def test_automatic_field_population(self, api_client, integration_poller, config_data, logger):
         """
         Test automatic field population per specification.
         
         Test Steps:
-        1. Complete and submit non-payment reason form
+        1. Submit a complete non-payment reason
         2. Verify in Customer Debt Management Tool:
            - "Contact Person" is left blank
            - "Payment Capability" is left blank
@@ -292,36 +232,23 @@ class TestIntegration:
         test_logger = log_test_start("Automatic Field Population")
         
         try:
-            non_payment_page = NonPaymentReasonPage(revenue_user_session, config_data, logger)
-            
-            test_logger.step("Navigate to Non-Payment Reason screen")
-            non_payment_page.navigate_to_non_payment_reason_page()
-            
-            # Setup form with specific test data
+            # Submit with specific test data
             test_notes = "Test notes for automatic field mapping verification"
-            test_data = self._setup_complete_form_data(
-                non_payment_page, 
+            test_data = self._submit_via_api(
+                api_client, 
                 test_logger, 
                 specific_notes=test_notes,
                 include_disconnect=True
             )
-            
-            test_logger.step("Submit non-payment reason form")
-            
-            submission_time = datetime.now().isoformat()
-            success = non_payment_page.submit_form()
-            
-            if not success:
-                errors = non_payment_page.get_validation_errors()
-                pytest.skip(f"Form submission failed: {errors}")
                 
             # Wait for integration
-            time.sleep(self.external_systems.get('customer_debt_management', {}).get('timeout', 10))
+            self._wait_for_sync(integration_poller, test_data, test_logger, 'customer_debt_management')
             
             test_logger.step("Verify automatic field population in Customer Debt Management Tool")
             
-            # Mock verification of field population
-            field_mapping = self._verify_field_population(test_data, test_notes, submission_time, test_logger)
+            field_mapping = self._verify_field_population(
+                test_data, test_notes, self._fetch_record(api_client, test_data), test_logger
+            )
             
             test_logger.verification("Verify 'Contact Person' is left blank")
             assert field_mapping.get('contact_person_blank', False), "Contact Person field should be left blank"
@@ -350,7 +277,6 @@ class TestIntegration:
             
         except Exception as e:
             test_logger.error("Automatic field population test failed", e)
-            non_payment_page.take_screenshot("Automatic_Field_Population_Failed")
             raise
         finally:
             log_test_end("Automatic Field Population", True)
@@ -360,7 +286,8 @@ class TestIntegration:
     @allure.description("Verify integration system performance meets requirements")
     @pytest.mark.integration
     @pytest.mark.performance
-    def test_integration_performance(self, revenue_user_session, config_data, logger, performance_monitor):
+    def test_integration_performance(self, revenue_user_session, api_client, integration_poller, config_data, logger,
+                                     performance_monitor, metrics_collector):
         """
         Test integration system performance.
         
@@ -385,22 +312,32 @@ class TestIntegration:
             # Record start time
             start_time = time.time()
             
-            # Submit form
-            success = non_payment_page.submit_form()
-            
+            # Submit form, correlating the /submit request with the DOM update it causes
+            with non_payment_page.browser_timing.measure("form_submit", requests=SUBMIT_REQUESTS) as submit_timing:
+                success = non_payment_page.submit_form()
+                
             if not success:
                 errors = non_payment_page.get_validation_errors()
                 pytest.skip(f"Form submission failed: {errors}")
                 
+            test_logger.data(submit_timing.describe())
+            assert submit_timing.captured, "Browser timings of form_submit were not captured"
+            submit_time = submit_timing.browser_ms / 1000
+            test_logger.performance("Form submission (server + render)", submit_time, metric="form_submit")
+            
+            test_logger.verification("Verify form submission latency meets configured thresholds")
+            metrics_collector.assert_thresholds("form_submit")
+            
             # Wait for integration completion and measure time
             max_timeout = config_data.get('performance', {}).get('integration_max', 5)
             
-            # Mock integration completion detection
-            integration_complete = self._wait_for_integration_completion(max_timeout, test_logger)
+            statuses = self._wait_for_integration_completion(
+                api_client, integration_poller, test_data, max_timeout, test_logger
+            )
             
             total_integration_time = time.time() - start_time
             
-            test_logger.performance("Total integration time", total_integration_time)
+            test_logger.performance("Total integration time", total_integration_time, metric="integration_total")
             
             test_logger.verification(f"Verify total integration time < {max_timeout} seconds")
             assert total_integration_time < max_timeout, f"Integration time {total_integration_time:.2f}s exceeds {max_timeout}s threshold"
@@ -408,10 +345,10 @@ class TestIntegration:
             # Test individual system performance
             test_logger.step("Measure individual system performance")
             
-            individual_times = self._measure_individual_system_performance(test_data, test_logger)
-            
-            for system, perf_time in individual_times.items():
-                test_logger.performance(f"{system} integration time", perf_time)
+            for system, status in statuses.items():
+                perf_time = status.elapsed
+                test_logger.performance(f"{system} integration time", perf_time, metric=f"integration_{system}")
+                assert status.synced, f"{system} did not synchronize the record: {status.error}"
                 
                 # Individual systems should complete within reasonable time
                 individual_threshold = max_timeout * 0.8  # 80% of total threshold
@@ -432,11 +369,9 @@ class TestIntegration:
         """Setup complete form data for integration testing."""
         test_logger.step("Setup complete form data")
         
-        # Get test data
-        if include_disconnect:
-            test_data = self.test_data_manager.get_role_specific_test_data('revenue_collection')
-        else:
-            test_data = self.test_data_manager.get_role_specific_test_data('customer_care')
+        # Get test data (seeded per test and cached, so reruns submit identical data)
+        role = 'revenue_collection' if include_disconnect else 'customer_care'
+        test_data = self.test_data_provider.dataset(self.nodeid, 'get_role_specific_test_data', role)
             
         # Select reasons
         reason = test_data['reason_hierarchy']
@@ -447,7 +382,7 @@ class TestIntegration:
         elif level1_options:
             non_payment_page.select_level1_reason(level1_options[0])
             
-        time.sleep(2)
+        non_payment_page.wait_for_ui_settled()
         
         level2_options = non_payment_page.get_all_level2_options()
         if level2_options:
@@ -463,7 +398,7 @@ class TestIntegration:
         # Setup appointment
         appointment = test_data['appointment']
         non_payment_page.select_appointment_date(appointment.date)
-        time.sleep(1)
+        non_payment_page.wait_for_ui_settled()
         non_payment_page.select_appointment_time(appointment.time)
         
         # Setup disconnect data if included
@@ -479,69 +414,133 @@ class TestIntegration:
             'contract': test_data['contract']
         }
         
-    def _verify_customer_debt_management_sync(self, test_data, submission_time, test_logger):
-        """Mock verification of Customer Debt Management Tool synchronization."""
+    def _submit_via_api(self, api_client, test_logger, specific_notes=None, include_disconnect=False):
+        """Submit a complete non-payment reason over HTTP (for tests where the form is not under test)."""
+        test_logger.step("Submit complete non-payment reason via API")
+        
+        # Get test data (seeded per test and cached, so reruns submit identical data)
+        role = 'revenue_collection' if include_disconnect else 'customer_care'
+        test_data = self.test_data_provider.dataset(self.nodeid, 'get_role_specific_test_data', role)
+        
+        notes = specific_notes or test_data['notes']
+        disconnect = test_data.get('disconnect') if include_disconnect else None
+        
+        submission = api_client.build_submission(
+            self.contract_id,
+            test_data['reason_hierarchy'],
+            notes,
+            appointment=test_data['appointment'],
+            disconnect=disconnect
+        )
+        response = api_client.submit_non_payment_reason(submission)
+        
+        test_logger.verification("Verify submission succeeds")
+        if not response.success:
+            test_logger.warning(f"API submission failed with errors: {list(response.errors)}")
+            # Skip integration testing if submission fails
+            pytest.skip("Submission failed - cannot test integration")
+            
+        return {
+            'reason_hierarchy': test_data['reason_hierarchy'],
+            'notes': notes,
+            'appointment_data': test_data['appointment'],
+            'disconnect_data': disconnect,
+            'contract': test_data['contract'],
+            'record': response.data
+        }
+        
+    def _fetch_record(self, api_client, test_data):
+        """Read the submitted record back from the contract history (other tests may submit for the same contract)."""
+        record_id = test_data['record']['id']
+        response = api_client.get_history(self.contract_id)
+        return next((record for record in response.data or [] if record['id'] == record_id), None)
+        
+    def _verify_customer_debt_management_sync(self, test_data, record, sync_statuses, test_logger):
+        """Verify the stored record and the Customer Debt Management Tool's own sync status."""
         test_logger.step("Verify Customer Debt Management Tool synchronization")
         
-        # In real implementation, this would query the external system API
-        # Mock verification results
+        if not record:
+            return {'data_present': False}
+            
+        reason = test_data['reason_hierarchy']
+        appointment = test_data['appointment_data']
+        disconnect = test_data.get('disconnect_data')
+        
         return {
-            'data_present': True,
-            'reason_mapping': True,
-            'appointment_sync': True,
-            'disconnect_sync': True if test_data.get('disconnect_data') else None,
-            'field_mapping_correct': True
+            'data_present': self._synced(sync_statuses, 'customer_debt_management'),
+            'reason_mapping': record.get('reasonLevel1Name') == reason.level1 and record.get('reasonLevel2Name') == reason.level2,
+            'appointment_sync': (record.get('scheduledDate') or '')[:10] == appointment.date and record.get('scheduledTime') == appointment.time,
+            'disconnect_sync': (record.get('lockDate') or '')[:10] == disconnect.disconnect_date if disconnect else None
         }
         
-    def _verify_customer_management_sync(self, test_data, submission_time, test_logger):
-        """Mock verification of Customer Management System synchronization."""
+    def _verify_customer_management_sync(self, test_data, record, sync_statuses, test_logger):
+        """Verify the stored record and the Customer Management System's own sync status."""
         test_logger.step("Verify Customer Management System synchronization")
         
+        if not record:
+            return {'data_present': False}
+            
         return {
-            'data_present': True,
-            'contact_sync': True,
-            'appointment_transfer': True,
-            'history_update': True,
-            'field_mapping': True
+            'data_present': self._synced(sync_statuses, 'customer_management'),
+            'contact_sync': record.get('contractId') == self.contract_id,
+            'appointment_transfer': bool(record.get('scheduledDate')),
+            'history_update': True,  # the record was read back from the contract history
+            'field_mapping': record.get('notes') == test_data['notes']
         }
         
-    def _verify_customer_care_platform_sync(self, test_data, submission_time, test_logger):
-        """Mock verification of Customer Care Platform synchronization."""
+    def _verify_customer_care_platform_sync(self, test_data, record, sync_statuses, test_logger):
+        """Verify the stored record and the Customer Care Platform's own sync status."""
         test_logger.step("Verify Customer Care Platform synchronization")
         
+        if not record:
+            return {'data_present': False}
+            
         return {
-            'data_present': True,
-            'interaction_logged': True,
-            'notes_synced': True,
-            'timeline_updated': True
+            'data_present': self._synced(sync_statuses, 'customer_care_platform'),
+            'interaction_logged': bool(record.get('submissionDate')),
+            'notes_synced': record.get('notes') == test_data['notes'],
+            'timeline_updated': bool(record.get('updatedAt'))
         }
         
-    def _verify_field_population(self, test_data, test_notes, submission_time, test_logger):
-        """Mock verification of automatic field population."""
+    def _verify_field_population(self, test_data, test_notes, record, test_logger):
+        """Verify automatic field population (external-only fields are still mocked)."""
         test_logger.step("Verify automatic field population")
         
+        record = record or {}
         return {
             'contact_person_blank': True,
             'payment_capability_blank': True,
             'action_blank': True,
-            'contact_channel_mobix': True,
-            'notes_transferred': True,
-            'appointment_populated': True if test_data.get('appointment_data') else False,
-            'disconnect_populated': True if test_data.get('disconnect_data') else False
+            'contact_channel_mobix': record.get('channel') == CHANNEL,
+            'notes_transferred': record.get('notes') == test_notes,
+            'appointment_populated': bool(record.get('scheduledDate')) if test_data.get('appointment_data') else False,
+            'disconnect_populated': bool(record.get('lockDate')) if test_data.get('disconnect_data') else False
         }
         
-    def _wait_for_integration_completion(self, timeout, test_logger):
-        """Mock waiting for integration completion."""
-        # In real implementation, this would poll external systems or check status endpoints
-        time.sleep(timeout * 0.5)  # Simulate integration time
-        test_logger.info("Integration completion detected (mock)")
-        return True
+    @staticmethod
+    def _synced(sync_statuses, system):
+        """Whether the poller saw a system report the record as synced (False if it was not polled)."""
+        status = sync_statuses.get(system)
+        return bool(status and status.synced)
         
-    def _measure_individual_system_performance(self, test_data, test_logger):
-        """Mock measurement of individual system performance."""
-        # Mock individual system performance times
-        return {
-            'customer_debt_management': 1.5,
-            'customer_management': 1.2,
-            'customer_care_platform': 0.8
-        }
\ No newline at end of file
+    def _wait_for_sync(self, integration_poller, test_data, test_logger, *systems):
+        """Wait for external systems (default: all enabled) to report the submitted record as synced."""
+        statuses = integration_poller.wait_for_sync(test_data['record']['id'], systems=systems or None)
+        
+        for status in statuses.values():
+            state = "synced" if status.synced else f"not synced ({status.error})"
+            test_logger.data(f"{status.system}: {state} after {status.elapsed:.2f}s, {status.attempts} polls")
+            
+        failed = [status.system for status in statuses.values() if not status.synced]
+        assert not failed, f"Record was not synchronized to: {', '.join(failed)}"
+        return statuses
+        
+    def _wait_for_integration_completion(self, api_client, integration_poller, test_data, timeout, test_logger):
+        """Wait for the record submitted through the form to sync to all systems within the timeout."""
+        history = api_client.get_history(self.contract_id).data or []
+        records = [record for record in history if record.get('notes') == test_data['notes']]
+        assert records, "Submitted record should appear in the contract history"
+        
+        statuses = integration_poller.wait_for_sync(records[-1]['id'], timeout=timeout)
+        test_logger.data(f"Integration completion: {sum(status.synced for status in statuses.values())}/{len(statuses)} systems synced")
+        return statuses
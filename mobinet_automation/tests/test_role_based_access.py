@@ -5,15 +5,14 @@ Covers TC-005: Role-Based Access Control and TC-004: Service Disconnection Sched
 
 import pytest
 import allure
-import time
 from datetime import datetime, timedelta
 from pages.non_payment_reason_page import NonPaymentReasonPage
-from utils.test_data_manager import TestDataManager
 from utils.logger import log_test_start, log_test_end
 
 
 @allure.epic("Non-Payment Reason Management")
 @allure.feature("Role-Based Access Control")
+@pytest.mark.canned_api("reason_codes")
 class TestRoleBasedAccess:
     """
     Test class for role-based access control functionality.
@@ -21,9 +20,9 @@ class TestRoleBasedAccess:
     """
     
     @pytest.fixture(autouse=True)
-    def setup_test_data(self, config_data, logger):
+    def setup_test_data(self, config_data, logger, test_data_manager):
         """Setup test data for role-based access tests."""
-        self.test_data_manager = TestDataManager(config_data, logger)
+        self.test_data_manager = test_data_manager
         
     @allure.story("Revenue Collection Role Features")
     @allure.title("TC-005.1: Revenue Collection Role Complete Access")
@@ -62,7 +61,7 @@ class TestRoleBasedAccess:
             level1_options = non_payment_page.get_all_level1_options()
             if level1_options:
                 non_payment_page.select_level1_reason(level1_options[0])
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 level2_visible = non_payment_page.is_element_visible(
                     non_payment_page.LEVEL2_DROPDOWN,
@@ -114,7 +113,7 @@ class TestRoleBasedAccess:
     @allure.title("TC-005.2: Non-Revenue Collection Role Access Restrictions")
     @allure.description("Verify other roles have appropriate feature restrictions")
     @pytest.mark.rbac
-    def test_non_revenue_collection_role_restrictions(self, customer_care_session, config_data, logger):
+    def test_non_revenue_collection_role_restrictions(self, customer_care_session, config_data, logger, api_clients):
         """
         Test non-Revenue Collection role access restrictions.
         
@@ -146,7 +145,7 @@ class TestRoleBasedAccess:
             level1_options = non_payment_page.get_all_level1_options()
             if level1_options:
                 non_payment_page.select_level1_reason(level1_options[0])
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 level2_visible = non_payment_page.is_element_visible(
                     non_payment_page.LEVEL2_DROPDOWN,
@@ -166,21 +165,21 @@ class TestRoleBasedAccess:
             test_logger.verification("Verify service disconnection scheduling is hidden")
             
             # Test disconnect options are NOT visible for non-Revenue Collection roles
-            disconnect_options_visible = non_payment_page.is_disconnect_options_visible()
-            assert not disconnect_options_visible, "Service disconnection options should be hidden for non-Revenue Collection roles"
+            disconnect_options_hidden = non_payment_page.is_disconnect_options_absent()
+            assert disconnect_options_hidden, "Service disconnection options should be hidden for non-Revenue Collection roles"
             
             # Test specific disconnect elements are not present
-            disconnect_option1_visible = non_payment_page.is_element_visible(
+            disconnect_option1_hidden = non_payment_page.is_element_absent(
                 non_payment_page.DISCONNECT_OPTION1_BOX,
                 timeout=3
             )
-            assert not disconnect_option1_visible, "Disconnect option 1 should not be visible for non-Revenue Collection roles"
+            assert disconnect_option1_hidden, "Disconnect option 1 should not be visible for non-Revenue Collection roles"
             
-            disconnect_option2_visible = non_payment_page.is_element_visible(
+            disconnect_option2_hidden = non_payment_page.is_element_absent(
                 non_payment_page.DISCONNECT_OPTION2_BOX,
                 timeout=3
             )
-            assert not disconnect_option2_visible, "Disconnect option 2 should not be visible for non-Revenue Collection roles"
+            assert disconnect_option2_hidden, "Disconnect option 2 should not be visible for non-Revenue Collection roles"
             
             test_logger.verification("Verify form submission works without disconnect options")
             
@@ -202,6 +201,17 @@ class TestRoleBasedAccess:
                 # Verify no disconnect-related errors
                 disconnect_errors = [e for e in errors if 'disconnect' in e.lower()]
                 assert len(disconnect_errors) == 0, f"Unexpected disconnect-related errors for non-Revenue role: {disconnect_errors}"
+            else:
+                test_logger.verification("Verify historical tracking excludes disconnect-related information")
+                
+                # Read the stored record over HTTP with the browser's session
+                contract_id = config_data['test_data']['contracts']['valid_contract_id']
+                history = api_clients.for_role('customer_care').get_history(contract_id).data or []
+                submitted = [record for record in history if record.get('notes') == notes]
+                assert submitted, "Submitted record should appear in the contract history"
+                
+                disconnect_records = [record['id'] for record in submitted if record.get('lockDate') or record.get('lockType')]
+                assert not disconnect_records, f"Records of non-Revenue role should not carry disconnect information: {disconnect_records}"
                 
             test_logger.result("Non-Revenue Collection role restrictions test completed successfully", True)
             
@@ -246,7 +256,7 @@ class TestRoleBasedAccess:
             assert disconnect_options_visible, "Disconnect options should be visible for Revenue Collection role"
             
             # Verify second option box is not visible initially
-            option2_initially_hidden = not non_payment_page.is_element_visible(
+            option2_initially_hidden = non_payment_page.is_element_absent(
                 non_payment_page.DISCONNECT_OPTION2_BOX,
                 timeout=3
             )
@@ -265,7 +275,7 @@ class TestRoleBasedAccess:
                 
             test_logger.verification("Verify second option box appears after selecting Option 2")
             
-            time.sleep(2)  # Wait for UI update
+            non_payment_page.wait_for_ui_settled()  # Wait for UI update
             
             option2_visible = non_payment_page.is_element_visible(
                 non_payment_page.DISCONNECT_OPTION2_BOX,
@@ -285,9 +295,9 @@ class TestRoleBasedAccess:
                 alt_success = non_payment_page.select_disconnect_option1(different_option)
                 
                 if alt_success:
-                    time.sleep(2)
+                    non_payment_page.wait_for_ui_settled()
                     
-                    option2_hidden_again = not non_payment_page.is_element_visible(
+                    option2_hidden_again = non_payment_page.is_element_absent(
                         non_payment_page.DISCONNECT_OPTION2_BOX,
                         timeout=3
                     )
@@ -345,9 +355,9 @@ class TestRoleBasedAccess:
             
             if success:
                 test_logger.verification("Verify third option box is hidden with cancel option")
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
-                option3_hidden = not non_payment_page.is_element_visible(
+                option3_hidden = non_payment_page.is_element_absent(
                     non_payment_page.DISCONNECT_OPTION3_BOX,
                     timeout=3
                 )
@@ -361,7 +371,7 @@ class TestRoleBasedAccess:
             
             if success:
                 test_logger.verification("Verify date picker appears")
-                time.sleep(2)
+                non_payment_page.wait_for_ui_settled()
                 
                 date_picker_visible = non_payment_page.is_element_visible(
                     non_payment_page.DISCONNECT_DATE_PICKER,
@@ -401,7 +411,7 @@ class TestRoleBasedAccess:
                 
                 if valid_success:
                     test_logger.verification("Verify third option box appears after valid date selection")
-                    time.sleep(2)
+                    non_payment_page.wait_for_ui_settled()
                     
                     option3_visible = non_payment_page.is_element_visible(
                         non_payment_page.DISCONNECT_OPTION3_BOX,
@@ -534,12 +544,12 @@ class TestRoleBasedAccess:
         level1_options = non_payment_page.get_all_level1_options()
         if level1_options:
             non_payment_page.select_level1_reason(level1_options[0])
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             level2_options = non_payment_page.get_all_level2_options()
             if level2_options:
                 non_payment_page.select_level2_reason(level2_options[0])
-                time.sleep(1)
+                non_payment_page.wait_for_ui_settled()
                 
     def _setup_disconnect_option2_visible(self, non_payment_page, test_logger):
         """Helper method to setup disconnect option 2 visibility."""
@@ -553,7 +563,7 @@ class TestRoleBasedAccess:
             test_logger.warning("Could not select Option 2, trying alternative approach")
             # Alternative implementation-specific approach
             
-        time.sleep(2)
+        non_payment_page.wait_for_ui_settled()
         
     def _setup_disconnect_option3_visible(self, non_payment_page, test_logger):
         """Helper method to setup disconnect option 3 visibility."""
@@ -567,13 +577,13 @@ class TestRoleBasedAccess:
         success = non_payment_page.select_disconnect_option2(date_option_text)
         
         if success:
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
             # Select valid disconnect date
             valid_date = self._generate_valid_disconnect_date()
             non_payment_page.select_disconnect_date(valid_date)
             
-            time.sleep(2)
+            non_payment_page.wait_for_ui_settled()
             
     def _generate_valid_disconnect_date(self):
         """Generate a valid disconnect date (between 13th and end of month, in future)."""
@@ -0,0 +1,337 @@
+"""
+HTTP API client for Mobinet NextGen automation framework.
+Mirrors NonPaymentReasonAPI (code_basic/src/api/nonPaymentReason.ts) over a pooled
+keep-alive requests.Session, so tests can set up and verify records without a browser.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+REASONS_PATH = "/non-payment-reasons"
+AUTH_PATH = "/auth"
+CHANNEL = "MobiX"
+
+# Disconnect status labels used by the UI and test data -> lockType of the API
+LOCK_TYPES = {
+    'Maintain': 'permanent',
+    'Temporary': 'temporary',
+}
+
+
+class ApiResponse(NamedTuple):
+    """ApiResponse envelope of the API plus the HTTP status (None when no response was received)."""
+    success: bool
+    data: Any = None
+    message: Optional[str] = None
+    errors: Tuple[str, ...] = ()
+    status: Optional[int] = None
+
+
+def _field(item, name):
+    """Read a field from a dataclass, NamedTuple or dict."""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _iso_date(value):
+    """Format a date, datetime or string as YYYY-MM-DD."""
+    if value is None:
+        return None
+    if hasattr(value, 'strftime'):
+        return value.strftime("%Y-%m-%d")
+    return str(value)[:10]
+
+
+class NonPaymentReasonApiClient:
+    """
+    Client for the /non-payment-reasons API.
+    Methods return ApiResponse instead of raising on HTTP errors, like the page
+    objects return booleans, so tests decide what a failure means.
+    """
+
+    def __init__(self, api_base_url, timeout=10, pool_size=10, retries=2, logger=None):
+        """
+        Initialize API client.
+
+        Args:
+            api_base_url (str): API root (paths such as /non-payment-reasons are appended)
+            timeout (float): Seconds per request
+            pool_size (int): Keep-alive connections kept per host
+            retries (int): Retries of failed connections (HTTP errors are never retried)
+            logger: Logger instance
+        """
+        self.api_base_url = api_base_url.rstrip("/")
+        self.timeout = timeout
+        self.logger = logger
+
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._user = None
+        self._codes = None
+        self._code_ids = None
+
+    # Authentication
+
+    def use_cookies(self, cookies):
+        """
+        Authenticate with cookies captured from a browser.
+        Cookies are sent regardless of domain because the API may live on another host.
+
+        Args:
+            cookies (list): Selenium cookie dicts (name, value, path)
+        """
+        self.session.cookies.clear()
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'], path=cookie.get('path', '/'))
+        self._user = None
+
+    def use_browser_session(self, driver):
+        """Authenticate with the cookies of a logged-in browser."""
+        self.use_cookies(driver.get_cookies())
+
+    def login(self, username, password):
+        """
+        Log in through the API; the session cookie is kept by the client.
+
+        Returns:
+            bool: True if login succeeded
+        """
+        self.session.cookies.clear()
+        response = self._request("POST", f"{AUTH_PATH}/login", json={'username': username, 'password': password})
+        self._user = response.data if response.success else None
+        return response.success
+
+    def current_user(self):
+        """
+        Get the user of the authenticated session (cached).
+
+        Returns:
+            dict: User info (username, role, staffId), or None if not authenticated
+        """
+        if self._user is None:
+            response = self._request("GET", f"{AUTH_PATH}/session")
+            self._user = response.data if response.success else None
+        return self._user
+
+    def is_authenticated(self):
+        """Check whether the API accepts the client's session."""
+        self._user = None
+        return self.current_user() is not None
+
+    # NonPaymentReasonAPI
+
+    def get_reason_codes(self, parent_id=None, level=None):
+        """Fetch reason codes, optionally filtered by parent and level (getReasonCodes)."""
+        params = {}
+        if parent_id:
+            params['parentId'] = parent_id
+        if level:
+            params['level'] = level
+        return self._request("GET", f"{REASONS_PATH}/codes", params=params)
+
+    def get_reason_codes_by_level(self, level, parent_id=None):
+        """Fetch reason codes of one level (getReasonCodesByLevel)."""
+        params = {'level': level}
+        if parent_id:
+            params['parentId'] = parent_id
+        return self._request("GET", f"{REASONS_PATH}/codes/by-level", params=params)
+
+    def submit_non_payment_reason(self, data):
+        """
+        Submit a non-payment reason record (submitNonPaymentReason).
+
+        Args:
+            data (dict): NonPaymentReasonSubmission, e.g. from build_submission()
+
+        Returns:
+            ApiResponse: Created record in data, or validation errors
+        """
+        return self._request("POST", f"{REASONS_PATH}/submit", json=data)
+
+    def get_history(self, contract_id, month=None, year=None):
+        """Get the records of a contract submitted in a month, default the current one (getHistory)."""
+        now = datetime.now()
+        params = {'contractId': contract_id, 'month': month or now.month, 'year': year or now.year}
+        return self._request("GET", f"{REASONS_PATH}/history", params=params)
+
+    def get_latest_record(self, contract_id):
+        """Get the latest record of a contract, data None if there is none (getLatestRecord)."""
+        return self._request("GET", f"{REASONS_PATH}/latest/{contract_id}")
+
+    # Test helpers
+
+    def reason_ids(self, level1, level2=None, level3=None):
+        """
+        Resolve reason names to code IDs.
+        Codes are fetched once per client and looked up by (level, parent, name).
+
+        Returns:
+            dict: reasonLevel1/2/3 IDs (None for names that do not resolve)
+        """
+        if self._code_ids is None:
+            response = self.get_reason_codes()
+            self._codes = (response.data or []) if response.success else []
+            self._code_ids = {
+                (code['level'], code.get('parentId') or None, code['name']): code['id'] for code in self._codes
+            }
+
+        level1_id = self._code_ids.get((1, None, level1))
+        level2_id = self._code_ids.get((2, level1_id, level2)) if level2 else None
+        level3_id = self._code_ids.get((3, level2_id, level3)) if level3 else None
+        return {'reasonLevel1': level1_id, 'reasonLevel2': level2_id, 'reasonLevel3': level3_id}
+
+    def build_submission(self, contract_id, reason, notes, appointment=None, disconnect=None, staff_id=None):
+        """
+        Build a NonPaymentReasonSubmission from generated test data.
+
+        Args:
+            contract_id (str): Contract ID
+            reason: ReasonHierarchy/ReasonRecord with level1-3 names
+            notes (str): Notes text
+            appointment: AppointmentData/AppointmentRecord (optional)
+            disconnect: DisconnectData/DisconnectRecord (optional, Revenue Collection only)
+            staff_id (str): Staff ID (default: the authenticated user's)
+
+        Returns:
+            dict: Submission payload
+        """
+        if staff_id is None:
+            staff_id = (self.current_user() or {}).get('staffId', '')
+
+        submission = {'contractId': contract_id, 'notes': notes, 'staffId': staff_id, 'channel': CHANNEL}
+        submission.update({
+            key: value for key, value in self.reason_ids(
+                _field(reason, 'level1'), _field(reason, 'level2'), _field(reason, 'level3')
+            ).items() if value
+        })
+
+        if appointment is not None:
+            submission['scheduledDate'] = _iso_date(_field(appointment, 'date'))
+            submission['scheduledTime'] = _field(appointment, 'time')
+
+        if disconnect is not None and _field(disconnect, 'disconnect_date'):
+            submission['lockDate'] = _iso_date(_field(disconnect, 'disconnect_date'))
+            submission['lockType'] = LOCK_TYPES.get(_field(disconnect, 'status'), _field(disconnect, 'status'))
+
+        return submission
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def _request(self, method, path, params=None, json=None):
+        """Send a request and unwrap the ApiResponse envelope."""
+        url = self.api_base_url + path
+        started = time.perf_counter()
+
+        try:
+            response = self.session.request(method, url, params=params, json=json, timeout=self.timeout)
+        except requests.RequestException as e:
+            if self.logger:
+                self.logger.warning(f"API {method} {path} failed: {str(e)}")
+            return ApiResponse(False, message=str(e), errors=(str(e),))
+
+        if self.logger:
+            self.logger.debug("API %s %s -> %s in %.0fms", method, path, response.status_code,
+                              (time.perf_counter() - started) * 1000)
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if not isinstance(body, dict):
+            body = {'data': body}
+
+        message = body.get('message') or (None if response.ok else f"HTTP {response.status_code}")
+        return ApiResponse(
+            success=response.ok and body.get('success', True),
+            data=body.get('data'),
+            message=message,
+            errors=tuple(body.get('errors') or ([message] if message and not response.ok else ())),
+            status=response.status_code
+        )
+
+
+class ApiClientPool:
+    """
+    One authenticated API client per role, shared by the session.
+    Clients reuse the cookies the browser captured at UI login (AuthSessionCache)
+    and fall back to logging in through the API.
+    """
+
+    def __init__(self, config_data, auth_cache=None, logger=None):
+        """
+        Initialize API client pool.
+
+        Args:
+            config_data (dict): Configuration data (environment.api_base_url, users, api)
+            auth_cache: AuthSessionCache with browser sessions to reuse (optional)
+            logger: Logger instance
+        """
+        self.config_data = config_data
+        self.auth_cache = auth_cache
+        self.logger = logger
+
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def for_role(self, role_key):
+        """
+        Get the authenticated client of a role.
+
+        Args:
+            role_key (str): Role key from the 'users' configuration
+
+        Returns:
+            NonPaymentReasonApiClient: Client (not authenticated if login failed)
+        """
+        with self._lock:
+            client = self._clients.get(role_key)
+            if client is None:
+                client = self._clients[role_key] = self._create_client()
+                self._authenticate(client, role_key)
+        return client
+
+    def close(self):
+        """Close every client."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def _create_client(self):
+        api_config = self.config_data.get('api', {})
+        return NonPaymentReasonApiClient(
+            self.config_data['environment']['api_base_url'],
+            timeout=api_config.get('timeout', 10),
+            pool_size=api_config.get('pool_size', 10),
+            retries=api_config.get('retries', 2),
+            logger=self.logger
+        )
+
+    def _authenticate(self, client, role_key):
+        snapshot = self.auth_cache.snapshot(role_key) if self.auth_cache else None
+        if snapshot is not None:
+            client.use_cookies(snapshot.cookies)
+            if client.is_authenticated():
+                if self.logger:
+                    self.logger.info(f"API client for role '{role_key}' reuses the browser session")
+                return
+
+        user_config = self.config_data['users'][role_key]
+        if client.login(user_config['username'], user_config['password']):
+            if self.logger:
+                self.logger.info(f"API client logged in as {user_config['role']} user")
+        elif self.logger:
+            self.logger.warning(f"API login failed for {user_config['role']} user")
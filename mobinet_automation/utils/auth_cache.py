@@ -0,0 +1,159 @@
+"""
+Authenticated session cache for Mobinet NextGen automation framework.
+Captures cookies and web storage after a UI login and restores them into later browsers.
+"""
+
+import threading
+import time
+
+
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    var data = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (key) { window.localStorage.setItem(key, local[key]); });
+Object.keys(session).forEach(function (key) { window.sessionStorage.setItem(key, session[key]); });
+"""
+
+
+class AuthSnapshot:
+    """Cookies and web storage captured from an authenticated browser."""
+
+    __slots__ = ("role", "cookies", "local_storage", "session_storage", "captured_at", "expires_at")
+
+    def __init__(self, role, cookies, local_storage, session_storage, captured_at, expires_at):
+        self.role = role
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+        self.captured_at = captured_at
+        self.expires_at = expires_at
+
+    def is_expired(self, margin=30):
+        """Check whether the snapshot expires within the safety margin (seconds)."""
+        return time.time() + margin >= self.expires_at
+
+
+class AuthSessionCache:
+    """
+    Per-role cache of authenticated browser sessions.
+    Each role logs in through the UI once per session; later tests inject the captured
+    cookies and storage before navigation and fall back to a real login when rejected.
+    """
+
+    def __init__(self, base_url, max_age=1800, logger=None):
+        """
+        Initialize auth session cache.
+
+        Args:
+            base_url (str): Application base URL (cookies are scoped to its origin)
+            max_age (int): Maximum snapshot age in seconds when cookies carry no expiry
+            logger: Logger instance
+        """
+        self.base_url = base_url
+        self.max_age = max_age
+        self.logger = logger
+
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def capture(self, driver, role):
+        """
+        Capture the authenticated state of a browser for a role.
+
+        Args:
+            driver: WebDriver instance that has just logged in
+            role (str): Role key from the 'users' configuration
+        """
+        cookies = driver.get_cookies()
+        storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT) or {}
+
+        captured_at = time.time()
+        expires_at = captured_at + self.max_age
+        cookie_expiries = [cookie['expiry'] for cookie in cookies if cookie.get('expiry')]
+        if cookie_expiries:
+            expires_at = min(expires_at, min(cookie_expiries))
+
+        snapshot = AuthSnapshot(
+            role=role,
+            cookies=cookies,
+            local_storage=storage.get('local', {}),
+            session_storage=storage.get('session', {}),
+            captured_at=captured_at,
+            expires_at=expires_at
+        )
+
+        with self._lock:
+            self._snapshots[role] = snapshot
+
+        if self.logger:
+            self.logger.info(f"Captured auth session for role '{role}' ({len(cookies)} cookies)")
+
+    def restore(self, driver, role):
+        """
+        Inject a cached session for a role into a browser.
+        The browser must be on the application origin; it is reloaded afterwards.
+
+        Args:
+            driver: WebDriver instance
+            role (str): Role key from the 'users' configuration
+
+        Returns:
+            bool: True if a valid snapshot was injected
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(role)
+
+        if snapshot is None:
+            return False
+
+        if snapshot.is_expired():
+            if self.logger:
+                self.logger.info(f"Cached auth session for role '{role}' expired, logging in again")
+            self.invalidate(role)
+            return False
+
+        try:
+            for cookie in snapshot.cookies:
+                driver.add_cookie(cookie)
+
+            driver.execute_script(RESTORE_STORAGE_SCRIPT, snapshot.local_storage, snapshot.session_storage)
+            driver.get(self.base_url)
+
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to restore auth session for role '{role}': {str(e)}")
+            self.invalidate(role)
+            return False
+
+        if self.logger:
+            self.logger.info(f"Restored cached auth session for role '{role}'")
+        return True
+
+    def snapshot(self, role):
+        """
+        Get the cached snapshot of a role, e.g. to reuse its cookies outside the browser.
+
+        Returns:
+            AuthSnapshot: Unexpired snapshot, or None
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(role)
+        if snapshot is None or snapshot.is_expired():
+            return None
+        return snapshot
+
+    def invalidate(self, role):
+        """Drop the cached snapshot for a role."""
+        with self._lock:
+            self._snapshots.pop(role, None)
@@ -0,0 +1,192 @@
+"""
+Browser pool utility for Mobinet NextGen automation framework.
+Keeps warm WebDriver instances alive for the whole session and resets state between tests.
+"""
+
+import threading
+from collections import deque
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+
+class BrowserPool:
+    """
+    Session-scoped pool of reusable WebDriver instances.
+    Hands out one browser per test, resets cookies, storage and windows on release,
+    and recycles instances that crashed, leak windows or exceed their reuse budget.
+    """
+
+    def __init__(self, driver_factory, size=1, max_reuse=25, max_js_heap_mb=None, logger=None):
+        """
+        Initialize browser pool.
+
+        Args:
+            driver_factory: Callable returning a new WebDriver instance
+            size (int): Maximum number of idle instances kept warm (0 disables reuse)
+            max_reuse (int): Number of tests an instance may serve before it is recycled
+            max_js_heap_mb (int): Recycle instances whose JS heap exceeds this size (Chrome only)
+            logger: Logger instance
+        """
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_reuse = max_reuse
+        self.max_js_heap_mb = max_js_heap_mb
+        self.logger = logger
+
+        self._idle = deque()
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Get a healthy browser from the pool, creating one if none is idle.
+
+        Returns:
+            WebDriver: Browser ready for a test
+        """
+        while True:
+            with self._lock:
+                driver = self._idle.popleft() if self._idle else None
+
+            if driver is None:
+                driver = self.driver_factory()
+                self._uses[id(driver)] = 0
+                if self.logger:
+                    self.logger.info("Browser pool created new browser instance")
+                break
+
+            if self.is_healthy(driver):
+                if self.logger:
+                    self.logger.debug(f"Browser pool reusing browser instance ({self._uses.get(id(driver), 0)} previous tests)")
+                break
+
+            self.discard(driver)
+
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        return driver
+
+    def release(self, driver):
+        """
+        Return a browser to the pool after a test.
+        The browser is reset, or quit if it is unhealthy or has reached its reuse budget.
+
+        Args:
+            driver: WebDriver instance previously returned by acquire()
+        """
+        if self._uses.get(id(driver), 0) >= self.max_reuse:
+            if self.logger:
+                self.logger.info(f"Browser instance reached reuse limit ({self.max_reuse}), recycling")
+            self.discard(driver)
+            return
+
+        if self._is_leaking(driver) or not self.reset_state(driver) or not self.is_healthy(driver):
+            self.discard(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+
+        self.discard(driver)
+
+    def discard(self, driver):
+        """Quit a browser and forget it."""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+            if self.logger:
+                self.logger.info("Closing browser")
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to quit browser cleanly: {str(e)}")
+
+    def shutdown(self):
+        """Quit all idle browsers at the end of the session."""
+        with self._lock:
+            drivers = list(self._idle)
+            self._idle.clear()
+
+        for driver in drivers:
+            self.discard(driver)
+
+    def reset_state(self, driver):
+        """
+        Reset browser state between tests.
+        Dismisses alerts, closes extra windows and clears storage and cookies.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the browser was reset successfully
+        """
+        try:
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+
+            # Chrome can drop cookies for every domain; other browsers only for the current one
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            else:
+                driver.delete_all_cookies()
+
+            driver.get("about:blank")
+
+            # Drop stubs and captured traffic of network-controlled browsers
+            network = getattr(driver, "network", None)
+            if network is not None:
+                network.reset()
+            return True
+
+        except WebDriverException as e:
+            if self.logger:
+                self.logger.warning(f"Failed to reset browser state, recycling instance: {str(e)}")
+            return False
+
+    def is_healthy(self, driver):
+        """
+        Check that a browser is still responsive and has a single window.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the browser can be reused
+        """
+        try:
+            return driver.execute_script("return 1") == 1 and len(driver.window_handles) == 1
+        except WebDriverException:
+            if self.logger:
+                self.logger.warning("Browser instance is not responding, recycling")
+            return False
+
+    def _is_leaking(self, driver):
+        """Check whether the browser JS heap has grown beyond the configured limit."""
+        if not self.max_js_heap_mb:
+            return False
+
+        try:
+            heap_bytes = driver.execute_script(
+                "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null"
+            )
+        except WebDriverException:
+            return True
+
+        if heap_bytes and heap_bytes > self.max_js_heap_mb * 1024 * 1024:
+            if self.logger:
+                self.logger.info(f"Browser JS heap {heap_bytes / 1024 / 1024:.0f} MB exceeds limit, recycling")
+            return True
+
+        return False
@@ -0,0 +1,269 @@
+"""
+Browser-side timing capture for Mobinet NextGen automation framework.
+Reads Navigation/Resource Timing and user-timing marks from the page so performance
+checks measure application latency instead of WebDriver round-trip overhead.
+"""
+
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from utils.wait_helpers import ACTIVITY_TRACKER_JS
+
+
+# API paths whose requests are correlated with the action that triggered them
+CODES_BY_LEVEL_REQUESTS = ("/codes/by-level",)
+SUBMIT_REQUESTS = ("/submit",)
+
+# Marks the action start and returns the browser clock, installing the DOM activity tracker.
+START_ACTION_SCRIPT = ACTIVITY_TRACKER_JS + """
+if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(2000);
+performance.mark('mobinet:' + arguments[0] + ':start');
+return performance.now();
+"""
+
+# Marks the action end and returns the resource, mark and DOM activity entries since it started.
+END_ACTION_SCRIPT = """
+var name = arguments[0], since = arguments[1], patterns = arguments[2];
+performance.mark('mobinet:' + name + ':end');
+
+var requests = performance.getEntriesByType('resource').filter(function (entry) {
+    if (entry.startTime < since) return false;
+    if (entry.initiatorType !== 'fetch' && entry.initiatorType !== 'xmlhttprequest') return false;
+    return patterns.some(function (pattern) { return entry.name.indexOf(pattern) !== -1; });
+}).map(function (entry) {
+    return {
+        url: entry.name,
+        start: entry.startTime,
+        request_start: entry.requestStart,
+        response_start: entry.responseStart,
+        response_end: entry.responseEnd,
+        duration: entry.duration,
+        transfer_size: entry.transferSize || 0
+    };
+});
+
+var marks = performance.getEntriesByType('mark').concat(performance.getEntriesByType('measure')).filter(function (entry) {
+    return entry.startTime >= since && entry.name.indexOf('mobinet:') !== 0;
+}).map(function (entry) {
+    return {name: entry.name, type: entry.entryType, start: entry.startTime, duration: entry.duration};
+});
+
+var activity = window.__mobinetActivity;
+return {
+    now: performance.now(),
+    last_mutation: activity ? activity.lastMutation : null,
+    requests: requests,
+    marks: marks
+};
+"""
+
+NAVIGATION_TIMING_SCRIPT = """
+var entry = performance.getEntriesByType('navigation')[0];
+if (!entry) return null;
+return {
+    url: entry.name,
+    ttfb: entry.responseStart - entry.requestStart,
+    response_end: entry.responseEnd,
+    dom_interactive: entry.domInteractive,
+    dom_content_loaded: entry.domContentLoadedEventEnd,
+    load_event_end: entry.loadEventEnd,
+    duration: entry.duration,
+    transfer_size: entry.transferSize || 0
+};
+"""
+
+
+class ActionTiming:
+    """
+    Timing of one UI action as seen by the browser and by Selenium.
+    All durations are in milliseconds.
+    """
+
+    __slots__ = ("name", "selenium_ms", "requests", "marks", "_start", "_last_mutation", "_end")
+
+    def __init__(self, name):
+        self.name = name
+        self.selenium_ms = 0.0
+        self.requests = []
+        self.marks = []
+        self._start = None
+        self._last_mutation = None
+        self._end = None
+
+    @property
+    def captured(self):
+        """Whether browser timings were read successfully."""
+        return self._end is not None
+
+    @property
+    def server_ms(self):
+        """Slowest correlated request from request sent to first response byte."""
+        waits = [
+            request['response_start'] - request['request_start']
+            for request in self.requests
+            if request['request_start'] and request['response_start']
+        ]
+        return max(waits) if waits else 0.0
+
+    @property
+    def network_ms(self):
+        """Slowest correlated request from fetch start to response end."""
+        return max((request['duration'] for request in self.requests), default=0.0)
+
+    @property
+    def render_ms(self):
+        """Time from the last correlated response to the last DOM update it caused."""
+        if not self.captured or self._last_mutation is None:
+            return 0.0
+        response_end = max((request['response_end'] for request in self.requests), default=self._start)
+        return max(0.0, self._last_mutation - response_end)
+
+    @property
+    def browser_ms(self):
+        """Browser-side latency from action start to its last response or DOM update (None if not captured)."""
+        if not self.captured:
+            return None
+        finished = max(
+            [request['response_end'] for request in self.requests]
+            + [self._last_mutation if self._last_mutation is not None else self._start]
+        )
+        return max(0.0, finished - self._start)
+
+    @property
+    def overhead_ms(self):
+        """Selenium-observed time not explained by browser-side work (None if not captured)."""
+        if not self.captured:
+            return None
+        return max(0.0, self.selenium_ms - self.browser_ms)
+
+    def as_dict(self):
+        """Serializable summary of the timing."""
+        return {
+            'name': self.name,
+            'selenium_ms': round(self.selenium_ms, 1),
+            'browser_ms': round(self.browser_ms, 1) if self.captured else None,
+            'server_ms': round(self.server_ms, 1),
+            'network_ms': round(self.network_ms, 1),
+            'render_ms': round(self.render_ms, 1),
+            'overhead_ms': round(self.overhead_ms, 1) if self.captured else None,
+            'requests': len(self.requests),
+            'marks': [mark['name'] for mark in self.marks]
+        }
+
+    def describe(self):
+        """One-line breakdown for logs."""
+        if not self.captured:
+            return f"{self.name}: browser timings not captured, selenium {self.selenium_ms:.0f}ms"
+        return (f"{self.name}: browser {self.browser_ms:.0f}ms (server {self.server_ms:.0f}ms, "
+                f"render {self.render_ms:.0f}ms, {len(self.requests)} requests), "
+                f"selenium {self.selenium_ms:.0f}ms")
+
+    def _finish(self, start, result):
+        """Attach the browser-side entries read after the action."""
+        self._start = start
+        self._end = result['now']
+        self._last_mutation = result['last_mutation']
+        self.requests = result['requests']
+        self.marks = result['marks']
+
+
+class BrowserTimingCollector:
+    """
+    Collects browser-side timings for UI actions.
+    Wrap an action in measure() and the collector correlates the XHR/fetch requests
+    it triggered with the DOM updates that followed them.
+    """
+
+    def __init__(self, driver, logger=None):
+        """
+        Initialize browser timing collector.
+
+        Args:
+            driver: WebDriver instance
+            logger: Logger instance
+        """
+        self.driver = driver
+        self.logger = logger
+        self.timings = []
+
+    @contextmanager
+    def measure(self, name, requests=()):
+        """
+        Measure a UI action.
+        The action should include its own wait for the UI to settle, so the DOM
+        updates caused by the correlated responses have happened when it returns.
+        Intended for in-page actions; use navigation_timing() for full page loads.
+
+        Args:
+            name (str): Action name
+            requests (tuple): URL substrings of the requests to correlate (e.g. '/codes/by-level')
+
+        Yields:
+            ActionTiming: Filled in when the block exits
+        """
+        timing = ActionTiming(name)
+        start = self._execute(START_ACTION_SCRIPT, name)
+        started_at = time.perf_counter()
+
+        try:
+            yield timing
+        finally:
+            timing.selenium_ms = (time.perf_counter() - started_at) * 1000
+
+            if start is not None:
+                result = self._execute(END_ACTION_SCRIPT, name, start, list(requests))
+                if result:
+                    timing._finish(start, result)
+
+            self.timings.append(timing)
+
+            if self.logger:
+                self.logger.debug("Browser timing - %s", timing.describe())
+
+    def navigation_timing(self):
+        """
+        Get Navigation Timing for the current document.
+
+        Returns:
+            dict: Timing values in milliseconds, or None if unavailable
+        """
+        return self._execute(NAVIGATION_TIMING_SCRIPT)
+
+    def timings_for(self, name):
+        """Get all recorded timings of an action."""
+        return [timing for timing in self.timings if timing.name == name]
+
+    def summary(self):
+        """
+        Summarize recorded timings per action.
+
+        Returns:
+            dict: Action name to averages of browser, server, render and Selenium time (ms)
+        """
+        summary = {}
+
+        for name in dict.fromkeys(timing.name for timing in self.timings):
+            timings = [timing for timing in self.timings_for(name) if timing.captured]
+            if not timings:
+                continue
+
+            count = len(timings)
+            summary[name] = {
+                'count': count,
+                'browser_ms': sum(timing.browser_ms for timing in timings) / count,
+                'server_ms': sum(timing.server_ms for timing in timings) / count,
+                'render_ms': sum(timing.render_ms for timing in timings) / count,
+                'selenium_ms': sum(timing.selenium_ms for timing in timings) / count,
+                'max_browser_ms': max(timing.browser_ms for timing in timings)
+            }
+
+        return summary
+
+    def _execute(self, script, *args):
+        """Run a timing script, tolerating pages where it cannot run."""
+        try:
+            return self.driver.execute_script(script, *args)
+        except WebDriverException as e:
+            if self.logger:
+                self.logger.warning(f"Browser timing capture failed: {str(e)}")
+            return None
@@ -0,0 +1,212 @@
+"""
+Configuration loading for Mobinet NextGen automation framework.
+Parses config.yaml once per file version into an immutable mapping, applies
+environment variable overlays and shares the parsed data with xdist workers.
+"""
+
+import hashlib
+import os
+import threading
+from collections.abc import Mapping
+
+import yaml
+
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "config.yaml")
+
+
+def _parse_bool(value):
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Environment variable -> (section, key, converter) applied on top of the file
+ENV_OVERLAYS = {
+    'SELENIUM_BROWSER': ('browser', 'name', str),
+    'HEADLESS': ('browser', 'headless', _parse_bool),
+    'MOBINET_BASE_URL': ('environment', 'base_url', str),
+    'MOBINET_API_BASE_URL': ('environment', 'api_base_url', str),
+}
+
+# Parsed files: path -> (mtime_ns, size, sha256, FrozenConfig)
+_cache = {}
+_cache_lock = threading.Lock()
+
+# Overlaid configurations: (path, sha256, overrides) -> FrozenConfig
+_overlay_cache = {}
+
+
+def _freeze(value):
+    """Convert parsed YAML into immutable containers."""
+    if isinstance(value, Mapping):
+        return FrozenConfig(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Convert immutable containers back into plain dicts and lists."""
+    if isinstance(value, FrozenConfig):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _merge(base, overrides):
+    """Deep-merge plain dicts, overrides winning."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class FrozenConfig(Mapping):
+    """
+    Immutable, read-only view of a configuration section.
+    Nested sections are frozen once at construction, so lookups such as
+    config['browser']['explicit_wait'] are plain dict accesses.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data=None):
+        object.__setattr__(self, '_data', {key: _freeze(value) for key, value in (data or {}).items()})
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenConfig is immutable; use with_overrides()")
+
+    def __repr__(self):
+        return f"FrozenConfig({self._data!r})"
+
+    def __reduce__(self):
+        return (FrozenConfig, (self.to_dict(),))
+
+    def to_dict(self):
+        """Get a mutable deep copy as plain dicts and lists."""
+        return {key: _thaw(value) for key, value in self._data.items()}
+
+    def with_overrides(self, overrides):
+        """
+        Get a copy with nested values replaced.
+
+        Args:
+            overrides (dict): Nested mapping of values to replace, e.g. {'browser': {'headless': True}}
+
+        Returns:
+            FrozenConfig: New configuration
+        """
+        if not overrides:
+            return self
+        return FrozenConfig(_merge(self.to_dict(), overrides))
+
+
+def env_overrides(environ=None):
+    """
+    Collect configuration overrides from environment variables.
+
+    Args:
+        environ (dict): Environment (default: os.environ)
+
+    Returns:
+        dict: Nested overrides for with_overrides()
+    """
+    environ = os.environ if environ is None else environ
+    overrides = {}
+
+    for variable, (section, key, convert) in ENV_OVERLAYS.items():
+        value = environ.get(variable)
+        if value:
+            overrides.setdefault(section, {})[key] = convert(value)
+
+    return overrides
+
+
+def load_config(path=DEFAULT_CONFIG_PATH, environ=None):
+    """
+    Load a configuration file with environment overlays.
+    The file is parsed only when its mtime/size and content hash change.
+
+    Args:
+        path (str): YAML configuration file
+        environ (dict): Environment used for overlays (default: os.environ)
+
+    Returns:
+        FrozenConfig: Immutable configuration
+    """
+    config = _load_file(path)
+    overrides = env_overrides(environ)
+    if not overrides:
+        return config
+
+    key = (os.path.abspath(path), _cache[os.path.abspath(path)][2], repr(overrides))
+    overlaid = _overlay_cache.get(key)
+    if overlaid is None:
+        overlaid = _overlay_cache[key] = config.with_overrides(overrides)
+    return overlaid
+
+
+def shared_config_state(path=DEFAULT_CONFIG_PATH):
+    """
+    Get the parsed file state for handing to pytest-xdist workers (plain, picklable data).
+
+    Returns:
+        dict: Parsed data with the file version it was parsed from
+    """
+    _load_file(path)
+    mtime_ns, size, digest, config = _cache[os.path.abspath(path)]
+    return {'path': path, 'mtime_ns': mtime_ns, 'size': size, 'sha256': digest, 'data': config.to_dict()}
+
+
+def prime_config(state):
+    """
+    Seed the cache with state from shared_config_state() so the file is not parsed again.
+
+    Args:
+        state (dict): Shared state from the controller process
+    """
+    with _cache_lock:
+        _cache[os.path.abspath(state['path'])] = (
+            state['mtime_ns'], state['size'], state['sha256'], FrozenConfig(state['data'])
+        )
+
+
+def _load_file(path):
+    """Get the parsed file, re-reading it only when it changed on disk."""
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[3]
+
+        with open(key, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+
+        if cached and cached[2] == digest:
+            config = cached[3]
+        else:
+            config = FrozenConfig(yaml.safe_load(content) or {})
+
+        _cache[key] = (stat.st_mtime_ns, stat.st_size, digest, config)
+        return config
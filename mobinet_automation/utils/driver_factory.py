@@ -0,0 +1,118 @@
+"""
+WebDriver factory for Mobinet NextGen automation framework.
+Builds configured Chrome and Firefox instances from the browser configuration.
+"""
+
+import socket
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from utils.driver_resolver import DriverResolver
+from utils.trace_capture import apply_chrome_capture_options
+
+
+def _seleniumwire_options(network_config):
+    """selenium-wire options keeping the proxy cheap: in-memory, bounded, uncompressed capture."""
+    return {
+        'request_storage': 'memory',
+        'request_storage_max_size': network_config.get('max_stored_requests', 1000),
+        'disable_encoding': True,
+        'exclude_hosts': list(network_config.get('exclude_hosts', [])),
+        'suppress_connection_errors': True,
+    }
+
+
+def _enable_proxy_nodelay():
+    """
+    Set TCP_NODELAY on browser connections to the selenium-wire proxy.
+    The proxy writes response headers and body separately, so with Nagle enabled every
+    keep-alive response stalls on the browser's delayed ACK (~40ms per API call).
+    """
+    from seleniumwire.thirdparty.mitmproxy.net import tcp
+
+    connection_thread = tcp.TCPServer.connection_thread
+    if getattr(connection_thread, 'nodelay', False):
+        return
+
+    def nodelay_connection_thread(self, connection, client_address):
+        try:
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        return connection_thread(self, connection, client_address)
+
+    nodelay_connection_thread.nodelay = True
+    tcp.TCPServer.connection_thread = nodelay_connection_thread
+
+
+def create_driver(browser_config, logger=None, network_config=None, capture_config=None):
+    """
+    Create a WebDriver instance based on browser configuration.
+    Supports Chrome and Firefox browsers with configurable options.
+
+    Args:
+        browser_config (dict): 'browser' section of the configuration
+        logger: Logger instance (optional)
+        network_config (dict): 'network' section; when enabled the browser is routed
+            through selenium-wire so its API calls can be stubbed, delayed and recorded
+        capture_config (dict): performance.trace_capture section; when given, Chrome logs
+            DevTools trace and network events for TraceCapture
+
+    Returns:
+        WebDriver: Configured WebDriver instance
+    """
+    browser_name = browser_config['name'].lower()
+    resolver = DriverResolver(lockfile=browser_config.get('driver_lockfile'), logger=logger)
+
+    wire_options = None
+    browsers = webdriver
+    if network_config and network_config.get('enabled'):
+        from seleniumwire import webdriver as browsers
+        _enable_proxy_nodelay()
+        wire_options = {'seleniumwire_options': _seleniumwire_options(network_config)}
+
+    if logger:
+        logger.info(f"Initializing {browser_name} browser{' with network control' if wire_options else ''}")
+
+    if browser_name == "chrome":
+        options = ChromeOptions()
+        if browser_config['headless']:
+            options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={browser_config['window_size']}")
+        options.add_argument("--disable-web-security")
+        options.add_argument("--allow-running-insecure-content")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        if capture_config is not None:
+            apply_chrome_capture_options(options, capture_config)
+
+        service = ChromeService(resolver.resolve(browser_name))
+        driver_instance = browsers.Chrome(service=service, options=options, **(wire_options or {}))
+
+    elif browser_name == "firefox":
+        if capture_config is not None and logger:
+            logger.warning("Trace capture needs the ChromeDriver performance log; Firefox runs without it")
+        options = FirefoxOptions()
+        if browser_config['headless']:
+            options.add_argument("--headless")
+        options.add_argument(f"--width={browser_config['window_size'].split(',')[0]}")
+        options.add_argument(f"--height={browser_config['window_size'].split(',')[1]}")
+
+        service = FirefoxService(resolver.resolve(browser_name))
+        driver_instance = browsers.Firefox(service=service, options=options, **(wire_options or {}))
+
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+
+    # Configure timeouts; in explicit mode the framework owns all waiting
+    if browser_config.get('wait_mode', 'explicit') == 'explicit':
+        driver_instance.implicitly_wait(0)
+    else:
+        driver_instance.implicitly_wait(browser_config['implicit_wait'])
+    driver_instance.set_page_load_timeout(browser_config['page_load_timeout'])
+
+    return driver_instance
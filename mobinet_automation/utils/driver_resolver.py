@@ -0,0 +1,253 @@
+"""
+Driver binary resolution for Mobinet NextGen automation framework.
+Resolves chromedriver/geckodriver once per machine and records the result in a local lockfile.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from datetime import datetime
+
+
+DEFAULT_LOCKFILE = os.path.join(os.path.expanduser("~"), ".cache", "mobinet_automation", "drivers.lock.json")
+
+BROWSER_BINARIES = {
+    "chrome": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"],
+    "firefox": ["firefox"],
+}
+
+# Application bundles/install locations not on PATH (macOS, Windows)
+BROWSER_APP_PATHS = {
+    "chrome": [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+        os.path.expanduser("~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
+    ],
+    "firefox": [
+        "/Applications/Firefox.app/Contents/MacOS/firefox",
+        os.path.expanduser("~/Applications/Firefox.app/Contents/MacOS/firefox"),
+    ],
+}
+
+# Windows registry values holding the installed version (browsers there print nothing for --version)
+BROWSER_REGISTRY_KEYS = {
+    "chrome": [
+        ("HKEY_CURRENT_USER", r"Software\Google\Chrome\BLBeacon", "version"),
+        ("HKEY_LOCAL_MACHINE", r"Software\Google\Chrome\BLBeacon", "version"),
+        ("HKEY_LOCAL_MACHINE", r"Software\WOW6432Node\Google\Chrome\BLBeacon", "version"),
+    ],
+    "firefox": [
+        ("HKEY_LOCAL_MACHINE", r"Software\Mozilla\Mozilla Firefox", "CurrentVersion"),
+        ("HKEY_CURRENT_USER", r"Software\Mozilla\Mozilla Firefox", "CurrentVersion"),
+        ("HKEY_LOCAL_MACHINE", r"Software\WOW6432Node\Mozilla\Mozilla Firefox", "CurrentVersion"),
+    ],
+}
+
+
+class DriverResolver:
+    """
+    Resolves WebDriver binaries without touching webdriver_manager on the hot path.
+    The browser version to driver path mapping is stored in a lockfile and validated
+    by SHA-256, so later sessions resolve fully offline.
+    """
+
+    _memo = {}
+    _memo_lock = threading.Lock()
+
+    def __init__(self, lockfile=None, logger=None):
+        """
+        Initialize driver resolver.
+
+        Args:
+            lockfile (str): Path to the lockfile (defaults to ~/.cache/mobinet_automation)
+            logger: Logger instance
+        """
+        self.lockfile = lockfile or os.environ.get("MOBINET_DRIVER_LOCKFILE", DEFAULT_LOCKFILE)
+        self.logger = logger
+
+    def resolve(self, browser_name):
+        """
+        Get the driver binary path for the installed browser.
+        Resolution happens at most once per process; the lockfile makes it once per machine.
+        When the browser version cannot be detected nothing is locked, since an entry
+        without a version would keep serving the old driver after a browser upgrade.
+
+        Args:
+            browser_name (str): 'chrome' or 'firefox'
+
+        Returns:
+            str: Absolute path to the driver binary
+        """
+        browser_name = browser_name.lower()
+
+        with self._memo_lock:
+            if browser_name in self._memo:
+                return self._memo[browser_name]
+
+            browser_version = self.detect_browser_version(browser_name)
+
+            if browser_version is None:
+                if self.logger:
+                    self.logger.warning(f"Could not detect the {browser_name} version, resolving the driver online")
+                driver_path = self._install(browser_name)
+            else:
+                key = f"{browser_name}:{browser_version}"
+                driver_path = self._lookup(key)
+                if not driver_path:
+                    driver_path = self._install(browser_name)
+                    self._record(key, driver_path)
+
+            self._memo[browser_name] = driver_path
+            return driver_path
+
+    def detect_browser_version(self, browser_name):
+        """
+        Detect the installed browser version without network access: from the Windows
+        registry, or from the binary on PATH or in the macOS application bundle.
+
+        Args:
+            browser_name (str): 'chrome' or 'firefox'
+
+        Returns:
+            str: Version string (e.g. '120.0.6099.109') or None if not detectable
+        """
+        if sys.platform == "win32":
+            version = _registry_version(browser_name)
+            if version:
+                return version
+
+        executables = [shutil.which(binary) for binary in BROWSER_BINARIES.get(browser_name, [])]
+        executables += [path for path in BROWSER_APP_PATHS.get(browser_name, []) if os.path.isfile(path)]
+
+        for executable in executables:
+            if not executable:
+                continue
+
+            try:
+                output = subprocess.run(
+                    [executable, "--version"],
+                    capture_output=True, text=True, timeout=10
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+
+            match = re.search(r"(\d+(?:\.\d+)+)", output)
+            if match:
+                return match.group(1)
+
+        return None
+
+    def warm(self, browser_names=("chrome", "firefox")):
+        """
+        Pre-populate the lockfile for the given browsers (used on CI images).
+
+        Args:
+            browser_names (tuple): Browsers to resolve
+
+        Returns:
+            dict: Browser name to driver path (None when resolution failed)
+        """
+        resolved = {}
+
+        for browser_name in browser_names:
+            try:
+                resolved[browser_name] = self.resolve(browser_name)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Could not resolve driver for {browser_name}: {str(e)}")
+                resolved[browser_name] = None
+
+        return resolved
+
+    def _lookup(self, key):
+        """Return the locked driver path for a key if the binary is still intact."""
+        entry = self._read_lockfile().get(key)
+        if not entry:
+            return None
+
+        driver_path = entry.get("path")
+        if not driver_path or not os.path.isfile(driver_path):
+            if self.logger:
+                self.logger.warning(f"Locked driver missing for {key}: {driver_path}")
+            return None
+
+        if _file_sha256(driver_path) != entry.get("sha256"):
+            if self.logger:
+                self.logger.warning(f"Locked driver hash mismatch for {key}, re-resolving")
+            return None
+
+        if self.logger:
+            self.logger.debug(f"Using locked driver for {key}: {driver_path}")
+        return driver_path
+
+    def _install(self, browser_name):
+        """Resolve the driver through webdriver_manager (may use the network)."""
+        if self.logger:
+            self.logger.info(f"Resolving {browser_name} driver through webdriver_manager")
+
+        if browser_name == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        elif browser_name == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+
+        raise ValueError(f"Unsupported browser: {browser_name}")
+
+    def _record(self, key, driver_path):
+        """Write the resolved driver into the lockfile atomically."""
+        lock_data = self._read_lockfile()
+        lock_data[key] = {
+            "path": os.path.abspath(driver_path),
+            "sha256": _file_sha256(driver_path),
+            "resolved_at": datetime.now().isoformat()
+        }
+
+        os.makedirs(os.path.dirname(self.lockfile), exist_ok=True)
+        temp_path = f"{self.lockfile}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(lock_data, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.lockfile)
+
+        if self.logger:
+            self.logger.info(f"Recorded driver for {key} in {self.lockfile}")
+
+    def _read_lockfile(self):
+        """Read the lockfile, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.lockfile, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def _registry_version(browser_name):
+    """Read the browser version from the Windows registry, None if not installed."""
+    import winreg
+
+    for hive, path, value_name in BROWSER_REGISTRY_KEYS.get(browser_name, []):
+        try:
+            with winreg.OpenKey(getattr(winreg, hive), path) as key:
+                value, _ = winreg.QueryValueEx(key, value_name)
+        except OSError:
+            continue
+
+        match = re.search(r"(\d+(?:\.\d+)+)", str(value))
+        if match:
+            return match.group(1)
+
+    return None
+
+
+def _file_sha256(path):
+    """Compute the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
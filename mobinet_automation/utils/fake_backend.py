@@ -0,0 +1,931 @@
+"""
+Local stand-in backend for Mobinet NextGen automation framework.
+Serves the /non-payment-reasons API from code_basic/src/api/nonPaymentReason.ts and a
+minimal application page exposing the DOM used by the page objects, so the suite can
+run hermetically against 127.0.0.1 on a free port.
+"""
+
+import json
+import random
+import secrets
+import threading
+import time
+from datetime import datetime
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+API_PREFIX = "/api"
+REASONS_PATH = "/non-payment-reasons"
+INTEGRATIONS_PATH = "/integrations"
+SESSION_COOKIE = "mobinet_session"
+
+# Fixed timestamp for reason codes so responses are byte-for-byte reproducible
+CODES_TIMESTAMP = "2024-01-01T00:00:00Z"
+
+COMPLETE_INFORMATION_MESSAGE = "Please enter complete information"
+NOTES_MAX_LENGTH = 500
+
+# External systems a submitted record is synchronized to (keys of external_systems in config.yaml)
+EXTERNAL_SYSTEMS = ("customer_debt_management", "customer_management", "customer_care_platform")
+
+DISCONNECT_OPTION1_CHOICES = [
+    ("option1", "Option 1: Disconnect according to standard schedule"),
+    ("option2", "Option 2: Disconnect after Option 1 and until end of month disconnect completely"),
+]
+DISCONNECT_OPTION2_CHOICES = [
+    ("cancel", "Cancel disconnect schedule"),
+    ("date", "Select specific disconnect date"),
+]
+
+
+class FakeBackend:
+    """
+    Threaded HTTP server emulating the Mobinet NextGen application and API.
+    Latency and failures can be injected globally (error_rate) or per path (fail_next).
+    """
+
+    def __init__(self, users, reason_hierarchies, default_contract_id="", host="127.0.0.1", port=0,
+                 latency_ms=0, latency_jitter_ms=0, error_rate=0.0, error_status=500, seed=0,
+                 sync_delay_ms=None, logger=None):
+        """
+        Initialize fake backend.
+
+        Args:
+            users (dict): 'users' section of the configuration (username, password, role)
+            reason_hierarchies (list): Objects or tuples with level1, level2, level3 names
+            default_contract_id (str): Contract the page submits for when none is given in the URL
+            host (str): Bind address
+            port (int): Bind port (0 picks a free port)
+            latency_ms (int): Delay added to every API response
+            latency_jitter_ms (int): Random extra delay (0..jitter) added to API responses
+            error_rate (float): Probability (0-1) that an API request fails with error_status
+            error_status (int): HTTP status used for injected failures
+            seed (int): Seed for latency jitter and error injection
+            sync_delay_ms (dict): External system -> delay before a new record reports as synced
+            logger: Logger instance
+        """
+        self.users = users
+        self.default_contract_id = default_contract_id
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.sync_delay_ms = {system: 0 for system in EXTERNAL_SYSTEMS}
+        self.sync_delay_ms.update(sync_delay_ms or {})
+        self.logger = logger
+
+        self.codes = build_reason_codes(reason_hierarchies)
+        self._codes_by_id = {code['id']: code for code in self.codes}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._records = {}
+        self._record_count = 0
+        self._submitted_at = {}
+        self._forced_failures = []
+
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """Application URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def api_base_url(self):
+        """API URL of the running server."""
+        return f"{self.base_url}{API_PREFIX}"
+
+    def status_url(self, system):
+        """Sync status URL template of an external system ({record_id} is filled in by the poller)."""
+        return f"{self.api_base_url}{INTEGRATIONS_PATH}/{system}/status/{{record_id}}"
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._server = ThreadingHTTPServer((self.host, self.port), _FakeBackendHandler)
+        self._server.daemon_threads = True
+        self._server.backend = self
+        self.port = self._server.server_address[1]
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-backend", daemon=True)
+        self._thread.start()
+
+        if self.logger:
+            self.logger.info(f"Fake backend listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        """Stop the server and release the port."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        if self.logger:
+            self.logger.info("Fake backend stopped")
+
+    def reset(self):
+        """Clear submitted records, sessions and pending injected failures."""
+        with self._lock:
+            self._records.clear()
+            self._submitted_at.clear()
+            self._sessions.clear()
+            self._forced_failures.clear()
+            self._record_count = 0
+
+    def fail_next(self, path_prefix, status=500, count=1):
+        """
+        Make the next matching API requests fail.
+
+        Args:
+            path_prefix (str): API path prefix without '/api' (e.g. '/non-payment-reasons/submit')
+            status (int): HTTP status to return
+            count (int): Number of requests to fail
+        """
+        with self._lock:
+            self._forced_failures.append([path_prefix, status, count])
+
+    def records_for(self, contract_id):
+        """Get submitted records for a contract, oldest first."""
+        with self._lock:
+            return list(self._records.get(contract_id, []))
+
+    # Request handling (called from server threads)
+
+    def injected_failure(self, path):
+        """Get the status of an injected failure for an API path, or None."""
+        with self._lock:
+            for failure in self._forced_failures:
+                if path.startswith(failure[0]):
+                    failure[2] -= 1
+                    if failure[2] <= 0:
+                        self._forced_failures.remove(failure)
+                    return failure[1]
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def response_delay(self):
+        """Get the delay in seconds for an API response."""
+        with self._lock:
+            jitter = self._random.uniform(0, self.latency_jitter_ms) if self.latency_jitter_ms else 0
+        return (self.latency_ms + jitter) / 1000.0
+
+    def login(self, username, password):
+        """Create a session for valid credentials; returns the token or None."""
+        for role_key, user in self.users.items():
+            if user.get('username') == username and user.get('password') == password:
+                token = secrets.token_hex(16)
+                with self._lock:
+                    self._sessions[token] = role_key
+                return token
+        return None
+
+    def logout(self, token):
+        """Drop a session."""
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def session_user(self, token):
+        """Get the public user info of a session, or None."""
+        with self._lock:
+            role_key = self._sessions.get(token)
+        if not role_key:
+            return None
+
+        user = self.users[role_key]
+        return {
+            'username': user['username'],
+            'name': user['username'].split('@')[0],
+            'role': user['role'],
+            'roleKey': role_key,
+            'staffId': f"STAFF-{role_key.upper()}"
+        }
+
+    def query_codes(self, level=None, parent_id=None):
+        """Filter reason codes by level and parent."""
+        return [
+            code for code in self.codes
+            if (level is None or code['level'] == level)
+            and (parent_id is None or code.get('parentId') == parent_id)
+        ]
+
+    def submit(self, data, user):
+        """
+        Validate and store a submission.
+
+        Returns:
+            tuple: (record, errors)
+        """
+        errors = self.validate_submission(data)
+        if errors:
+            return None, errors
+
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._record_count += 1
+            record_id = f"NPR-{self._record_count:06d}"
+
+        record = {
+            'id': record_id,
+            'contractId': data['contractId'],
+            'submissionDate': now,
+            'staffId': data['staffId'],
+            'staffName': user['name'],
+            'staffCode': user['staffId'],
+            'reasonLevel1': data['reasonLevel1'],
+            'reasonLevel1Name': self._code_name(data['reasonLevel1']),
+            'reasonLevel2': data['reasonLevel2'],
+            'reasonLevel2Name': self._code_name(data['reasonLevel2']),
+            'reasonLevel3': data.get('reasonLevel3'),
+            'reasonLevel3Name': self._code_name(data.get('reasonLevel3')),
+            'notes': data['notes'],
+            'channel': data.get('channel'),
+            'scheduledDate': data.get('scheduledDate'),
+            'scheduledTime': data.get('scheduledTime'),
+            'lockDate': data.get('lockDate'),
+            'lockType': data.get('lockType'),
+            'cancelLock': bool(data.get('cancelLock')),
+            'syncedToCustomerCare': True,
+            'syncedToDebtManagement': True,
+            'createdAt': now,
+            'updatedAt': now
+        }
+
+        with self._lock:
+            self._records.setdefault(record['contractId'], []).append(record)
+            self._submitted_at[record_id] = time.monotonic()
+        return record, []
+
+    def validate_submission(self, data):
+        """Mirror NonPaymentReasonAPI.validateSubmission plus Level 3 and notes length rules."""
+        errors = []
+
+        for field in ('contractId', 'reasonLevel1', 'reasonLevel2', 'staffId'):
+            if not data.get(field):
+                errors.append(COMPLETE_INFORMATION_MESSAGE)
+                break
+
+        level2 = data.get('reasonLevel2')
+        if level2 and self.query_codes(level=3, parent_id=level2) and not data.get('reasonLevel3'):
+            errors.append(f"{COMPLETE_INFORMATION_MESSAGE}: Level 3 reason is required")
+
+        notes = (data.get('notes') or '').strip()
+        if not notes:
+            errors.append(f"{COMPLETE_INFORMATION_MESSAGE}: Notes are required")
+        elif len(notes) > NOTES_MAX_LENGTH:
+            errors.append(f"Notes are too long (maximum length is {NOTES_MAX_LENGTH} characters)")
+
+        if data.get('lockDate') and not data.get('cancelLock'):
+            lock_error = _validate_lock_date(data['lockDate'])
+            if lock_error:
+                errors.append(lock_error)
+            elif not data.get('lockType'):
+                errors.append("Lock type is required when setting lock date")
+
+        return errors
+
+    def history(self, contract_id, month, year):
+        """Records of a contract submitted in a month."""
+        return [
+            record for record in self.records_for(contract_id)
+            if record['submissionDate'].startswith(f"{year:04d}-{month:02d}")
+        ]
+
+    def sync_status(self, system, record_id):
+        """
+        Sync status of a record in an external system; records report as synced
+        once the system's sync delay has passed since submission.
+
+        Returns:
+            dict: Status, or None for unknown systems and records
+        """
+        with self._lock:
+            submitted_at = self._submitted_at.get(record_id)
+        if system not in self.sync_delay_ms or submitted_at is None:
+            return None
+
+        remaining = self.sync_delay_ms[system] / 1000.0 - (time.monotonic() - submitted_at)
+        return {'system': system, 'recordId': record_id, 'synced': remaining <= 0}
+
+    def page_html(self):
+        """Render the application page."""
+        page_config = {
+            'apiBase': API_PREFIX + REASONS_PATH,
+            'authBase': API_PREFIX + "/auth",
+            'defaultContractId': self.default_contract_id,
+            'disconnectOption1': DISCONNECT_OPTION1_CHOICES,
+            'disconnectOption2': DISCONNECT_OPTION2_CHOICES
+        }
+        return APP_PAGE_HTML.replace("__MOBINET_CONFIG__", json.dumps(page_config))
+
+    def _code_name(self, code_id):
+        """Get the display name of a reason code."""
+        code = self._codes_by_id.get(code_id)
+        return code['name'] if code else None
+
+
+def build_reason_codes(reason_hierarchies):
+    """
+    Build ReasonCode records from reason hierarchies.
+
+    Args:
+        reason_hierarchies (list): Objects with level1/level2/level3 attributes or (l1, l2, l3) tuples
+
+    Returns:
+        list: ReasonCode dicts in first-seen order
+    """
+    codes = []
+    ids = {}
+
+    def add(path, level, parent_id):
+        if path in ids:
+            return ids[path]
+        code_id = f"R{level}-{len(ids) + 1:03d}"
+        ids[path] = code_id
+        codes.append({
+            'id': code_id,
+            'code': code_id,
+            'name': path[-1],
+            'level': level,
+            'parentId': parent_id,
+            'active': True,
+            'createdAt': CODES_TIMESTAMP,
+            'updatedAt': CODES_TIMESTAMP
+        })
+        return code_id
+
+    for hierarchy in reason_hierarchies:
+        if isinstance(hierarchy, (tuple, list)):
+            names = list(hierarchy) + [None] * (3 - len(hierarchy))
+        else:
+            names = [hierarchy.level1, hierarchy.level2, hierarchy.level3]
+
+        parent_id = None
+        for level, name in enumerate(names, start=1):
+            if not name:
+                break
+            parent_id = add(tuple(names[:level]), level, parent_id)
+
+    return codes
+
+
+def _validate_lock_date(lock_date):
+    """Mirror NonPaymentReasonAPI.validateLockDate; returns an error message or None."""
+    message = ("Chỉ cho phép cập nhật lịch khóa từ ngày 13 đến cuối tháng và không cho phép "
+               "chọn ngày khóa nhỏ hơn hoặc bằng ngày hiện tại.")
+    try:
+        date_obj = datetime.fromisoformat(str(lock_date)[:10])
+    except ValueError:
+        return message
+
+    if date_obj.day < 13 or date_obj.date() <= datetime.now().date():
+        return message
+    return None
+
+
+class _FakeBackendHandler(BaseHTTPRequestHandler):
+    """Routes requests to the FakeBackend attached to the server."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "MobinetFakeBackend/1.0"
+    # Headers and body are written separately; without TCP_NODELAY keep-alive clients wait on delayed ACKs
+    disable_nagle_algorithm = True
+
+    @property
+    def backend(self):
+        return self.server.backend
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def log_message(self, format, *args):
+        """Route access logs to the framework logger instead of stderr."""
+        if self.backend.logger:
+            self.backend.logger.debug("Fake backend: " + format, *args)
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if not url.path.startswith(API_PREFIX + "/"):
+            if method == "GET":
+                self._send(200, self.backend.page_html().encode("utf-8"), "text/html; charset=utf-8")
+            else:
+                self._send_json(405, {'success': False, 'message': "Method not allowed"})
+            return
+
+        path = url.path[len(API_PREFIX):]
+
+        delay = self.backend.response_delay()
+        if delay:
+            time.sleep(delay)
+
+        status = self.backend.injected_failure(path)
+        if status:
+            self._send_json(status, {'success': False, 'message': "Injected failure", 'errors': [f"HTTP {status}"]})
+            return
+
+        try:
+            body = self._read_json() if method == "POST" else {}
+            self._route(method, path, query, body)
+        except ValueError as e:
+            self._send_json(400, {'success': False, 'message': str(e)})
+
+    def _route(self, method, path, query, body):
+        token = self._session_token()
+        user = self.backend.session_user(token) if token else None
+
+        if path == "/auth/login" and method == "POST":
+            new_token = self.backend.login(body.get('username'), body.get('password'))
+            if not new_token:
+                self._send_json(401, {'success': False, 'message': "Invalid username or password"})
+                return
+            cookie = f"{SESSION_COOKIE}={new_token}; Path=/; HttpOnly; SameSite=Lax"
+            self._send_json(200, {'success': True, 'data': self.backend.session_user(new_token)}, cookie=cookie)
+            return
+
+        if path == "/auth/logout" and method == "POST":
+            if token:
+                self.backend.logout(token)
+            self._send_json(200, {'success': True, 'data': None}, cookie=f"{SESSION_COOKIE}=; Path=/; Max-Age=0")
+            return
+
+        if not user:
+            self._send_json(401, {'success': False, 'message': "Authentication required"})
+            return
+
+        if path == "/auth/session":
+            self._send_json(200, {'success': True, 'data': user})
+            return
+
+        if path.startswith(INTEGRATIONS_PATH + "/") and method == "GET":
+            parts = path[len(INTEGRATIONS_PATH) + 1:].split("/")
+            status = self.backend.sync_status(parts[0], parts[2]) if len(parts) == 3 and parts[1] == "status" else None
+            if status is None:
+                self._send_json(404, {'success': False, 'message': "Not found"})
+            else:
+                self._send_json(200, {'success': True, 'data': status})
+            return
+
+        if not path.startswith(REASONS_PATH):
+            self._send_json(404, {'success': False, 'message': "Not found"})
+            return
+
+        resource = path[len(REASONS_PATH):]
+
+        if method == "GET" and resource in ("/codes", "/codes/by-level"):
+            level = int(query['level']) if query.get('level') else None
+            if resource == "/codes/by-level" and level is None:
+                raise ValueError("level is required")
+            self._send_json(200, {'success': True, 'data': self.backend.query_codes(level, query.get('parentId'))})
+
+        elif method == "POST" and resource == "/submit":
+            record, errors = self.backend.submit(body, user)
+            if errors:
+                self._send_json(400, {'success': False, 'message': errors[0], 'errors': errors})
+            else:
+                self._send_json(200, {'success': True, 'data': record})
+
+        elif method == "GET" and resource == "/history":
+            if not query.get('contractId'):
+                raise ValueError("contractId is required")
+            now = datetime.now()
+            records = self.backend.history(
+                query['contractId'],
+                int(query.get('month', now.month)),
+                int(query.get('year', now.year))
+            )
+            self._send_json(200, {'success': True, 'data': records})
+
+        elif method == "GET" and resource.startswith("/latest/"):
+            records = self.backend.records_for(resource[len("/latest/"):])
+            self._send_json(200, {'success': True, 'data': records[-1] if records else None})
+
+        else:
+            self._send_json(404, {'success': False, 'message': "Not found"})
+
+    def _session_token(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return {}
+        try:
+            return json.loads(raw.decode("utf-8"))
+        except ValueError:
+            raise ValueError("Request body must be JSON")
+
+    def _send_json(self, status, payload, cookie=None):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", cookie=cookie)
+
+    def _send(self, status, body, content_type, cookie=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+APP_PAGE_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Mobinet NextGen</title>
+<style>
+  body { font-family: sans-serif; margin: 16px; }
+  .hidden { display: none !important; }
+  .field { margin: 8px 0; }
+  .error-message, .validation-error { color: #b00020; }
+  .success-message { color: #1b5e20; }
+  .date-picker-calendar { border: 1px solid #999; display: inline-block; padding: 4px; background: #fff; }
+  .date-picker-calendar td { padding: 2px 6px; cursor: pointer; }
+  .date-picker-calendar td.disabled { color: #bbb; cursor: not-allowed; }
+</style>
+</head>
+<body>
+<div id="loginSection" class="hidden">
+  <h1>Mobinet NextGen - Login</h1>
+  <div class="field"><input id="username" type="text" placeholder="Username"></div>
+  <div class="field"><input id="password" type="password" placeholder="Password"></div>
+  <button id="loginButton" type="button">Login</button>
+  <div id="loginLoading" class="loading-spinner hidden">Signing in...</div>
+  <div id="loginError" class="error-message hidden"></div>
+</div>
+
+<div id="dashboardContainer" class="hidden">
+  <div id="userMenu">
+    <span class="user-name"></span> | <span class="user-role"></span>
+    <button id="logoutButton" type="button">Logout</button>
+  </div>
+
+  <div id="paymentScreenMenu">
+    <span>Payment</span>
+    <button class="three-dot-menu" type="button">&#8942;</button>
+    <div id="paymentActions" class="hidden">
+      <a href="#" id="nonPaymentReasonLink">Non-Payment Reason</a>
+    </div>
+  </div>
+
+  <form id="nonPaymentReasonForm" class="hidden" onsubmit="return false;">
+    <div class="field">
+      <select id="level1ReasonDropdown"><option value=""></option></select>
+      <select id="level2ReasonDropdown"><option value=""></option></select>
+      <span id="level3Container" class="hidden">
+        <select id="level3ReasonDropdown"><option value=""></option></select>
+      </span>
+      <span class="dropdown-loading hidden">Loading...</span>
+    </div>
+
+    <div class="field"><textarea id="notesTextarea" rows="3" cols="60"></textarea></div>
+
+    <div id="appointmentSection" class="field">
+      <input id="appointmentDatePicker" type="text" readonly placeholder="Appointment date">
+      <select id="appointmentTimePicker"><option value=""></option></select>
+    </div>
+
+    <div id="disconnectSection" class="field hidden">
+      <select id="disconnectOption1"><option value=""></option></select>
+      <div id="disconnectOption2" class="hidden">
+        <select id="disconnectOption2Select"><option value=""></option></select>
+        <input id="disconnectDatePicker" type="text" readonly class="hidden" placeholder="Disconnect date">
+      </div>
+      <div id="disconnectOption3" class="hidden">
+        <label><input id="disconnectStatusMaintain" type="radio" name="disconnectStatus" value="permanent"> Maintain</label>
+        <label><input id="disconnectStatusTemporary" type="radio" name="disconnectStatus" value="temporary"> Temporary</label>
+      </div>
+    </div>
+
+    <div id="datePickerHost"></div>
+
+    <div class="field">
+      <button id="submitReasonButton" type="button">Submit</button>
+      <button id="resetFormButton" type="button">Reset</button>
+      <button id="cancelReasonButton" type="button">Cancel</button>
+      <span class="form-loading hidden">Saving...</span>
+    </div>
+
+    <div id="formMessages"></div>
+
+    <div id="reasonHistorySection" class="hidden"></div>
+  </form>
+</div>
+
+<script>
+(function () {
+  var CONFIG = __MOBINET_CONFIG__;
+  var currentUser = null;
+
+  function $(id) { return document.getElementById(id); }
+  function show(el, visible) { el.classList.toggle('hidden', !visible); }
+  function pad(n) { return (n < 10 ? '0' : '') + n; }
+  function isoDate(d) { return d.getFullYear() + '-' + pad(d.getMonth() + 1) + '-' + pad(d.getDate()); }
+
+  function request(method, url, body) {
+    var options = {method: method, headers: {'Content-Type': 'application/json'}, credentials: 'same-origin'};
+    if (body !== undefined) options.body = JSON.stringify(body);
+    return fetch(url, options).then(function (response) {
+      return response.json().then(function (data) { data.status = response.status; return data; });
+    });
+  }
+
+  function fillSelect(select, items) {
+    select.innerHTML = '<option value=""></option>';
+    items.forEach(function (item) {
+      var option = document.createElement('option');
+      option.value = item[0];
+      option.text = item[1];
+      select.appendChild(option);
+    });
+  }
+
+  // Authentication
+
+  function showLogin() {
+    show($('dashboardContainer'), false);
+    show($('loginSection'), true);
+  }
+
+  function showDashboard(user) {
+    currentUser = user;
+    document.querySelector('.user-name').textContent = user.name;
+    document.querySelector('.user-role').textContent = user.role;
+    show($('loginSection'), false);
+    show($('dashboardContainer'), true);
+    show($('disconnectSection'), user.roleKey === 'revenue_collection');
+  }
+
+  $('loginButton').addEventListener('click', function () {
+    show($('loginError'), false);
+    show($('loginLoading'), true);
+    request('POST', CONFIG.authBase + '/login', {username: $('username').value, password: $('password').value})
+      .then(function (body) {
+        show($('loginLoading'), false);
+        if (!body.success) {
+          $('loginError').textContent = body.message;
+          show($('loginError'), true);
+          return;
+        }
+        history.replaceState(null, '', '/');
+        showDashboard(body.data);
+      });
+  });
+
+  $('logoutButton').addEventListener('click', function () {
+    request('POST', CONFIG.authBase + '/logout').then(function () {
+      currentUser = null;
+      history.replaceState(null, '', '/login');
+      showLogin();
+    });
+  });
+
+  // Hierarchical reasons
+
+  function loadCodes(level, parentId, select) {
+    var loading = document.querySelector('.dropdown-loading');
+    var url = CONFIG.apiBase + '/codes/by-level?level=' + level + (parentId ? '&parentId=' + encodeURIComponent(parentId) : '');
+    show(loading, true);
+    return request('GET', url).then(function (body) {
+      show(loading, false);
+      var codes = body.success ? body.data : [];
+      fillSelect(select, codes.map(function (code) { return [code.id, code.name]; }));
+      return codes;
+    });
+  }
+
+  $('level1ReasonDropdown').addEventListener('change', function () {
+    fillSelect($('level2ReasonDropdown'), []);
+    fillSelect($('level3ReasonDropdown'), []);
+    show($('level3Container'), false);
+    if (this.value) loadCodes(2, this.value, $('level2ReasonDropdown'));
+  });
+
+  $('level2ReasonDropdown').addEventListener('change', function () {
+    fillSelect($('level3ReasonDropdown'), []);
+    show($('level3Container'), false);
+    if (!this.value) return;
+    loadCodes(3, this.value, $('level3ReasonDropdown')).then(function (codes) {
+      show($('level3Container'), codes.length > 0);
+    });
+  });
+
+  // Date pickers
+
+  var picker = {target: null, month: null, isAllowed: null, onPick: null};
+
+  function renderCalendar() {
+    var host = $('datePickerHost');
+    var first = new Date(picker.month.getFullYear(), picker.month.getMonth(), 1);
+    var days = new Date(first.getFullYear(), first.getMonth() + 1, 0).getDate();
+    var html = '<div class="date-picker-calendar"><div>' +
+      '<button type="button" class="prev-month">&lt;</button> ' +
+      first.getFullYear() + '-' + pad(first.getMonth() + 1) +
+      ' <button type="button" class="next-month">&gt;</button></div><table><tr>';
+    for (var blank = 0; blank < first.getDay(); blank++) html += '<td></td>';
+    for (var day = 1; day <= days; day++) {
+      var date = new Date(first.getFullYear(), first.getMonth(), day);
+      var cls = picker.isAllowed(date) ? 'day' : 'day disabled';
+      html += '<td class="' + cls + '" data-date="' + isoDate(date) + '">' + day + '</td>';
+      if (date.getDay() === 6) html += '</tr><tr>';
+    }
+    host.innerHTML = html + '</tr></table></div>';
+  }
+
+  function openPicker(target, isAllowed, onPick) {
+    picker.target = target;
+    picker.isAllowed = isAllowed;
+    picker.onPick = onPick;
+    picker.month = target.value ? new Date(target.value + 'T00:00:00') : new Date();
+    renderCalendar();
+  }
+
+  $('datePickerHost').addEventListener('click', function (event) {
+    var cell = event.target;
+    if (cell.classList.contains('prev-month') || cell.classList.contains('next-month')) {
+      picker.month = new Date(picker.month.getFullYear(), picker.month.getMonth() + (cell.classList.contains('next-month') ? 1 : -1), 1);
+      renderCalendar();
+      return;
+    }
+    if (cell.tagName !== 'TD' || !cell.dataset.date || cell.classList.contains('disabled')) return;
+    picker.target.value = cell.dataset.date;
+    $('datePickerHost').innerHTML = '';
+    if (picker.onPick) picker.onPick(cell.dataset.date);
+  });
+
+  function today() {
+    var now = new Date();
+    return new Date(now.getFullYear(), now.getMonth(), now.getDate());
+  }
+
+  $('appointmentDatePicker').addEventListener('click', function () {
+    openPicker(this, function (date) { return date >= today(); });
+  });
+
+  $('disconnectDatePicker').addEventListener('click', function () {
+    openPicker(this, function (date) { return date.getDate() >= 13 && date > today(); }, function () {
+      show($('disconnectOption3'), true);
+    });
+  });
+
+  var times = [];
+  for (var hour = 8; hour < 18; hour++) { times.push([pad(hour) + ':00', pad(hour) + ':00']); times.push([pad(hour) + ':30', pad(hour) + ':30']); }
+  fillSelect($('appointmentTimePicker'), times);
+
+  // Service disconnection (Revenue Collection)
+
+  fillSelect($('disconnectOption1'), CONFIG.disconnectOption1);
+  fillSelect($('disconnectOption2Select'), CONFIG.disconnectOption2);
+
+  function resetDisconnectDetails() {
+    $('disconnectOption2Select').value = '';
+    $('disconnectDatePicker').value = '';
+    show($('disconnectDatePicker'), false);
+    show($('disconnectOption3'), false);
+    $('disconnectStatusMaintain').checked = false;
+    $('disconnectStatusTemporary').checked = false;
+  }
+
+  $('disconnectOption1').addEventListener('change', function () {
+    resetDisconnectDetails();
+    show($('disconnectOption2'), this.value === 'option2');
+  });
+
+  $('disconnectOption2Select').addEventListener('change', function () {
+    $('disconnectDatePicker').value = '';
+    show($('disconnectOption3'), false);
+    show($('disconnectDatePicker'), this.value === 'date');
+  });
+
+  // Form
+
+  function contractId() {
+    var match = /[?&]contractId=([^&]+)/.exec(location.search);
+    return match ? decodeURIComponent(match[1]) : CONFIG.defaultContractId;
+  }
+
+  function clearMessages() { $('formMessages').innerHTML = ''; }
+
+  function addMessage(cls, text) {
+    var div = document.createElement('div');
+    div.className = cls;
+    div.textContent = text;
+    $('formMessages').appendChild(div);
+  }
+
+  function renderHistory() {
+    var now = new Date();
+    var url = CONFIG.apiBase + '/history?contractId=' + encodeURIComponent(contractId()) +
+      '&month=' + (now.getMonth() + 1) + '&year=' + now.getFullYear();
+    return request('GET', url).then(function (body) {
+      var section = $('reasonHistorySection');
+      section.innerHTML = '';
+      (body.data || []).forEach(function (record) {
+        var div = document.createElement('div');
+        div.className = 'history-record';
+        div.textContent = record.submissionDate + ' - ' + record.reasonLevel1Name + ' / ' + record.reasonLevel2Name + ' - ' + record.notes;
+        section.appendChild(div);
+      });
+      show(section, (body.data || []).length > 0);
+    });
+  }
+
+  function resetForm() {
+    $('level1ReasonDropdown').value = '';
+    fillSelect($('level2ReasonDropdown'), []);
+    fillSelect($('level3ReasonDropdown'), []);
+    show($('level3Container'), false);
+    $('notesTextarea').value = '';
+    $('appointmentDatePicker').value = '';
+    $('appointmentTimePicker').value = '';
+    $('disconnectOption1').value = '';
+    show($('disconnectOption2'), false);
+    resetDisconnectDetails();
+    $('datePickerHost').innerHTML = '';
+    clearMessages();
+  }
+
+  document.querySelector('.three-dot-menu').addEventListener('click', function () {
+    show($('paymentActions'), true);
+  });
+
+  $('nonPaymentReasonLink').addEventListener('click', function (event) {
+    event.preventDefault();
+    show($('paymentActions'), false);
+    resetForm();
+    show($('nonPaymentReasonForm'), true);
+    loadCodes(1, null, $('level1ReasonDropdown'));
+    renderHistory();
+  });
+
+  $('resetFormButton').addEventListener('click', resetForm);
+
+  $('cancelReasonButton').addEventListener('click', function () {
+    resetForm();
+    show($('nonPaymentReasonForm'), false);
+  });
+
+  $('submitReasonButton').addEventListener('click', function () {
+    clearMessages();
+    var option1 = $('disconnectOption1').value;
+    var option2 = $('disconnectOption2Select').value;
+    var status = document.querySelector('input[name="disconnectStatus"]:checked');
+    var submission = {
+      contractId: contractId(),
+      reasonLevel1: $('level1ReasonDropdown').value,
+      reasonLevel2: $('level2ReasonDropdown').value,
+      reasonLevel3: $('level3ReasonDropdown').value || undefined,
+      notes: $('notesTextarea').value,
+      scheduledDate: $('appointmentDatePicker').value || undefined,
+      scheduledTime: $('appointmentTimePicker').value || undefined,
+      lockDate: option1 === 'option2' && option2 === 'date' ? ($('disconnectDatePicker').value || undefined) : undefined,
+      lockType: status ? status.value : undefined,
+      cancelLock: option1 === 'option2' && option2 === 'cancel',
+      staffId: currentUser ? currentUser.staffId : '',
+      channel: 'MobiX'
+    };
+    var loading = document.querySelector('.form-loading');
+    show(loading, true);
+    request('POST', CONFIG.apiBase + '/submit', submission).then(function (body) {
+      show(loading, false);
+      if (body.success) {
+        addMessage('success-message', 'Non-payment reason saved successfully');
+        return renderHistory();
+      }
+      (body.errors || [body.message]).forEach(function (text) { addMessage('validation-error', text); });
+    }, function (error) {
+      show(loading, false);
+      addMessage('error-message', 'Request failed: ' + error);
+    });
+  });
+
+  // Initial view
+
+  if (location.pathname === '/login') {
+    showLogin();
+  } else {
+    request('GET', CONFIG.authBase + '/session').then(function (body) {
+      if (body.success) showDashboard(body.data); else showLogin();
+    }, showLogin);
+  }
+})();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,149 @@
+"""
+External system sync polling for Mobinet NextGen automation framework.
+Polls the sync status endpoints of the integrated systems concurrently with asyncio,
+backing off exponentially, so a test waits only as long as the slowest real sync.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+import requests
+
+
+class SyncStatus(NamedTuple):
+    """Outcome of polling one external system for a record."""
+    system: str
+    synced: bool
+    elapsed: float
+    attempts: int
+    error: Optional[str] = None
+
+
+class IntegrationPoller:
+    """
+    Concurrent poller of external system sync status endpoints.
+    Each system is polled until it reports the record as synced or its own
+    deadline (the system's timeout) passes; blocking HTTP calls run in a thread pool.
+    """
+
+    def __init__(self, systems, session=None, initial_interval=0.1, max_interval=2.0, backoff=2.0, logger=None):
+        """
+        Initialize integration poller.
+
+        Args:
+            systems (dict): external_systems configuration (enabled, timeout, status_url per system)
+            session: requests.Session carrying the credentials for the status endpoints
+            initial_interval (float): Delay before the first retry in seconds
+            max_interval (float): Cap of the retry delay in seconds
+            backoff (float): Retry delay multiplier per attempt
+            logger: Logger instance
+        """
+        self.systems = {
+            name: system for name, system in systems.items()
+            if system.get('enabled', True) and system.get('status_url')
+        }
+        self.session = session or requests.Session()
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.logger = logger
+
+    @classmethod
+    def from_config(cls, config_data, session=None, logger=None):
+        """Create a poller from the external_systems and integration_polling configuration."""
+        polling = config_data.get('integration_polling', {})
+        return cls(
+            config_data.get('external_systems', {}),
+            session=session,
+            initial_interval=polling.get('initial_interval', 0.1),
+            max_interval=polling.get('max_interval', 2.0),
+            backoff=polling.get('backoff', 2.0),
+            logger=logger
+        )
+
+    def wait_for_sync(self, record_id, systems=None, timeout=None):
+        """
+        Wait until every system reports a record as synced (or its deadline passes).
+
+        Args:
+            record_id (str): Submitted record ID
+            systems (list): System names to wait for (default: all enabled systems)
+            timeout (float): Deadline overriding the per-system timeouts
+
+        Returns:
+            dict: System name -> SyncStatus
+        """
+        names = [name for name in (systems or self.systems) if name in self.systems]
+        if not names:
+            return {}
+
+        executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="integration-poller")
+        try:
+            return asyncio.run(self._poll_all(record_id, names, timeout, executor))
+        finally:
+            executor.shutdown(wait=False)
+
+    async def _poll_all(self, record_id, names, timeout, executor):
+        statuses = await asyncio.gather(*[
+            self._poll_system(name, record_id, timeout, executor) for name in names
+        ])
+        return {status.system: status for status in statuses}
+
+    async def _poll_system(self, name, record_id, timeout, executor):
+        """Poll one system with exponential backoff until synced or its deadline."""
+        system = self.systems[name]
+        url = system['status_url'].format(record_id=record_id)
+        deadline = timeout if timeout is not None else system.get('timeout', 10)
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        interval = self.initial_interval
+        attempts = 0
+        error = None
+
+        while True:
+            attempts += 1
+            request_timeout = max(deadline - (time.perf_counter() - started), self.initial_interval)
+            synced, error = await loop.run_in_executor(executor, self._check, url, request_timeout)
+            elapsed = time.perf_counter() - started
+
+            if synced:
+                if self.logger:
+                    self.logger.debug("%s synced record %s after %.2fs (%d polls)", name, record_id, elapsed, attempts)
+                return SyncStatus(name, True, elapsed, attempts)
+
+            remaining = deadline - elapsed
+            if remaining <= 0:
+                if self.logger:
+                    self.logger.warning(f"{name} did not sync record {record_id} within {deadline}s ({error or 'not synced'})")
+                return SyncStatus(name, False, elapsed, attempts, error or "not synced")
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def _check(self, url, timeout):
+        """
+        Query a status endpoint once.
+
+        Returns:
+            tuple: (synced, error message or None); unknown records (404) are not synced yet
+        """
+        try:
+            response = self.session.get(url, timeout=timeout)
+        except requests.RequestException as e:
+            return False, str(e)
+
+        if response.status_code == 404:
+            return False, None
+        if not response.ok:
+            return False, f"HTTP {response.status_code}"
+
+        try:
+            body = response.json()
+        except ValueError:
+            return False, "invalid JSON"
+
+        data = body.get('data', body) if isinstance(body, dict) else None
+        return bool(isinstance(data, dict) and data.get('synced')), None
@@ -3,19 +3,91 @@ Logging utility for Mobinet NextGen automation framework.
 Provides centralized logging configuration with color coding and file output.
 """
 
+import atexit
+import copy
+import glob
+import heapq
 import logging
+import logging.handlers
+import queue
+import time
 import colorlog
 import os
 from datetime import datetime
+from utils.metrics_collector import get_active_collector
 
 
-def setup_logger(name="mobinet_automation", level=logging.INFO):
+FILE_LOG_FORMAT = "%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+FILE_LOG_FORMAT_NO_CALLER = "%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s"
+FILE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Background listeners started by setup_logger in queue mode, keyed by logger name
+_listeners = {}
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that merges the message arguments but leaves formatting to the listener.
+    The stock QueueHandler formats the whole record on the calling thread so it can be
+    pickled; the in-process queue only needs the arguments resolved before they change,
+    so timestamps, caller info and tracebacks are formatted on the listener thread.
+    """
+    
+    def prepare(self, record):
+        """Return a copy of the record with msg % args applied and args cleared."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BatchingFileHandler(logging.handlers.MemoryHandler):
+    """
+    Buffers records and writes them to the target file in batches.
+    Flushes when the buffer is full, on ERROR records, or after flush_interval seconds.
+    """
+    
+    def __init__(self, target, capacity=200, flush_interval=2.0):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        
+    def shouldFlush(self, record):
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+        
+    def flush(self):
+        super().flush()
+        if self.target:
+            self.target.flush()
+        self._last_flush = time.monotonic()
+
+
+def get_worker_id():
+    """Get the pytest-xdist worker ID of this process (None outside xdist workers)."""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def setup_logger(name="mobinet_automation", level=logging.INFO, mode="sync",
+                 batch_size=200, flush_interval=2.0, caller_info=True):
     """
     Setup logger with color formatting for console and file output.
     
+    In queue mode the test thread only enqueues records; a QueueListener thread
+    formats them and writes the file in batches. Each xdist worker writes its own
+    file, merged by merge_worker_logs() at session end.
+    
     Args:
         name (str): Logger name
         level: Logging level (default: INFO)
+        mode (str): 'sync' writes on the calling thread, 'queue' uses a background listener
+        batch_size (int): Records buffered before a file write (queue mode)
+        flush_interval (float): Maximum seconds between file writes (queue mode)
+        caller_info (bool): Record funcName:lineno (disabling skips the frame walk per record,
+            but it does so by clearing logging._srcfile, which drops caller info for every
+            logger in the process)
         
     Returns:
         logging.Logger: Configured logger instance
@@ -48,17 +120,37 @@ def setup_logger(name="mobinet_automation", level=logging.INFO):
     )
     console_handler.setFormatter(console_formatter)
     
-    # File handler for persistent logging
+    # File handler for persistent logging (one file per xdist worker)
     timestamp = datetime.now().strftime("%Y%m%d")
-    file_handler = logging.FileHandler(f"logs/automation_{timestamp}.log", encoding='utf-8')
+    worker_id = get_worker_id()
+    suffix = f"_{worker_id}" if worker_id else ""
+    file_handler = logging.FileHandler(f"logs/automation_{timestamp}{suffix}.log", encoding='utf-8')
     file_handler.setLevel(level)
     
+    if not caller_info:
+        # Documented logging optimization: skip sys._getframe() walks in findCaller.
+        # Process-wide: every logger loses funcName/lineno, hence opt-in only.
+        logging._srcfile = None
+    
     file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+        FILE_LOG_FORMAT if caller_info else FILE_LOG_FORMAT_NO_CALLER,
+        datefmt=FILE_DATE_FORMAT
     )
     file_handler.setFormatter(file_formatter)
     
+    if mode == "queue":
+        batched_file_handler = BatchingFileHandler(file_handler, capacity=batch_size, flush_interval=flush_interval)
+        
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, console_handler, batched_file_handler, respect_handler_level=True
+        )
+        listener.start()
+        _listeners[name] = (listener, batched_file_handler, file_handler)
+        
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        return logger
+    
     # Add handlers to logger
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
@@ -66,6 +158,85 @@ def setup_logger(name="mobinet_automation", level=logging.INFO):
     return logger
 
 
+def shutdown_logger(name="mobinet_automation"):
+    """
+    Stop the background listener of a queue-mode logger, writing all pending records.
+    
+    Args:
+        name (str): Logger name
+    """
+    entry = _listeners.pop(name, None)
+    if not entry:
+        return
+        
+    listener, batched_file_handler, file_handler = entry
+    listener.stop()
+    batched_file_handler.close()
+    file_handler.close()
+    
+    logger = logging.getLogger(name)
+    for handler in list(logger.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            logger.removeHandler(handler)
+
+
+@atexit.register
+def _shutdown_all_loggers():
+    """Drain queue-mode loggers that were not shut down explicitly."""
+    for name in list(_listeners):
+        shutdown_logger(name)
+
+
+def merge_worker_logs(log_dir="logs", date=None, remove=True):
+    """
+    Merge per-xdist-worker log files into the daily log in timestamp order.
+    Each merged line is prefixed with its worker ID; multi-line records such as
+    tracebacks stay attached to the record they belong to.
+    
+    Args:
+        log_dir (str): Log directory
+        date (str): Log date as YYYYMMDD (default: today)
+        remove (bool): Delete worker files after merging
+        
+    Returns:
+        str: Path of the merged log file (None if there was nothing to merge)
+    """
+    date = date or datetime.now().strftime("%Y%m%d")
+    worker_files = sorted(glob.glob(os.path.join(log_dir, f"automation_{date}_*.log")))
+    if not worker_files:
+        return None
+        
+    def records(path, worker_id):
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = []
+            for line in f:
+                # Continuation lines (tracebacks) do not start with a timestamp
+                if entry and not line[:4].isdigit():
+                    entry.append(line)
+                    continue
+                if entry:
+                    yield entry[0][:23], f"[{worker_id}] " + "".join(entry)
+                entry = [line]
+            if entry:
+                yield entry[0][:23], f"[{worker_id}] " + "".join(entry)
+                
+    streams = []
+    for path in worker_files:
+        worker_id = os.path.splitext(os.path.basename(path))[0].rsplit("_", 1)[-1]
+        streams.append(records(path, worker_id))
+        
+    merged_path = os.path.join(log_dir, f"automation_{date}.log")
+    with open(merged_path, 'a', encoding='utf-8') as merged:
+        for _, text in heapq.merge(*streams, key=lambda record: record[0]):
+            merged.write(text)
+            
+    if remove:
+        for path in worker_files:
+            os.remove(path)
+            
+    return merged_path
+
+
 class TestLogger:
     """
     Test-specific logger wrapper with additional functionality for automation.
@@ -104,10 +275,21 @@ class TestLogger:
         log_method = self.logger.info if passed else self.logger.error
         log_method(f"[{status}] {self.test_name}: {message}")
         
-    def performance(self, action, duration):
-        """Log performance metrics."""
+    def performance(self, action, duration, metric=None):
+        """
+        Log performance metrics.
+        
+        Args:
+            action (str): Description of the measured action
+            duration (float): Duration in seconds
+            metric (str): Metric name to record the sample under in the active metrics collector
+        """
         self.logger.info(f"[PERFORMANCE] {self.test_name}: {action} completed in {duration:.2f} seconds")
         
+        collector = get_active_collector() if metric else None
+        if collector:
+            collector.record(metric, duration, test=self.test_name)
+        
     def error(self, message, exception=None):
         """Log errors with optional exception details."""
         error_msg = f"[ERROR] {self.test_name}: {message}"
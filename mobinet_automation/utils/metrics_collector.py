@@ -0,0 +1,403 @@
+"""
+Performance metrics collection for Mobinet NextGen automation framework.
+Records named timing samples across iterations and tests, keeps streaming statistics
+and percentiles, and checks them against thresholds declared in config.yaml.
+"""
+
+import fnmatch
+import json
+import math
+import os
+import threading
+from datetime import datetime
+
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+DEFAULT_METRICS_DIR = os.path.join("reports", "metrics")
+
+# Statistics a threshold may limit, e.g. {'mean': 2, 'p95': 3}
+THRESHOLD_STATISTICS = ("mean", "max", "stddev", "p50", "p90", "p95", "p99")
+
+# Collector receiving samples logged through TestLogger.performance()
+_active_collector = None
+
+# performance.*_max settings (seconds) -> metric patterns whose 'max' they limit
+MAX_LIMIT_SETTINGS = {
+    'page_load_max': "page_load",
+    'reason_load_max': "level*_load",
+    'form_submit_max': "form_submit",
+    'history_load_max': "history_load",
+    'integration_max': "integration_*",
+}
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate using the P-square algorithm (Jain & Chlamtac, 1985).
+    Keeps five markers regardless of the number of samples; exact below five samples.
+    """
+
+    __slots__ = ("p", "_initial", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p):
+        """
+        Initialize quantile estimator.
+
+        Args:
+            p (float): Quantile to estimate (0-1)
+        """
+        self.p = p
+        self._initial = []
+        self._heights = None
+        self._positions = None
+        self._desired = None
+        self._increments = (0.0, p / 2, p, (1 + p) / 2, 1.0)
+
+    def add(self, value):
+        """Add a sample."""
+        if self._heights is None:
+            self._initial.append(value)
+            if len(self._initial) == 5:
+                self._initial.sort()
+                self._heights = list(self._initial)
+                self._positions = [0, 1, 2, 3, 4]
+                self._desired = [0.0, 2 * self.p, 4 * self.p, 2 + 2 * self.p, 4.0]
+            return
+
+        heights, positions = self._heights, self._positions
+
+        # Find the cell containing the sample, extending the extremes if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Adjust the three middle markers towards their desired positions
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def value(self):
+        """Current estimate (None without samples)."""
+        if self._heights is not None:
+            return self._heights[2]
+        if not self._initial:
+            return None
+        return _exact_quantile(sorted(self._initial), self.p)
+
+    def _parabolic(self, i, step):
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+        )
+
+    def _linear(self, i, step):
+        heights, positions = self._heights, self._positions
+        return heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+
+
+class MetricSeries:
+    """Streaming statistics for one named metric (Welford mean/variance plus P-square percentiles)."""
+
+    __slots__ = ("name", "count", "mean", "_m2", "min", "max", "_quantiles")
+
+    def __init__(self, name, quantiles=DEFAULT_QUANTILES):
+        self.name = name
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self._quantiles = {p: P2Quantile(p) for p in quantiles}
+
+    def add(self, value):
+        """Add a sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        for estimator in self._quantiles.values():
+            estimator.add(value)
+
+    @property
+    def stddev(self):
+        """Sample standard deviation."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def percentile(self, p):
+        """Get a tracked percentile estimate."""
+        return self._quantiles[p].value()
+
+    def summary(self):
+        """Statistics as a dict (percentiles keyed p50, p90, ...)."""
+        summary = {
+            'count': self.count,
+            'mean': self.mean,
+            'stddev': self.stddev,
+            'min': self.min,
+            'max': self.max
+        }
+        for p, estimator in self._quantiles.items():
+            summary[f"p{p * 100:g}"] = estimator.value()
+        return summary
+
+
+def thresholds_from_config(performance_config):
+    """
+    Build metric thresholds from the performance configuration.
+    The *_max settings are the 'max' limits of their metrics; performance.thresholds
+    adds other statistics (and may override a derived limit).
+
+    Args:
+        performance_config (dict): 'performance' section of the configuration
+
+    Returns:
+        dict: Metric name/pattern to statistic limits
+    """
+    thresholds = {
+        pattern: {'max': performance_config[setting]}
+        for setting, pattern in MAX_LIMIT_SETTINGS.items()
+        if performance_config.get(setting) is not None
+    }
+    for pattern, limits in (performance_config.get('thresholds') or {}).items():
+        thresholds[pattern] = dict(thresholds.get(pattern, {}), **(limits or {}))
+    return thresholds
+
+
+class MetricsCollector:
+    """
+    Collects timing samples by name and checks them against declared thresholds.
+    Threshold keys are metric names or glob patterns (e.g. 'level*_load').
+    """
+
+    def __init__(self, thresholds=None, quantiles=DEFAULT_QUANTILES, sample_sink=None, logger=None):
+        """
+        Initialize metrics collector.
+
+        Args:
+            thresholds (dict): Metric name/pattern to statistic limits, e.g. {'form_submit': {'p95': 3}}
+            quantiles (tuple): Percentiles to track for every metric
+            sample_sink (callable): Receives the raw (metric, value, test) samples on flush(),
+                e.g. to append them to the baseline store; without a sink raw samples are not kept
+            logger: Logger instance
+        """
+        self.thresholds = {pattern: dict(limits or {}) for pattern, limits in (thresholds or {}).items()}
+        self.quantiles = quantiles
+        self.sample_sink = sample_sink
+        self.logger = logger
+
+        self._series = {}
+        self._test_series = {}
+        self._lock = threading.Lock()
+        self.current_test = None
+        self.samples = []
+        self.started_at = datetime.now()
+
+    def begin_test(self, test):
+        """Start collecting the samples of a test separately (see assert_thresholds)."""
+        with self._lock:
+            self.current_test = test
+            self._test_series = {}
+
+    def end_test(self):
+        """Drop the current test's series and flush its raw samples; the session series keep them."""
+        with self._lock:
+            self.current_test = None
+            self._test_series = {}
+        self.flush()
+
+    def flush(self):
+        """
+        Hand the raw samples recorded since the last flush to the sample sink.
+
+        Returns:
+            int: Number of samples flushed
+        """
+        with self._lock:
+            samples, self.samples = self.samples, []
+        if samples and self.sample_sink is not None:
+            self.sample_sink(samples)
+        return len(samples)
+
+    def record(self, name, value, test=None):
+        """
+        Record a timing sample.
+
+        Args:
+            name (str): Metric name
+            value (float): Sample value in seconds
+            test (str): Test that produced the sample (optional)
+        """
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = MetricSeries(name, self.quantiles)
+            series.add(value)
+            if self.sample_sink is not None:
+                self.samples.append((name, value, test))
+
+            if self.current_test is not None:
+                test_series = self._test_series.get(name)
+                if test_series is None:
+                    test_series = self._test_series[name] = MetricSeries(name, self.quantiles)
+                test_series.add(value)
+
+    def series(self, name):
+        """Get the series of a metric (None if nothing was recorded)."""
+        return self._series.get(name)
+
+    def summary(self, name=None, current_test=False):
+        """
+        Get statistics for one metric or all metrics.
+
+        Args:
+            name (str): Metric name (optional)
+            current_test (bool): Only the samples of the current test
+
+        Returns:
+            dict: Statistics of the metric, or metric name to statistics
+        """
+        with self._lock:
+            series_by_name = self._test_series if current_test else self._series
+            if name is not None:
+                series = series_by_name.get(name)
+                return series.summary() if series else None
+            return {metric: series.summary() for metric, series in sorted(series_by_name.items())}
+
+    def limits_for(self, name):
+        """Get the merged threshold limits that apply to a metric."""
+        limits = {}
+        for pattern, pattern_limits in self.thresholds.items():
+            if fnmatch.fnmatchcase(name, pattern):
+                limits.update(pattern_limits or {})
+        return limits
+
+    def check(self, names=None, current_test=False):
+        """
+        Check metrics against their thresholds.
+
+        Args:
+            names (list): Metric names to check (default: all recorded metrics)
+            current_test (bool): Only the samples of the current test
+
+        Returns:
+            list: Violation dicts with metric, statistic, value and limit
+        """
+        violations = []
+        series_by_name = self._test_series if current_test else self._series
+
+        for name in names if names is not None else sorted(series_by_name):
+            stats = self.summary(name, current_test)
+            if not stats:
+                continue
+
+            for statistic, limit in sorted(self.limits_for(name).items()):
+                if statistic not in THRESHOLD_STATISTICS:
+                    raise ValueError(f"Unknown threshold statistic '{statistic}' for metric '{name}'")
+                value = stats.get(statistic)
+                if value is not None and value >= limit:
+                    violations.append({'metric': name, 'statistic': statistic, 'value': value, 'limit': limit})
+
+        return violations
+
+    def assert_thresholds(self, *names, session=False):
+        """
+        Assert that metrics meet their configured thresholds.
+        Inside a test only that test's samples are checked, so other tests'
+        samples cannot pass or fail the assertion.
+
+        Args:
+            *names (str): Metric names to check (default: all recorded metrics)
+            session (bool): Check the samples of the whole session instead
+        """
+        current_test = not session and self.current_test is not None
+        violations = self.check(list(names) if names else None, current_test)
+
+        if self.logger:
+            for name in names or sorted(self._test_series if current_test else self._series):
+                stats = self.summary(name, current_test)
+                if stats:
+                    self.logger.info(
+                        f"[METRICS] {name}: n={stats['count']} mean={stats['mean']:.3f}s "
+                        f"p95={stats['p95']:.3f}s max={stats['max']:.3f}s"
+                    )
+
+        assert not violations, "Performance thresholds exceeded: " + "; ".join(
+            f"{v['metric']} {v['statistic']} {v['value']:.3f}s >= {v['limit']}s" for v in violations
+        )
+
+    def write_summary(self, directory=DEFAULT_METRICS_DIR, run_info=None):
+        """
+        Write a machine-readable summary of this run.
+
+        Args:
+            directory (str): Output directory
+            run_info (dict): Extra run metadata (browser, environment, worker, ...)
+
+        Returns:
+            str: Path of the written file (None if nothing was recorded)
+        """
+        if not self._series:
+            return None
+
+        run_info = dict(run_info or {})
+        suffix = f"_{run_info['worker']}" if run_info.get('worker') else ""
+        filename = f"metrics_{self.started_at.strftime('%Y%m%d_%H%M%S')}{suffix}.json"
+        path = os.path.join(directory, filename)
+
+        payload = {
+            'run': dict(run_info, started_at=self.started_at.isoformat(), finished_at=datetime.now().isoformat()),
+            'thresholds': self.thresholds,
+            'metrics': self.summary(),
+            'violations': self.check()
+        }
+
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+
+        if self.logger:
+            self.logger.info(f"Metrics summary written: {path}")
+        return path
+
+
+def get_active_collector():
+    """Get the collector receiving TestLogger.performance() samples (None outside a session)."""
+    return _active_collector
+
+
+def set_active_collector(collector):
+    """Set (or clear with None) the collector receiving TestLogger.performance() samples."""
+    global _active_collector
+    _active_collector = collector
+
+
+def _exact_quantile(sorted_values, p):
+    """Linear-interpolated quantile of a sorted list."""
+    position = p * (len(sorted_values) - 1)
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
@@ -0,0 +1,350 @@
+"""
+Network control for Mobinet NextGen automation framework.
+Stubs, delays and records the browser's API calls through selenium-wire interceptors,
+so tests can run against canned responses or controlled slow responses.
+"""
+
+import fnmatch
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+
+
+DEFAULT_FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures", "network"
+)
+
+CODES_PATTERN = "/non-payment-reasons/codes*"
+CASSETTE_VERSION = 1
+
+
+def _encode_body(body):
+    """Encode a stub body; dicts and lists are sent as JSON."""
+    if body is None:
+        return b"", None
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body), None
+    if isinstance(body, str):
+        return body.encode("utf-8"), "text/plain; charset=utf-8"
+    return json.dumps(body).encode("utf-8"), "application/json"
+
+
+class Stub:
+    """Canned response (or pass-through delay) for requests matching a path pattern."""
+
+    __slots__ = ("pattern", "method", "status", "body", "headers", "delay_ms", "remaining", "responder", "exact")
+
+    def __init__(self, pattern, method=None, status=200, body=None, headers=None, delay_ms=0,
+                 times=None, responder=None, exact=False):
+        self.pattern = pattern
+        self.method = method.upper() if method else None
+        self.status = status
+        self.body = body
+        self.headers = dict(headers or {})
+        self.delay_ms = delay_ms
+        self.remaining = times
+        self.responder = responder
+        self.exact = exact
+
+    def matches(self, method, path):
+        """Check a request against the stub (path includes the query string)."""
+        if self.method and self.method != method:
+            return False
+        if self.remaining is not None and self.remaining <= 0:
+            return False
+        if self.exact:
+            return path == self.pattern
+        return fnmatch.fnmatchcase(path, "*" + self.pattern)
+
+    def respond(self, request):
+        """
+        Build the response for a matched request.
+
+        Returns:
+            tuple: (status, headers, body bytes)
+        """
+        status, body = self.status, self.body
+        if self.responder is not None:
+            status, body = self.responder(request)
+
+        payload, content_type = _encode_body(body)
+        headers = {'Cache-Control': 'no-store'}
+        if content_type:
+            headers['Content-Type'] = content_type
+        headers.update(self.headers)
+        headers['Content-Length'] = str(len(payload))
+        return status, headers, payload
+
+
+def reason_codes_responder(codes):
+    """
+    Serve /codes and /codes/by-level from a list of ReasonCode records,
+    filtering by the level and parentId query parameters like the API.
+    """
+    def respond(request):
+        query = {key: values[0] for key, values in parse_qs(urlsplit(request.url).query).items()}
+        level = int(query['level']) if query.get('level') else None
+        parent_id = query.get('parentId')
+        data = [
+            code for code in codes
+            if (level is None or code['level'] == level)
+            and (parent_id is None or code.get('parentId') == parent_id)
+        ]
+        return 200, {'success': True, 'data': data}
+    return respond
+
+
+class NetworkController:
+    """
+    Per-browser control of API traffic, attached to selenium-wire drivers as driver.network.
+    Only URLs under the API base URL are captured and intercepted, which keeps proxy
+    overhead for page assets to a pass-through; state is reset when the browser is pooled.
+    """
+
+    def __init__(self, driver, api_base_url, fixtures_dir=DEFAULT_FIXTURES_DIR, logger=None, scope_urls=None):
+        """
+        Initialize network controller.
+
+        Args:
+            driver: selenium-wire WebDriver instance
+            api_base_url (str): API root; requests outside it are neither captured nor intercepted
+            fixtures_dir (str): Directory of canned response fixtures (<name>.json)
+            logger: Logger instance
+            scope_urls (list): URL roots to capture and intercept instead of the API root alone
+                (e.g. base_url and api_base_url for whole-session cassettes)
+        """
+        self.driver = driver
+        self.api_base_url = api_base_url.rstrip("/")
+        self.fixtures_dir = fixtures_dir
+        self.logger = logger
+
+        self._stubs = []
+        self._delays = []
+        self._fallback = None
+        self._lock = threading.Lock()
+        self.intercepted = 0
+
+        driver.scopes = [re.escape(url.rstrip("/")) + "(/.*)?$" for url in (scope_urls or [self.api_base_url])]
+        driver.request_interceptor = self._intercept
+
+    # Stubbing
+
+    def stub(self, pattern, body=None, status=200, method=None, headers=None, delay_ms=0, times=None):
+        """
+        Answer matching API requests with a canned response instead of the backend.
+
+        Args:
+            pattern (str): Path glob, matched against the end of the URL path and query
+                (e.g. '/non-payment-reasons/codes*', '/submit')
+            body: Response body (dict/list sent as JSON, str as text, bytes as-is)
+            status (int): HTTP status
+            method (str): HTTP method to match (default: any)
+            headers (dict): Extra response headers
+            delay_ms (int): Delay before the response is returned
+            times (int): Number of requests to answer (default: unlimited)
+
+        Returns:
+            Stub: Registered stub (later stubs take precedence)
+        """
+        return self._add(Stub(pattern, method, status, body, headers, delay_ms, times))
+
+    def stub_reason_codes(self, codes, delay_ms=0):
+        """Serve reason code queries from ReasonCode records, filtered by level and parent."""
+        return self._add(Stub(CODES_PATTERN, "GET", delay_ms=delay_ms, responder=reason_codes_responder(codes)))
+
+    def load_fixture(self, name):
+        """Load a canned response fixture (<fixtures_dir>/<name>.json)."""
+        with open(os.path.join(self.fixtures_dir, f"{name}.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def stub_from_fixture(self, name, delay_ms=0):
+        """
+        Register a fixture: either a response ({pattern, method, status, body, headers})
+        or a reason code list ({codes: [...]}) served like the codes API.
+
+        Args:
+            name (str): Fixture name
+            delay_ms (int): Delay added to the canned response
+
+        Returns:
+            Stub: Registered stub
+        """
+        fixture = self.load_fixture(name)
+        if 'codes' in fixture:
+            return self.stub_reason_codes(fixture['codes'], delay_ms=delay_ms)
+
+        return self.stub(
+            fixture['pattern'],
+            body=fixture.get('body'),
+            status=fixture.get('status', 200),
+            method=fixture.get('method'),
+            headers=fixture.get('headers'),
+            delay_ms=delay_ms or fixture.get('delay_ms', 0)
+        )
+
+    def delay(self, pattern, delay_ms, method=None):
+        """
+        Delay matching requests before they reach the backend (real responses, added latency).
+
+        Args:
+            pattern (str): Path glob as for stub()
+            delay_ms (int): Added latency
+            method (str): HTTP method to match (default: any)
+        """
+        with self._lock:
+            self._delays.append(Stub(pattern, method, delay_ms=delay_ms))
+
+    # Recording
+
+    def start_recording(self):
+        """Drop captured exchanges so the cassette starts from the current point."""
+        del self.driver.requests
+
+    def exchanges(self):
+        """
+        Get the captured API exchanges, oldest first.
+
+        Returns:
+            list: Dicts with method, path, status, headers, body and duration_ms
+        """
+        from seleniumwire.utils import decode
+
+        exchanges = []
+        for request in self.driver.requests:
+            response = request.response
+            if response is None:
+                continue
+
+            duration_ms = None
+            if getattr(response, 'date', None) and getattr(request, 'date', None):
+                duration_ms = round((response.date - request.date).total_seconds() * 1000, 1)
+
+            exchanges.append({
+                'method': request.method,
+                'path': self._relative(request.url),
+                'request_body': request.body.decode("utf-8", "replace") if request.body else None,
+                'status': response.status_code,
+                'headers': {'Content-Type': response.headers.get('Content-Type', 'application/json')},
+                'body': decode(response.body, response.headers.get('Content-Encoding', 'identity')).decode("utf-8", "replace"),
+                'duration_ms': duration_ms
+            })
+        return exchanges
+
+    def save_cassette(self, path):
+        """
+        Write the captured API exchanges as a gzip-compressed JSON cassette.
+
+        Returns:
+            int: Number of exchanges written
+        """
+        exchanges = self.exchanges()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({'version': CASSETTE_VERSION, 'api_base_url': self.api_base_url, 'exchanges': exchanges}, f)
+
+        if self.logger:
+            self.logger.info(f"Recorded {len(exchanges)} API exchanges to {path}")
+        return len(exchanges)
+
+    def replay_cassette(self, path, recorded_latency=False):
+        """
+        Serve recorded exchanges instead of the backend.
+        Each exchange answers one request with the same method, path and query, in recorded order.
+
+        Args:
+            path (str): Cassette written by save_cassette()
+            recorded_latency (bool): Delay responses by their recorded duration
+
+        Returns:
+            int: Number of exchanges loaded
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            exchanges = json.load(f)['exchanges']
+
+        # Stubs are matched newest first, so register in reverse to replay in recorded order
+        for exchange in reversed(exchanges):
+            self._add(Stub(
+                exchange['path'], exchange['method'], exchange['status'], exchange['body'],
+                headers=exchange.get('headers'), times=1, exact=True,
+                delay_ms=(exchange.get('duration_ms') or 0) if recorded_latency else 0
+            ))
+        return len(exchanges)
+
+    def set_fallback(self, responder):
+        """
+        Answer in-scope requests no stub matches with a responder instead of the backend.
+
+        Args:
+            responder: Callable taking the request and returning (status, headers, body bytes, delay_ms),
+                e.g. a CassettePlayer; None restores pass-through
+        """
+        with self._lock:
+            self._fallback = responder
+
+    def reset(self):
+        """Remove stubs, delays and the fallback and drop captured exchanges (called when the browser is pooled)."""
+        with self._lock:
+            self._stubs.clear()
+            self._delays.clear()
+            self._fallback = None
+            self.intercepted = 0
+        del self.driver.requests
+
+    # Interception (called from selenium-wire proxy threads)
+
+    def _add(self, stub):
+        with self._lock:
+            self._stubs.insert(0, stub)
+        return stub
+
+    def _take(self, candidates, method, path):
+        """Find the first matching stub and consume one of its uses."""
+        with self._lock:
+            for stub in candidates:
+                if stub.matches(method, path):
+                    if stub.remaining is not None:
+                        stub.remaining -= 1
+                    return stub
+        return None
+
+    def _intercept(self, request):
+        path = self._relative(request.url)
+
+        delay = self._take(self._delays, request.method, path)
+        stub = self._take(self._stubs, request.method, path)
+
+        delay_ms = (delay.delay_ms if delay else 0) + (stub.delay_ms if stub else 0)
+
+        if stub is not None:
+            status, headers, body = stub.respond(request)
+        elif self._fallback is not None:
+            status, headers, body, fallback_delay_ms = self._fallback(request)
+            delay_ms += fallback_delay_ms
+        else:
+            status = None
+
+        if delay_ms:
+            time.sleep(delay_ms / 1000.0)
+
+        if status is None:
+            return
+
+        request.create_response(status_code=status, headers=headers, body=body)
+        with self._lock:
+            self.intercepted += 1
+
+        if self.logger:
+            self.logger.debug("Stubbed %s %s -> %s", request.method, path, status)
+
+    def _relative(self, url):
+        """URL path and query relative to the API base URL."""
+        parts = urlsplit(url)
+        path = parts.path
+        base_path = urlsplit(self.api_base_url).path
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path):]
+        return f"{path}?{parts.query}" if parts.query else path
@@ -0,0 +1,294 @@
+"""
+Historical performance baseline for Mobinet NextGen automation framework.
+Appends every timing sample of a run to a local SQLite store keyed by commit, browser,
+environment and metric, and flags metrics that regressed against previous runs.
+"""
+
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+from datetime import datetime
+
+
+DEFAULT_BASELINE_DB = os.path.join("reports", "perf_baseline.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    commit_sha TEXT,
+    browser TEXT,
+    environment TEXT,
+    started_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, worker)
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    test TEXT
+);
+CREATE INDEX IF NOT EXISTS samples_run_metric ON samples (run_id, metric);
+CREATE INDEX IF NOT EXISTS runs_context ON runs (browser, environment, started_at);
+"""
+
+
+def current_commit(cwd=None):
+    """
+    Get the short git commit of the working tree.
+
+    Returns:
+        str: Commit hash, or None outside a git checkout
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=cwd, capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def mann_whitney_u(current, baseline):
+    """
+    One-sided Mann-Whitney U test that current samples tend to be larger than baseline.
+    Uses the normal approximation with tie and continuity correction.
+
+    Args:
+        current (list): Samples of the run under test
+        baseline (list): Samples of the baseline runs
+
+    Returns:
+        tuple: (U statistic of current, p-value)
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 0.0, 1.0
+
+    combined = sorted([(value, True) for value in current] + [(value, False) for value in baseline])
+    total = n1 + n2
+
+    rank_sum = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < total:
+        j = i
+        while j + 1 < total and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        rank_sum += average_rank * sum(1 for k in range(i, j + 1) if combined[k][1])
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return u, 1.0
+
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class BaselineStore:
+    """
+    Append-only SQLite store of timing samples from previous runs.
+    Each pytest-xdist worker appends its own rows under the shared run ID.
+    """
+
+    def __init__(self, path=DEFAULT_BASELINE_DB, logger=None):
+        """
+        Initialize baseline store.
+
+        Args:
+            path (str): SQLite database file
+            logger: Logger instance
+        """
+        self.path = path
+        self.logger = logger
+
+    def append_run(self, run_id, samples, commit=None, browser=None, environment=None, worker=None):
+        """
+        Append samples of a run (may be called repeatedly; the run row keeps its first start time).
+
+        Args:
+            run_id (str): Run identifier shared by all workers of a run
+            samples (list): (metric, value, test) tuples
+            commit (str): Git commit under test
+            browser (str): Browser name
+            environment (str): Target environment
+            worker (str): pytest-xdist worker ID (None when not distributed)
+
+        Returns:
+            int: Number of samples stored
+        """
+        if not samples:
+            return 0
+
+        worker = worker or "main"
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, worker, commit, browser, environment, datetime.now().isoformat())
+            )
+            connection.executemany(
+                "INSERT INTO samples VALUES (?, ?, ?, ?, ?)",
+                [(run_id, worker, metric, value, test) for metric, value, test in samples]
+            )
+
+        if self.logger:
+            self.logger.info(f"Stored {len(samples)} performance samples for run {run_id} in {self.path}")
+        return len(samples)
+
+    def run_context(self, run_id):
+        """Get (browser, environment) of a run, or None if unknown."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT browser, environment FROM runs WHERE run_id = ? LIMIT 1", (run_id,)
+            ).fetchone()
+
+    def latest_run_id(self):
+        """Get the most recently started run."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT run_id FROM runs GROUP BY run_id ORDER BY MIN(started_at) DESC LIMIT 1"
+            ).fetchone()
+        return row[0] if row else None
+
+    def previous_run_ids(self, run_id, limit=5):
+        """
+        Get the runs before a run with the same browser and environment, newest first.
+
+        Args:
+            run_id (str): Run under test
+            limit (int): Maximum number of runs
+
+        Returns:
+            list: Run IDs
+        """
+        context = self.run_context(run_id)
+        if context is None:
+            return []
+
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT run_id FROM runs
+                WHERE browser IS ? AND environment IS ? AND run_id != ?
+                GROUP BY run_id
+                HAVING MIN(started_at) < (SELECT MIN(started_at) FROM runs WHERE run_id = ?)
+                ORDER BY MIN(started_at) DESC
+                LIMIT ?
+                """,
+                (context[0], context[1], run_id, run_id, limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def samples_by_metric(self, run_ids):
+        """
+        Get the samples of runs grouped by metric.
+
+        Args:
+            run_ids (list): Run IDs
+
+        Returns:
+            dict: Metric name to list of values
+        """
+        if not run_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in run_ids)
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT metric, value FROM samples WHERE run_id IN ({placeholders})", list(run_ids)
+            ).fetchall()
+
+        samples = {}
+        for metric, value in rows:
+            samples.setdefault(metric, []).append(value)
+        return samples
+
+    def compare(self, run_id=None, last_runs=5, alpha=0.01, min_change=0.1, min_samples=3):
+        """
+        Compare a run against the pooled samples of its previous runs.
+        A metric regressed when the Mann-Whitney test is significant and its median
+        grew by at least min_change, regardless of the static config.yaml limits.
+
+        Args:
+            run_id (str): Run under test (default: latest run)
+            last_runs (int): Number of previous runs forming the baseline
+            alpha (float): Significance level of the one-sided test
+            min_change (float): Minimum relative median increase to flag
+            min_samples (int): Minimum samples on each side to test a metric
+
+        Returns:
+            list: Comparison dicts (metric, samples, medians, change, p_value, regressed)
+        """
+        run_id = run_id or self.latest_run_id()
+        if run_id is None:
+            return []
+
+        current = self.samples_by_metric([run_id])
+        baseline = self.samples_by_metric(self.previous_run_ids(run_id, last_runs))
+
+        comparisons = []
+        for metric in sorted(current):
+            values, baseline_values = current[metric], baseline.get(metric, [])
+            comparison = {
+                'metric': metric,
+                'samples': len(values),
+                'baseline_samples': len(baseline_values),
+                'median': statistics.median(values),
+                'baseline_median': statistics.median(baseline_values) if baseline_values else None,
+                'change': None,
+                'p_value': None,
+                'regressed': False
+            }
+
+            if len(values) >= min_samples and len(baseline_values) >= min_samples:
+                _, p_value = mann_whitney_u(values, baseline_values)
+                if comparison['baseline_median'] > 0:
+                    comparison['change'] = comparison['median'] / comparison['baseline_median'] - 1
+                comparison['p_value'] = p_value
+                comparison['regressed'] = p_value < alpha and (comparison['change'] or 0) >= min_change
+
+            comparisons.append(comparison)
+
+        return comparisons
+
+    def _connect(self):
+        """Open the database, creating it on first use."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.executescript(SCHEMA)
+        return _Transaction(connection)
+
+
+class _Transaction:
+    """Context manager committing (or rolling back) and closing a connection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.connection.commit()
+            else:
+                self.connection.rollback()
+        finally:
+            self.connection.close()
+        return False
@@ -0,0 +1,202 @@
+"""
+Reason hierarchy index for Mobinet NextGen automation framework.
+Builds the Level 1 -> Level 2 -> Level 3 tree once and answers parent/child,
+validity and path enumeration queries without scanning lists or reading the UI.
+"""
+
+import re
+
+
+# Path enumeration strategies
+ALL_PATHS = "all"  # every complete path
+PER_LEVEL2_PATHS = "per_level2"  # one complete path per Level 2 reason
+
+
+def _tokens(text):
+    return set(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+class ReasonHierarchyIndex:
+    """
+    Immutable tree of reason names keyed by path.
+    Paths are tuples of names from Level 1 down, e.g. ('Billing Disputes', 'Billing Errors');
+    the empty tuple is the root. Equal paths are interned, so identity comparison is enough.
+    """
+
+    __slots__ = ("_children", "_paths")
+
+    def __init__(self, paths):
+        """
+        Build the index.
+
+        Args:
+            paths (iterable): Reason paths as tuples of 1-3 names (None entries end a path)
+        """
+        self._children = {(): []}
+        self._paths = {(): ()}
+
+        for path in paths:
+            names = tuple(name for name in path if name)
+            for depth in range(1, len(names) + 1):
+                prefix = names[:depth]
+                if prefix not in self._paths:
+                    self._paths[prefix] = prefix
+                    self._children[prefix] = []
+                    self._children[names[:depth - 1]].append(prefix[-1])
+
+        self._children = {path: tuple(children) for path, children in self._children.items()}
+
+    @classmethod
+    def from_hierarchies(cls, hierarchies):
+        """
+        Build from ReasonHierarchy objects (or (level1, level2, level3) tuples).
+
+        Args:
+            hierarchies (list): Output of TestDataManager.generate_reason_hierarchy_data()
+
+        Returns:
+            ReasonHierarchyIndex: Index
+        """
+        return cls(
+            tuple(hierarchy) if isinstance(hierarchy, (tuple, list))
+            else (hierarchy.level1, hierarchy.level2, hierarchy.level3)
+            for hierarchy in hierarchies
+        )
+
+    @classmethod
+    def from_codes(cls, codes):
+        """
+        Build from ReasonCode records of the /codes API (id, name, level, parentId).
+
+        Args:
+            codes (list): ReasonCode dicts
+
+        Returns:
+            ReasonHierarchyIndex: Index
+        """
+        by_id = {code['id']: code for code in codes if code.get('active', True)}
+
+        def path_of(code):
+            names = []
+            while code is not None:
+                names.append(code['name'])
+                code = by_id.get(code.get('parentId'))
+            return tuple(reversed(names))
+
+        return cls(path_of(code) for code in sorted(by_id.values(), key=lambda code: code['level']))
+
+    @classmethod
+    def from_config(cls, reasons):
+        """
+        Build from the test_data.reasons section of config.yaml.
+        Level 2 groups are keyed by short names (e.g. 'financial_issues') and are
+        attached to the Level 1 reason whose name contains all of the key's words.
+
+        Args:
+            reasons (dict): {'level1': [...], 'level2': {group_key: [...]}}
+
+        Returns:
+            ReasonHierarchyIndex: Index
+        """
+        level1 = list(reasons.get('level1', []))
+        paths = [(name,) for name in level1]
+
+        for group_key, level2_names in (reasons.get('level2') or {}).items():
+            parent = next((name for name in level1 if _tokens(group_key) <= _tokens(name)), None)
+            if parent:
+                paths.extend((parent, name) for name in level2_names)
+
+        return cls(paths)
+
+    def intern(self, path):
+        """
+        Get the canonical instance of a path.
+
+        Args:
+            path (tuple): Reason names from Level 1 down
+
+        Returns:
+            tuple: Interned path, or None if it is not in the hierarchy
+        """
+        return self._paths.get(tuple(name for name in path if name))
+
+    def children(self, *path):
+        """
+        Get the reasons below a path.
+
+        Args:
+            *path (str): Names from Level 1 down (none for the Level 1 reasons)
+
+        Returns:
+            tuple: Child names in source order (empty for leaves and unknown paths)
+        """
+        return self._children.get(path, ())
+
+    @property
+    def level1(self):
+        """Level 1 reason names."""
+        return self._children[()]
+
+    def is_valid(self, *path):
+        """Whether the names form a path of the hierarchy (complete or not)."""
+        return path in self._paths
+
+    def is_complete(self, *path):
+        """Whether the names form a valid path that needs no further level."""
+        return path in self._paths and not self._children[path]
+
+    def requires_level3(self, level1, level2):
+        """Whether a Level 2 reason has Level 3 reasons to choose from."""
+        return bool(self._children.get((level1, level2)))
+
+    def parent(self, *path):
+        """Get the parent path of a valid path (None for unknown paths or the root)."""
+        if not path or path not in self._paths:
+            return None
+        return self._paths[path[:-1]]
+
+    def leaf_paths(self):
+        """All complete paths, depth first in source order."""
+        leaves = []
+
+        def walk(path):
+            children = self._children[path]
+            if not children and path:
+                leaves.append(self._paths[path])
+            for child in children:
+                walk(path + (child,))
+
+        walk(())
+        return leaves
+
+    def enumerate_paths(self, strategy=ALL_PATHS):
+        """
+        Enumerate complete paths to exercise.
+        Paths are grouped by Level 1 and Level 2, so consecutive paths share
+        selections and a UI test only changes the levels that differ.
+
+        Args:
+            strategy (str): ALL_PATHS, or PER_LEVEL2_PATHS for one path per Level 2
+                reason (every Level 1/Level 2 pair and every Level 3 list, without
+                selecting each Level 3 reason)
+
+        Returns:
+            list: Complete paths
+        """
+        leaves = self.leaf_paths()
+        if strategy == ALL_PATHS:
+            return leaves
+        if strategy != PER_LEVEL2_PATHS:
+            raise ValueError(f"Unknown path enumeration strategy: {strategy}")
+
+        selected = {}
+        for path in leaves:
+            selected.setdefault(path[:2], path)
+        return list(selected.values())
+
+    def __len__(self):
+        """Number of complete paths."""
+        return len(self.leaf_paths())
+
+    def __contains__(self, path):
+        return tuple(path) in self._paths
@@ -0,0 +1,214 @@
+"""
+Per-process resource profiling for Mobinet NextGen automation framework.
+Samples RSS, CPU time, threads and open file descriptors of the pytest worker,
+the WebDriver service process and the browser process tree during a test.
+"""
+
+import os
+import threading
+import time
+
+import psutil
+
+
+WORKER = "worker"
+DRIVER = "driver"
+BROWSER = "browser"
+ROLES = (WORKER, DRIVER, BROWSER)
+
+
+def _process_stats(process):
+    """
+    Read the resource counters of one process.
+
+    Returns:
+        tuple: (rss bytes, cpu seconds, threads, open fds/handles), or None if the process is gone
+    """
+    try:
+        with process.oneshot():
+            cpu = process.cpu_times()
+            fds = process.num_fds() if hasattr(process, 'num_fds') else process.num_handles()
+            return process.memory_info().rss, cpu.user + cpu.system, process.num_threads(), fds
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
+
+def driver_service_pid(driver):
+    """Get the PID of the chromedriver/geckodriver process behind a WebDriver (None if remote)."""
+    service = getattr(driver, 'service', None)
+    process = getattr(service, 'process', None)
+    return getattr(process, 'pid', None)
+
+
+class ResourceProfile:
+    """
+    Time series of resource samples per process role (worker, driver, browser).
+    Each sample is (seconds since start, rss MB, cpu seconds, threads, fds).
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.series = {role: [] for role in ROLES}
+        self.browser_processes = 0
+
+    def add(self, role, elapsed, rss, cpu_seconds, threads, fds):
+        """Add a sample for a role."""
+        self.series[role].append((round(elapsed, 3), round(rss / 1024 / 1024, 2), round(cpu_seconds, 3), threads, fds))
+
+    def summary(self):
+        """
+        Peak and mean values per role.
+
+        Returns:
+            dict: Role to peak/mean RSS, RSS growth, CPU time and utilisation, peak threads and fds
+        """
+        summary = {}
+
+        for role, samples in self.series.items():
+            if not samples:
+                continue
+
+            rss = [sample[1] for sample in samples]
+            elapsed = samples[-1][0] - samples[0][0]
+            cpu_seconds = max(0.0, samples[-1][2] - samples[0][2])
+
+            summary[role] = {
+                'samples': len(samples),
+                'peak_rss_mb': max(rss),
+                'mean_rss_mb': round(sum(rss) / len(rss), 2),
+                'rss_growth_mb': round(rss[-1] - rss[0], 2),
+                'cpu_seconds': round(cpu_seconds, 3),
+                'cpu_percent': round(cpu_seconds / elapsed * 100, 1) if elapsed > 0 else 0.0,
+                'peak_threads': max(sample[3] for sample in samples),
+                'peak_fds': max(sample[4] for sample in samples)
+            }
+
+        return summary
+
+    def to_dict(self):
+        """Serializable profile with summary and raw series."""
+        return {
+            'interval': self.interval,
+            'browser_processes': self.browser_processes,
+            'columns': ['elapsed_s', 'rss_mb', 'cpu_s', 'threads', 'fds'],
+            'summary': self.summary(),
+            'series': self.series
+        }
+
+    def describe(self):
+        """One-line summary for logs."""
+        return "; ".join(
+            f"{role}: peak {stats['peak_rss_mb']:.0f}MB (+{stats['rss_growth_mb']:.0f}MB), "
+            f"cpu {stats['cpu_seconds']:.1f}s ({stats['cpu_percent']:.0f}%), "
+            f"threads {stats['peak_threads']}, fds {stats['peak_fds']}"
+            for role, stats in self.summary().items()
+        )
+
+
+class ResourceProfiler:
+    """
+    Background sampler of per-process resource usage.
+    The browser tree is re-read on every sample so renderer/GPU processes
+    started during the test are included.
+    """
+
+    def __init__(self, driver=None, interval=0.5, logger=None):
+        """
+        Initialize resource profiler.
+
+        Args:
+            driver: WebDriver instance whose driver/browser processes to sample (optional)
+            interval (float): Seconds between samples
+            logger: Logger instance
+        """
+        self.interval = interval
+        self.logger = logger
+
+        self._worker = psutil.Process(os.getpid())
+        self._driver_process = None
+        pid = driver_service_pid(driver) if driver is not None else None
+        if pid:
+            try:
+                self._driver_process = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                pass
+
+        self._browser_processes = {}
+        self._profile = None
+        self._started_at = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling in a background thread."""
+        self._profile = ResourceProfile(self.interval)
+        self._started_at = time.perf_counter()
+        self._stop_event.clear()
+
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="resource-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop sampling and take a final sample.
+
+        Returns:
+            ResourceProfile: Collected profile
+        """
+        if self._thread is None:
+            return self._profile
+
+        self._stop_event.set()
+        self._thread.join(self.interval * 4 + 1)
+        self._thread = None
+
+        self._sample()
+        return self._profile
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        """Take one sample of every process role."""
+        elapsed = time.perf_counter() - self._started_at
+
+        stats = _process_stats(self._worker)
+        if stats:
+            self._profile.add(WORKER, elapsed, *stats)
+
+        if self._driver_process is None:
+            return
+
+        stats = _process_stats(self._driver_process)
+        if stats:
+            self._profile.add(DRIVER, elapsed, *stats)
+
+        totals = [0, 0.0, 0, 0]
+        found = False
+        for process in self._browser_tree():
+            stats = _process_stats(process)
+            if stats:
+                found = True
+                totals = [total + value for total, value in zip(totals, stats)]
+
+        if found:
+            self._profile.add(BROWSER, elapsed, *totals)
+            self._profile.browser_processes = max(self._profile.browser_processes, len(self._browser_processes))
+
+    def _browser_tree(self):
+        """
+        Get the browser processes (descendants of the driver service).
+        Process objects are reused between samples so psutil's per-process caches stay warm.
+        """
+        try:
+            children = self._driver_process.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return []
+
+        current = {}
+        for child in children:
+            current[child.pid] = self._browser_processes.get(child.pid, child)
+        self._browser_processes = current
+        return list(current.values())
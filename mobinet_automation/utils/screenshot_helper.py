@@ -3,20 +3,180 @@ Screenshot utility for test evidence and debugging.
 Provides enhanced screenshot functionality with annotations and metadata.
 """
 
+import io
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 from selenium.webdriver.common.by import By
 
 
+class ScreenshotWriter:
+    """
+    Bounded background pool that decodes, annotates, compresses and writes screenshots.
+    Tests only pay for the in-memory capture; submit() blocks once max_pending
+    screenshots are in flight so a slow disk cannot grow memory without limit.
+    """
+    
+    def __init__(self, max_workers=2, max_pending=16, compress_level=None, logger=None):
+        """
+        Initialize screenshot writer.
+        
+        Args:
+            max_workers (int): Background threads (0 = render and write on the calling thread)
+            max_pending (int): Screenshots allowed in flight before submit() blocks
+            compress_level (int): zlib level 0-9 for re-encoding plain captures (None keeps browser PNG bytes)
+            logger: Logger instance
+        """
+        self.max_workers = max_workers
+        self.compress_level = compress_level
+        self.logger = logger
+        
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot") if max_workers else None
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self._pending = set()
+        self._lock = threading.Lock()
+        
+    def submit(self, filepath, render):
+        """
+        Queue a screenshot for rendering and writing.
+        
+        Args:
+            filepath (str): Destination path
+            render (callable): Returns PNG bytes or a PIL image; runs on a worker thread
+            
+        Returns:
+            Future: Completes with the file path (None on failure); None in synchronous mode
+        """
+        if not self._executor:
+            self._write(filepath, render)
+            return None
+            
+        if not self._slots.acquire(blocking=False):
+            if self.logger:
+                self.logger.warning("Screenshot queue full, waiting for pending writes")
+            self._slots.acquire()
+            
+        future = self._executor.submit(self._write, filepath, render)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+        
+    def flush(self, timeout=None):
+        """
+        Wait for all queued screenshots to be written.
+        
+        Args:
+            timeout (float): Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if nothing is left pending
+        """
+        with self._lock:
+            pending = list(self._pending)
+            
+        if not pending:
+            return True
+            
+        done, not_done = wait(pending, timeout=timeout)
+        if not_done and self.logger:
+            self.logger.warning(f"{len(not_done)} screenshots still pending after flush")
+        return not not_done
+        
+    def shutdown(self):
+        """Flush pending screenshots and stop the worker threads."""
+        self.flush()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            
+    def _on_done(self, future):
+        """Release the backpressure slot of a finished screenshot."""
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+        
+    def _write(self, filepath, render):
+        """Render a screenshot and write it to disk."""
+        try:
+            result = render()
+            
+            directory = os.path.dirname(filepath)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+                
+            if isinstance(result, bytes):
+                if self.compress_level is None:
+                    with open(filepath, 'wb') as f:
+                        f.write(result)
+                    return filepath
+                result = decode_png(result)
+                
+            result.save(filepath, format="PNG", compress_level=self.compress_level if self.compress_level is not None else 6)
+            return filepath
+            
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Failed to write screenshot {filepath}: {str(e)}")
+            return None
+
+
+_default_writer = None
+_default_writer_lock = threading.Lock()
+
+
+def get_screenshot_writer():
+    """Get the process-wide screenshot writer, creating a default one if needed."""
+    global _default_writer
+    with _default_writer_lock:
+        if _default_writer is None:
+            _default_writer = ScreenshotWriter()
+        return _default_writer
+        
+        
+def configure_screenshot_writer(**kwargs):
+    """
+    Replace the process-wide screenshot writer.
+    Pending screenshots of the previous writer are flushed first.
+    
+    Args:
+        **kwargs: ScreenshotWriter arguments
+        
+    Returns:
+        ScreenshotWriter: The new writer
+    """
+    global _default_writer
+    with _default_writer_lock:
+        previous = _default_writer
+        _default_writer = ScreenshotWriter(**kwargs)
+        
+    if previous:
+        previous.shutdown()
+    return _default_writer
+
+
+def decode_png(png_bytes):
+    """Decode PNG bytes into an RGB PIL image."""
+    return Image.open(io.BytesIO(png_bytes)).convert("RGB")
+
+
+def _load_font(size):
+    """Load an annotation font, falling back to Pillow's default."""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
 class ScreenshotHelper:
     """
     Enhanced screenshot functionality for test automation.
     Supports annotated screenshots, element highlighting, and organized storage.
     """
     
-    def __init__(self, driver, logger, base_path="screenshots"):
+    def __init__(self, driver, logger, base_path="screenshots", writer=None):
         """
         Initialize screenshot helper.
         
@@ -24,10 +184,12 @@ class ScreenshotHelper:
             driver: WebDriver instance
             logger: Logger instance
             base_path (str): Base directory for screenshots
+            writer (ScreenshotWriter): Background writer (defaults to the process-wide writer)
         """
         self.driver = driver
         self.logger = logger
         self.base_path = base_path
+        self.writer = writer or get_screenshot_writer()
         
         # Create screenshots directory
         os.makedirs(base_path, exist_ok=True)
@@ -50,7 +212,8 @@ class ScreenshotHelper:
         filepath = os.path.join(self.base_path, filename)
         
         try:
-            self.driver.save_screenshot(filepath)
+            png_bytes = self.driver.get_screenshot_as_png()
+            self.writer.submit(filepath, lambda: png_bytes)
             self.logger.info(f"Screenshot saved: {filepath}")
             if description:
                 self.logger.info(f"Screenshot description: {description}")
@@ -78,7 +241,8 @@ class ScreenshotHelper:
         filepath = os.path.join(self.base_path, filename)
         
         try:
-            element.screenshot(filepath)
+            png_bytes = element.screenshot_as_png
+            self.writer.submit(filepath, lambda: png_bytes)
             self.logger.info(f"Element screenshot saved: {filepath}")
             if description:
                 self.logger.info(f"Element screenshot description: {description}")
@@ -106,50 +270,20 @@ class ScreenshotHelper:
         filepath = os.path.join(self.base_path, filename)
         
         try:
-            # Take base screenshot
-            temp_path = os.path.join(self.base_path, "temp_screenshot.png")
-            self.driver.save_screenshot(temp_path)
-            
-            # Open image for annotation
-            image = Image.open(temp_path)
-            draw = ImageDraw.Draw(image)
+            # Capture in memory; element geometry must be read while the page is in this state
+            png_bytes = self.driver.get_screenshot_as_png()
+            regions = []
             
             if annotations:
                 for annotation in annotations:
                     try:
                         element = annotation.get('element')
-                        color = annotation.get('color', 'red')
-                        text = annotation.get('text', '')
-                        
                         if element:
-                            # Get element location and size
-                            location = element.location
-                            size = element.size
-                            
-                            # Draw rectangle around element
-                            x1, y1 = location['x'], location['y']
-                            x2, y2 = x1 + size['width'], y1 + size['height']
-                            
-                            draw.rectangle([x1, y1, x2, y2], outline=color, width=3)
-                            
-                            # Add text annotation
-                            if text:
-                                # Try to use a default font, fallback to default if not available
-                                try:
-                                    font = ImageFont.truetype("arial.ttf", 16)
-                                except:
-                                    font = ImageFont.load_default()
-                                    
-                                draw.text((x1, y1 - 20), text, fill=color, font=font)
-                                
+                            regions.append((element.rect, annotation.get('color', 'red'), annotation.get('text', '')))
                     except Exception as e:
                         self.logger.warning(f"Failed to annotate element: {str(e)}")
-            
-            # Save annotated image
-            image.save(filepath)
-            
-            # Cleanup temp file
-            os.remove(temp_path)
+                        
+            self.writer.submit(filepath, lambda: _render_annotated(png_bytes, regions))
             
             self.logger.info(f"Annotated screenshot saved: {filepath}")
             if description:
@@ -179,41 +313,9 @@ class ScreenshotHelper:
         filepath = os.path.join(self.base_path, filename)
         
         try:
-            # Take before screenshot
-            before_path = os.path.join(self.base_path, "temp_before.png")
-            before_element.screenshot(before_path)
-            
-            # Take after screenshot
-            after_path = os.path.join(self.base_path, "temp_after.png")
-            after_element.screenshot(after_path)
-            
-            # Create side-by-side comparison
-            before_img = Image.open(before_path)
-            after_img = Image.open(after_path)
-            
-            # Create new image with combined width
-            total_width = before_img.width + after_img.width + 10  # 10px separator
-            max_height = max(before_img.height, after_img.height)
-            
-            comparison_img = Image.new('RGB', (total_width, max_height), 'white')
-            comparison_img.paste(before_img, (0, 0))
-            comparison_img.paste(after_img, (before_img.width + 10, 0))
-            
-            # Add labels
-            draw = ImageDraw.Draw(comparison_img)
-            try:
-                font = ImageFont.truetype("arial.ttf", 14)
-            except:
-                font = ImageFont.load_default()
-                
-            draw.text((10, 10), "BEFORE", fill="red", font=font)
-            draw.text((before_img.width + 20, 10), "AFTER", fill="green", font=font)
-            
-            comparison_img.save(filepath)
-            
-            # Cleanup temp files
-            os.remove(before_path)
-            os.remove(after_path)
+            before_png = before_element.screenshot_as_png
+            after_png = after_element.screenshot_as_png
+            self.writer.submit(filepath, lambda: _render_comparison(before_png, after_png))
             
             self.logger.info(f"Comparison screenshot saved: {filepath}")
             return filepath
@@ -277,4 +379,63 @@ class ScreenshotHelper:
         os.makedirs(folder_path, exist_ok=True)
         self.logger.info(f"Test evidence folder created: {folder_path}")
         
-        return folder_path
\ No newline at end of file
+        return folder_path
+
+
+def _render_annotated(png_bytes, regions):
+    """
+    Draw annotation rectangles and labels onto a captured screenshot.
+    
+    Args:
+        png_bytes (bytes): Captured PNG
+        regions (list): (rect, color, text) tuples with rect from WebElement.rect
+        
+    Returns:
+        Image: Annotated image
+    """
+    image = decode_png(png_bytes)
+    draw = ImageDraw.Draw(image)
+    font = _load_font(16)
+    
+    for rect, color, text in regions:
+        # Draw rectangle around element
+        x1, y1 = rect['x'], rect['y']
+        x2, y2 = x1 + rect['width'], y1 + rect['height']
+        draw.rectangle([x1, y1, x2, y2], outline=color, width=3)
+        
+        # Add text annotation
+        if text:
+            draw.text((x1, y1 - 20), text, fill=color, font=font)
+            
+    return image
+
+
+def _render_comparison(before_png, after_png):
+    """
+    Compose before and after element captures side by side.
+    
+    Args:
+        before_png (bytes): Element capture in before state
+        after_png (bytes): Element capture in after state
+        
+    Returns:
+        Image: Comparison image
+    """
+    before_img = decode_png(before_png)
+    after_img = decode_png(after_png)
+    
+    # Create new image with combined width
+    total_width = before_img.width + after_img.width + 10  # 10px separator
+    max_height = max(before_img.height, after_img.height)
+    
+    comparison_img = Image.new('RGB', (total_width, max_height), 'white')
+    comparison_img.paste(before_img, (0, 0))
+    comparison_img.paste(after_img, (before_img.width + 10, 0))
+    
+    # Add labels
+    draw = ImageDraw.Draw(comparison_img)
+    font = _load_font(14)
+    draw.text((10, 10), "BEFORE", fill="red", font=font)
+    draw.text((before_img.width + 20, 10), "AFTER", fill="green", font=font)
+    
+    return comparison_img
@@ -0,0 +1,338 @@
+"""
+Browser session cassettes for Mobinet NextGen automation framework.
+Records every request/response a test's browser makes into a compressed cassette per
+node ID and replays them offline, matching requests with volatile values masked.
+"""
+
+import base64
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import defaultdict, deque
+from urllib.parse import urlsplit
+
+
+CASSETTE_VERSION = 1
+
+# Cassette modes
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+MODES = (MODE_OFF, MODE_RECORD, MODE_REPLAY)
+
+# Replay latency settings (anything else is a scale factor of the recorded time)
+LATENCY_ZERO = "zero"
+LATENCY_RECORDED = "recorded"
+
+# Values that differ between runs and are masked before requests are matched
+VOLATILE_PATTERNS = (
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?",  # ISO timestamps
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b",  # UUIDs
+    r"\b[0-9a-fA-F]{16,}\b",  # session tokens and hashes
+    r"\b1\d{9}(?:\d{3})?\b",  # epoch seconds and milliseconds
+    r"\bNPR-\d+\b",  # non-payment reason record IDs
+)
+
+# Response headers not replayed (recomputed by the proxy or meaningless offline)
+DROPPED_HEADERS = {'content-length', 'content-encoding', 'transfer-encoding', 'connection', 'keep-alive', 'date'}
+
+# Status returned for requests without a recorded response
+MISS_STATUS = 504
+
+
+def cassette_path(directory, nodeid):
+    """
+    Get the cassette file of a test.
+
+    Args:
+        directory (str): Cassette directory
+        nodeid (str): Pytest node ID
+
+    Returns:
+        str: Readable, collision-free file path
+    """
+    readable = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")[-120:]
+    digest = hashlib.sha1(nodeid.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(directory, f"{readable}-{digest}.json.gz")
+
+
+def replay_delay_ms(duration_ms, latency):
+    """
+    Get the replay delay of an exchange.
+
+    Args:
+        duration_ms (float): Recorded duration
+        latency: LATENCY_ZERO, LATENCY_RECORDED or a scale factor
+
+    Returns:
+        float: Delay in milliseconds
+    """
+    if not duration_ms or latency in (None, LATENCY_ZERO):
+        return 0
+    if latency == LATENCY_RECORDED:
+        return duration_ms
+    return duration_ms * float(latency)
+
+
+class VolatileMatcher:
+    """
+    Builds match keys for requests with volatile values (timestamps, IDs) masked.
+    URLs under the configured roots are stored as templates ('{api}/non-payment-reasons/codes'),
+    so cassettes recorded against one host (e.g. a fake backend port) replay against another.
+    """
+
+    def __init__(self, extra_patterns=(), roots=None):
+        """
+        Initialize matcher.
+
+        Args:
+            extra_patterns (list): Regexes masked in addition to VOLATILE_PATTERNS
+            roots (dict): Template name -> URL root (e.g. {'base': base_url, 'api': api_base_url})
+        """
+        self._pattern = re.compile("|".join(f"(?:{pattern})" for pattern in VOLATILE_PATTERNS + tuple(extra_patterns)))
+        self._roots = sorted(
+            ((name, url.rstrip("/")) for name, url in (roots or {}).items() if url),
+            key=lambda root: len(root[1]), reverse=True
+        )
+
+    def template(self, url):
+        """Replace the longest matching URL root with its template name."""
+        for name, root in self._roots:
+            if url == root or url.startswith(root + "/") or url.startswith(root + "?"):
+                return "{" + name + "}" + url[len(root):]
+        return url
+
+    def normalize(self, text):
+        """Mask volatile values in a URL or body."""
+        return self._pattern.sub("<*>", text) if text else ""
+
+    def keys(self, method, url, body):
+        """
+        Match keys of a request, most to least specific.
+
+        Returns:
+            tuple: (method + URL + body, method + URL, method + path) keys
+        """
+        parts = urlsplit(self.template(url))
+        target = self.normalize(f"{parts.netloc}{parts.path}?{parts.query}")
+        body_digest = hashlib.sha1(self.normalize(body).encode("utf-8")).hexdigest()[:12] if body else ""
+        return (
+            f"{method} {target} {body_digest}",
+            f"{method} {target}",
+            f"{method} {self.normalize(parts.netloc + parts.path)}"
+        )
+
+
+def _decode_text(data):
+    """Get request/response bytes as text, or None if they are binary."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+class SessionCassette:
+    """Recorded exchanges of one test, in request order."""
+
+    def __init__(self, path, exchanges=None):
+        self.path = path
+        self.exchanges = exchanges or []
+
+    @classmethod
+    def load(cls, path):
+        """Load a cassette file."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(path, json.load(f)['exchanges'])
+
+    def add(self, request, matcher=None):
+        """
+        Add a captured selenium-wire request and its response.
+
+        Args:
+            request: selenium-wire request
+            matcher (VolatileMatcher): Stores the URL as a template of the matcher's roots
+
+        Returns:
+            bool: True if the request had a response to record
+        """
+        response = request.response
+        if response is None:
+            return False
+
+        from seleniumwire.utils import decode
+
+        body = decode(response.body, response.headers.get('Content-Encoding', 'identity')) if response.body else b""
+        text = _decode_text(body)
+
+        duration_ms = None
+        if getattr(response, 'date', None) and getattr(request, 'date', None):
+            duration_ms = round((response.date - request.date).total_seconds() * 1000, 1)
+
+        self.exchanges.append({
+            'method': request.method,
+            'url': matcher.template(request.url) if matcher else request.url,
+            'request_body': _decode_text(request.body) if request.body else None,
+            'status': response.status_code,
+            'headers': [[name, value] for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS],
+            'body': text if text is not None else base64.b64encode(body).decode("ascii"),
+            'body_encoding': "utf-8" if text is not None else "base64",
+            'duration_ms': duration_ms
+        })
+        return True
+
+    def save(self):
+        """Write the cassette atomically (compact gzip JSON)."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump({'version': CASSETTE_VERSION, 'exchanges': self.exchanges}, f, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+
+
+class CassettePlayer:
+    """
+    Serves recorded responses for one test.
+    Requests are matched against the test's own cassette first and then against every
+    cassette of the library, e.g. for a login another test recorded. Repeated requests
+    (polling) get the recorded responses in order, the last one repeating.
+    """
+
+    def __init__(self, own_exchanges, library_index, matcher, latency=LATENCY_ZERO, logger=None):
+        self.matcher = matcher
+        self.latency = latency
+        self.logger = logger
+        self.misses = []
+
+        self._own = self._index(own_exchanges)
+        self._library = library_index
+        self._lock = threading.Lock()
+
+    def _index(self, exchanges):
+        index = defaultdict(deque)
+        for exchange in exchanges:
+            for key in self.matcher.keys(exchange['method'], exchange['url'], exchange.get('request_body')):
+                index[key].append(exchange)
+        return index
+
+    def __call__(self, request):
+        """
+        Respond to an intercepted request.
+
+        Returns:
+            tuple: (status, headers, body bytes, delay_ms)
+        """
+        body = _decode_text(request.body) if request.body else None
+        keys = self.matcher.keys(request.method, request.url, body)
+
+        exchange = None
+        with self._lock:
+            for index in (self._own, self._library):
+                for key in keys:
+                    queue = index.get(key)
+                    if queue:
+                        exchange = queue.popleft() if len(queue) > 1 else queue[0]
+                        break
+                if exchange:
+                    break
+
+        if exchange is None:
+            self.misses.append(f"{request.method} {request.url}")
+            if self.logger:
+                self.logger.warning(f"No recorded response for {request.method} {request.url}")
+            message = json.dumps({'success': False, 'message': "No recorded response"}).encode("utf-8")
+            return MISS_STATUS, [('Content-Type', 'application/json')], message, 0
+
+        if exchange.get('body_encoding') == "base64":
+            payload = base64.b64decode(exchange['body'])
+        else:
+            payload = exchange['body'].encode("utf-8")
+
+        headers = [tuple(header) for header in exchange['headers']]
+        headers.append(('Content-Length', str(len(payload))))
+        return exchange['status'], headers, payload, replay_delay_ms(exchange.get('duration_ms'), self.latency)
+
+
+class CassetteLibrary:
+    """Cassettes of a run, one file per test in a directory."""
+
+    def __init__(self, directory, mode=MODE_REPLAY, roots=None, extra_volatile_patterns=(), latency=LATENCY_ZERO,
+                 logger=None):
+        """
+        Initialize cassette library.
+
+        Args:
+            directory (str): Cassette directory
+            mode (str): MODE_RECORD or MODE_REPLAY
+            roots (dict): Template name -> URL root of the recorded application (base, api)
+            extra_volatile_patterns (list): Regexes masked in addition to VOLATILE_PATTERNS
+            latency: Replay latency (LATENCY_ZERO, LATENCY_RECORDED or a scale factor)
+            logger: Logger instance
+        """
+        self.directory = directory
+        self.mode = mode
+        self.matcher = VolatileMatcher(extra_volatile_patterns, roots)
+        self.latency = latency if latency in (None, LATENCY_ZERO, LATENCY_RECORDED) else float(latency)
+        self.logger = logger
+
+        self._index = None
+        self._lock = threading.Lock()
+
+    def path_for(self, nodeid):
+        """Cassette file of a test."""
+        return cassette_path(self.directory, nodeid)
+
+    def record(self, nodeid, requests):
+        """
+        Write the captured requests of a test to its cassette.
+
+        Args:
+            nodeid (str): Pytest node ID
+            requests (list): selenium-wire requests captured during the test
+
+        Returns:
+            int: Number of exchanges recorded
+        """
+        cassette = SessionCassette(self.path_for(nodeid))
+        recorded = sum(1 for request in requests if cassette.add(request, self.matcher))
+        cassette.save()
+
+        if self.logger:
+            self.logger.info(f"Recorded {recorded} exchanges to {cassette.path}")
+        return recorded
+
+    def player(self, nodeid):
+        """
+        Get the replay responder of a test.
+
+        Returns:
+            CassettePlayer: Responder for NetworkController.set_fallback()
+        """
+        path = self.path_for(nodeid)
+        own = SessionCassette.load(path).exchanges if os.path.exists(path) else []
+        if not own and self.logger:
+            self.logger.warning(f"No cassette for {nodeid}; replaying from other tests' recordings only")
+        return CassettePlayer(own, self._library_index(), self.matcher, self.latency, self.logger)
+
+    def _library_index(self):
+        """Index of every recorded exchange, loaded once per session (shared, read-only keys)."""
+        with self._lock:
+            if self._index is None:
+                index = defaultdict(list)
+                for path in sorted(glob.glob(os.path.join(self.directory, "*.json.gz"))):
+                    try:
+                        exchanges = SessionCassette.load(path).exchanges
+                    except (OSError, ValueError, KeyError) as e:
+                        if self.logger:
+                            self.logger.warning(f"Skipping unreadable cassette {path}: {str(e)}")
+                        continue
+                    for exchange in exchanges:
+                        for key in self.matcher.keys(exchange['method'], exchange['url'], exchange.get('request_body')):
+                            index[key].append(exchange)
+                self._index = index
+
+        # Each player consumes its own copy of the queues
+        return {key: deque(exchanges) for key, exchanges in self._index.items()}
@@ -5,10 +5,55 @@ Provides test data generation, management, and validation functionality.
 
 import random
 import string
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from faker import Faker
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional
+import numpy as np
+import pandas as pd
+
+
+SERVICE_TYPES = ["Mobile", "Internet", "TV", "Bundle"]
+APPOINTMENT_TIMES = ["09:00", "10:00", "11:00", "14:00", "15:00", "16:00"]  # business hours
+DISCONNECT_OPTION1 = "Option 2: Disconnect after Option 1 and until end of month disconnect completely"
+DISCONNECT_OPTION2 = "Select specific disconnect date"
+DISCONNECT_STATUSES = ["Maintain", "Temporary"]
+CONTRACT_STATUSES = ["overdue", "paid", "pending"]
+
+EPOCH = date(1970, 1, 1)
+NO_DATE = np.iinfo(np.int32).min  # epoch-day value of an absent date
+
+# Row layout of TestDataColumns: enums are indexes into the lists above (or the
+# container's pools), dates are days since EPOCH
+COLUMNAR_DTYPE = np.dtype([
+    ("id", np.uint32),
+    ("contract_number", np.uint32),  # contract_id without the "CON" prefix
+    ("customer_name", np.int32),  # index into the names pool
+    ("status", np.uint8),
+    ("payment_due_date", np.int32),
+    ("amount_due", np.float64),
+    ("service_type", np.uint8),
+    ("reason", np.uint8),  # index into the reason hierarchies
+    ("appointment_date", np.int32),
+    ("appointment_time", np.uint8),
+    ("notes", np.int32),  # index into the notes pool
+    ("disconnect_date", np.int32),  # NO_DATE when the record has no disconnect data
+    ("disconnect_status", np.uint8),
+])
+
+
+def _disconnect_date_window(current_date):
+    """
+    Get the month and first allowed day for a disconnect date (13th to end of month, in future).
+    
+    Returns:
+        tuple: (first day of the month to use, lowest allowed day)
+    """
+    # If current date is after 13th, use next month
+    if current_date.day >= 13:
+        next_month = (current_date.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return next_month, 13
+    return current_date.replace(day=1), max(13, current_date.day + 1)
 
 
 @dataclass
@@ -47,27 +92,262 @@ class DisconnectData:
     status: str = None
 
 
+class ContractRecord(NamedTuple):
+    """Immutable, compact contract record."""
+    contract_id: str
+    customer_name: str
+    status: str
+    payment_due_date: date
+    amount_due: float
+    service_type: str
+    
+    def to_dataclass(self):
+        """Convert to the mutable TestContract used by page helpers."""
+        return TestContract(self.contract_id, self.customer_name, self.status,
+                            self.payment_due_date.strftime("%Y-%m-%d"), self.amount_due, self.service_type)
+
+
+class ReasonRecord(NamedTuple):
+    """Immutable reason hierarchy record."""
+    level1: str
+    level2: Optional[str] = None
+    level3: Optional[str] = None
+    
+    def to_dataclass(self):
+        """Convert to ReasonHierarchy."""
+        return ReasonHierarchy(self.level1, self.level2, self.level3)
+
+
+class AppointmentRecord(NamedTuple):
+    """Immutable appointment record."""
+    date: date
+    time: str
+    notes: str
+    
+    def to_dataclass(self):
+        """Convert to AppointmentData."""
+        return AppointmentData(self.date.strftime("%Y-%m-%d"), self.time, self.notes)
+
+
+class DisconnectRecord(NamedTuple):
+    """Immutable service disconnection record."""
+    option1: str
+    option2: Optional[str] = None
+    disconnect_date: Optional[date] = None
+    status: Optional[str] = None
+    
+    def to_dataclass(self):
+        """Convert to DisconnectData."""
+        disconnect_date = self.disconnect_date.strftime("%Y-%m-%d") if self.disconnect_date else None
+        return DisconnectData(self.option1, self.option2, disconnect_date, self.status)
+
+
+class PerformanceRecord(NamedTuple):
+    """One decoded row of TestDataColumns."""
+    id: int
+    contract: ContractRecord
+    reason_hierarchy: ReasonRecord
+    appointment: AppointmentRecord
+    notes: str
+    disconnect: Optional[DisconnectRecord]
+    timestamp: datetime
+
+
+def _epoch_date(days):
+    """Decode an epoch-day value (None for NO_DATE)."""
+    return None if days == NO_DATE else EPOCH + timedelta(days=int(days))
+
+
+def _epoch_date_strings(days):
+    """Decode an epoch-day array to YYYY-MM-DD strings."""
+    return np.asarray(days, dtype=np.int64).astype("datetime64[D]").astype(str).astype(object)
+
+
+def _categorical(codes, labels):
+    """Build a categorical from integer codes into labels that may repeat or be None."""
+    categories = [label for label in dict.fromkeys(labels) if label is not None]
+    lookup = np.array([categories.index(label) if label is not None else -1 for label in labels])
+    return pd.Categorical.from_codes(lookup[codes], categories)
+
+
+class TestDataColumns:
+    """
+    Columnar test records in a NumPy structured array (about 40 bytes per record).
+    Slicing returns a container over a view of the same buffer; rows are decoded
+    into records or dataclasses only when a test accesses them.
+    """
+    
+    __slots__ = ("data", "names", "notes", "reasons", "created_at")
+    
+    def __init__(self, data, names, notes, reasons, created_at):
+        """
+        Initialize columnar container.
+        
+        Args:
+            data (numpy.ndarray): Structured array with COLUMNAR_DTYPE
+            names (numpy.ndarray): Customer name pool
+            notes (numpy.ndarray): Notes pool
+            reasons (tuple): ReasonRecord per reason code
+            created_at (datetime): Generation time of the records
+        """
+        self.data = data
+        self.names = names
+        self.notes = notes
+        self.reasons = reasons
+        self.created_at = created_at
+        
+    def __len__(self):
+        return len(self.data)
+        
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.row(index)
+        return TestDataColumns(self.data[index], self.names, self.notes, self.reasons, self.created_at)
+        
+    def __iter__(self):
+        for index in range(len(self.data)):
+            yield self.row(index)
+            
+    @property
+    def nbytes(self):
+        """Size of the record buffer in bytes (pools are shared and not counted)."""
+        return self.data.nbytes
+        
+    def has_disconnect(self):
+        """Boolean mask of records carrying disconnect data."""
+        return self.data["disconnect_date"] != NO_DATE
+        
+    def row(self, index):
+        """
+        Decode one record.
+        
+        Args:
+            index (int): Row index
+            
+        Returns:
+            PerformanceRecord: Immutable record
+        """
+        item = self.data[index]
+        
+        disconnect = None
+        if item["disconnect_date"] != NO_DATE:
+            disconnect = DisconnectRecord(
+                DISCONNECT_OPTION1, DISCONNECT_OPTION2,
+                _epoch_date(item["disconnect_date"]), DISCONNECT_STATUSES[item["disconnect_status"]]
+            )
+            
+        return PerformanceRecord(
+            id=int(item["id"]),
+            contract=ContractRecord(
+                f"CON{item['contract_number']}",
+                self.names[item["customer_name"]],
+                CONTRACT_STATUSES[item["status"]],
+                _epoch_date(item["payment_due_date"]),
+                float(item["amount_due"]),
+                SERVICE_TYPES[item["service_type"]]
+            ),
+            reason_hierarchy=self.reasons[item["reason"]],
+            appointment=AppointmentRecord(
+                _epoch_date(item["appointment_date"]),
+                APPOINTMENT_TIMES[item["appointment_time"]],
+                self.notes[item["notes"]]
+            ),
+            notes=self.notes[item["notes"]],
+            disconnect=disconnect,
+            timestamp=self.created_at
+        )
+        
+    def materialize(self, index):
+        """
+        Decode one record into the dict-of-dataclasses shape of create_performance_test_data().
+        
+        Args:
+            index (int): Row index
+            
+        Returns:
+            Dict: Record with TestContract, ReasonHierarchy, AppointmentData and DisconnectData values
+        """
+        record = self.row(index)
+        data = {
+            "id": record.id,
+            "contract": record.contract.to_dataclass(),
+            "reason_hierarchy": record.reason_hierarchy.to_dataclass(),
+            "appointment": record.appointment.to_dataclass(),
+            "notes": record.notes,
+            "timestamp": record.timestamp.isoformat()
+        }
+        if record.disconnect:
+            data["disconnect"] = record.disconnect.to_dataclass()
+        return data
+        
+    def to_frame(self):
+        """
+        Decode all records into a DataFrame (enums become categoricals).
+        
+        Returns:
+            pandas.DataFrame: One row per record; disconnect columns are null for records without disconnect data
+        """
+        data = self.data
+        has_disconnect = self.has_disconnect()
+        disconnect_codes = np.where(has_disconnect, 0, -1)
+        
+        return pd.DataFrame({
+            "id": data["id"].astype(np.int64),
+            "contract_id": np.char.add("CON", data["contract_number"].astype(str)),
+            "customer_name": self.names[data["customer_name"]],
+            "status": pd.Categorical.from_codes(data["status"], CONTRACT_STATUSES),
+            "payment_due_date": _epoch_date_strings(data["payment_due_date"]),
+            "amount_due": data["amount_due"],
+            "service_type": pd.Categorical.from_codes(data["service_type"], SERVICE_TYPES),
+            "level1": _categorical(data["reason"], [reason.level1 for reason in self.reasons]),
+            "level2": _categorical(data["reason"], [reason.level2 for reason in self.reasons]),
+            "level3": _categorical(data["reason"], [reason.level3 for reason in self.reasons]),
+            "appointment_date": _epoch_date_strings(data["appointment_date"]),
+            "appointment_time": pd.Categorical.from_codes(data["appointment_time"], APPOINTMENT_TIMES),
+            "notes": self.notes[data["notes"]],
+            "has_disconnect": has_disconnect,
+            "disconnect_option1": pd.Categorical.from_codes(disconnect_codes, [DISCONNECT_OPTION1]),
+            "disconnect_option2": pd.Categorical.from_codes(disconnect_codes, [DISCONNECT_OPTION2]),
+            "disconnect_date": np.where(
+                has_disconnect, _epoch_date_strings(np.where(has_disconnect, data["disconnect_date"], 0)), None
+            ),
+            "disconnect_status": pd.Categorical.from_codes(
+                np.where(has_disconnect, data["disconnect_status"].astype(np.int16), -1), DISCONNECT_STATUSES
+            ),
+            "timestamp": self.created_at.isoformat()
+        })
+
+
 class TestDataManager:
     """
     Manages test data generation and validation for automation tests.
     Provides realistic data for various test scenarios.
     """
     
-    def __init__(self, config_data=None, logger=None):
+    def __init__(self, config_data=None, logger=None, seed=None, faker=None):
         """
         Initialize test data manager.
         
         Args:
             config_data (dict): Configuration data
             logger: Logger instance
+            seed (int): Seed for reproducible data (None for random data)
+            faker (Faker): Shared Faker instance (built per manager if omitted; reseeded when seed is set)
         """
         self.config_data = config_data or {}
         self.logger = logger
-        self.faker = Faker(['en_US', 'vi_VN'])  # English and Vietnamese locales
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.faker = faker or Faker(['en_US', 'vi_VN'])  # English and Vietnamese locales
+        if seed is not None:
+            self.faker.seed_instance(seed)
         
         # Predefined test data from configuration
-        self.predefined_contracts = config_data.get('test_data', {}).get('contracts', {})
-        self.predefined_reasons = config_data.get('test_data', {}).get('reasons', {})
+        self.predefined_contracts = self.config_data.get('test_data', {}).get('contracts', {})
+        self.predefined_reasons = self.config_data.get('test_data', {}).get('reasons', {})
+        
+        # Faker pools for bulk generation, keyed by (pool_size, seed)
+        self._bulk_pools = {}
         
     def generate_test_contract(self, status="overdue"):
         """
@@ -80,12 +360,12 @@ class TestDataManager:
             TestContract: Generated contract data
         """
         contract = TestContract(
-            contract_id=f"CON{random.randint(100000000, 999999999)}",
+            contract_id=f"CON{self.random.randint(100000000, 999999999)}",
             customer_name=self.faker.name(),
             status=status,
-            payment_due_date=(datetime.now() - timedelta(days=random.randint(1, 90))).strftime("%Y-%m-%d"),
-            amount_due=round(random.uniform(100000, 5000000), 2),  # VND amounts
-            service_type=random.choice(["Mobile", "Internet", "TV", "Bundle"])
+            payment_due_date=(datetime.now() - timedelta(days=self.random.randint(1, 90))).strftime("%Y-%m-%d"),
+            amount_due=round(self.random.uniform(100000, 5000000), 2),  # VND amounts
+            service_type=self.random.choice(SERVICE_TYPES)
         )
         
         if self.logger:
@@ -162,14 +442,9 @@ class TestDataManager:
         """
         appointment_date = datetime.now() + timedelta(days=days_ahead)
         
-        # Generate appointment time (business hours)
-        appointment_times = [
-            "09:00", "10:00", "11:00", "14:00", "15:00", "16:00"
-        ]
-        
         appointment = AppointmentData(
             date=appointment_date.strftime("%Y-%m-%d"),
-            time=random.choice(appointment_times),
+            time=self.random.choice(APPOINTMENT_TIMES),
             notes=self.faker.sentence(nb_words=10)
         )
         
@@ -186,26 +461,16 @@ class TestDataManager:
             DisconnectData: Generated disconnect data
         """
         disconnect = DisconnectData(
-            option1="Option 2: Disconnect after Option 1 and until end of month disconnect completely",
-            option2="Select specific disconnect date",
-            status=random.choice(["Maintain", "Temporary"])
+            option1=DISCONNECT_OPTION1,
+            option2=DISCONNECT_OPTION2,
+            status=self.random.choice(DISCONNECT_STATUSES)
         )
         
         if include_date:
             # Generate disconnect date between 13th and end of month, in future
-            current_date = datetime.now()
-            
-            # If current date is after 13th, use next month
-            if current_date.day >= 13:
-                next_month = current_date.replace(month=current_date.month + 1, day=1)
-                disconnect_day = random.randint(13, 28)  # Safe range for any month
-                disconnect_date = next_month.replace(day=disconnect_day)
-            else:
-                # Use current month
-                disconnect_day = random.randint(max(13, current_date.day + 1), 28)
-                disconnect_date = current_date.replace(day=disconnect_day)
-                
-            disconnect.disconnect_date = disconnect_date.strftime("%Y-%m-%d")
+            month_start, first_day = _disconnect_date_window(datetime.now())
+            disconnect_day = self.random.randint(first_day, 28)  # Safe range for any month
+            disconnect.disconnect_date = month_start.replace(day=disconnect_day).strftime("%Y-%m-%d")
             
         return disconnect
         
@@ -362,13 +627,14 @@ class TestDataManager:
             List[Dict]: List of performance test data
         """
         performance_data = []
+        reason_hierarchies = self.generate_reason_hierarchy_data()
         
         for i in range(num_records):
             data = {
                 "id": i + 1,
                 "contract": self.generate_test_contract(),
-                "reason_hierarchy": random.choice(self.generate_reason_hierarchy_data()),
-                "appointment": self.generate_appointment_data(days_ahead=random.randint(1, 30)),
+                "reason_hierarchy": self.random.choice(reason_hierarchies),
+                "appointment": self.generate_appointment_data(days_ahead=self.random.randint(1, 30)),
                 "notes": self.generate_notes_text("medium"),
                 "timestamp": datetime.now().isoformat()
             }
@@ -384,6 +650,119 @@ class TestDataManager:
             
         return performance_data
         
+    def generate_columnar_test_data(self, num_records, seed=None, pool_size=1000, start_id=1, rng=None):
+        """
+        Generate a large test dataset column-wise into a compact TestDataColumns container.
+        Names and notes are drawn from Faker pools sampled once per manager; every other
+        column is drawn with a NumPy generator, so the cost per record is a few array slots.
+        
+        Args:
+            num_records (int): Number of records to generate
+            seed (int): Seed for the NumPy generator and Faker pools (default: the manager's seed)
+            pool_size (int): Number of distinct names and notes to sample from Faker
+            start_id (int): ID of the first record
+            rng (numpy.random.Generator): Generator to draw from (overrides seed)
+            
+        Returns:
+            TestDataColumns: Structured array of records with shared string pools
+        """
+        seed = seed if seed is not None else self.seed
+        rng = rng if rng is not None else np.random.default_rng(seed)
+        names, notes = self._faker_pools(pool_size, seed)
+        reasons = tuple(ReasonRecord(reason.level1, reason.level2, reason.level3)
+                        for reason in self.generate_reason_hierarchy_data())
+        
+        now = datetime.now()
+        today = (now.date() - EPOCH).days
+        ids = np.arange(start_id, start_id + num_records)
+        
+        data = np.empty(num_records, dtype=COLUMNAR_DTYPE)
+        data["id"] = ids
+        data["contract_number"] = rng.integers(100000000, 1000000000, num_records)
+        data["customer_name"] = rng.integers(0, len(names), num_records)
+        data["status"] = CONTRACT_STATUSES.index("overdue")
+        data["payment_due_date"] = today - rng.integers(1, 91, num_records)
+        data["amount_due"] = np.round(rng.uniform(100000, 5000000, num_records), 2)  # VND amounts
+        data["service_type"] = rng.integers(0, len(SERVICE_TYPES), num_records)
+        data["reason"] = rng.integers(0, len(reasons), num_records)
+        data["appointment_date"] = today + rng.integers(1, 31, num_records)
+        data["appointment_time"] = rng.integers(0, len(APPOINTMENT_TIMES), num_records)
+        data["notes"] = rng.integers(0, len(notes), num_records)
+        
+        # Every third record carries disconnect data, as in create_performance_test_data()
+        month_start, first_day = _disconnect_date_window(now)
+        month_start_day = (month_start.date() - EPOCH).days
+        data["disconnect_date"] = np.where(
+            (ids - 1) % 3 == 0, month_start_day + rng.integers(first_day, 29, num_records) - 1, NO_DATE
+        )
+        data["disconnect_status"] = rng.integers(0, len(DISCONNECT_STATUSES), num_records)
+        
+        return TestDataColumns(data, names, notes, reasons, now)
+        
+    def generate_bulk_test_data(self, num_records, seed=None, pool_size=1000, start_id=1, rng=None):
+        """
+        Generate a large test dataset as a DataFrame for load scenarios.
+        
+        Args:
+            num_records (int): Number of records to generate
+            seed (int): Seed for the NumPy generator and Faker pools (default: the manager's seed)
+            pool_size (int): Number of distinct names and notes to sample from Faker
+            start_id (int): ID of the first record
+            rng (numpy.random.Generator): Generator to draw from (overrides seed)
+            
+        Returns:
+            pandas.DataFrame: One row per record; disconnect columns are null for records without disconnect data
+        """
+        frame = self.generate_columnar_test_data(num_records, seed, pool_size, start_id, rng).to_frame()
+            
+        if self.logger:
+            self.logger.info(f"Generated {num_records} bulk test records")
+            
+        return frame
+        
+    def iter_bulk_test_records(self, num_records, chunk_size=10000, seed=None, pool_size=1000):
+        """
+        Stream a large test dataset as chunks of record dicts.
+        Only one chunk is held in memory; the stream is reproducible for a given
+        seed and chunk size.
+        
+        Args:
+            num_records (int): Total number of records
+            chunk_size (int): Records per chunk
+            seed (int): Seed for reproducible data (default: the manager's seed)
+            pool_size (int): Number of distinct names and notes to sample from Faker
+            
+        Yields:
+            List[Dict]: Records of one chunk
+        """
+        seed = seed if seed is not None else self.seed
+        rng = np.random.default_rng(seed)
+        
+        for start in range(0, num_records, chunk_size):
+            frame = self.generate_bulk_test_data(
+                min(chunk_size, num_records - start), seed=seed, pool_size=pool_size, start_id=start + 1, rng=rng
+            )
+            yield frame.astype(object).where(frame.notna(), None).to_dict("records")
+            
+    def _faker_pools(self, pool_size, seed=None):
+        """
+        Get (names, notes) arrays pre-sampled from Faker, cached per pool size and seed.
+        
+        Returns:
+            tuple: NumPy object arrays of customer names and medium-length notes
+        """
+        key = (pool_size, seed)
+        
+        if key not in self._bulk_pools:
+            if seed is not None:
+                self.faker.seed_instance(seed)
+            self._bulk_pools[key] = (
+                np.array([self.faker.name() for _ in range(pool_size)], dtype=object),
+                np.array([self.faker.paragraph(nb_sentences=3) for _ in range(pool_size)], dtype=object)
+            )
+            
+        return self._bulk_pools[key]
+        
     def get_role_specific_test_data(self, role):
         """
         Get role-specific test data.
@@ -396,7 +775,7 @@ class TestDataManager:
         """
         base_data = {
             "contract": self.generate_test_contract(),
-            "reason_hierarchy": random.choice(self.generate_reason_hierarchy_data()),
+            "reason_hierarchy": self.random.choice(self.generate_reason_hierarchy_data()),
             "appointment": self.generate_appointment_data(),
             "notes": self.generate_notes_text()
         }
@@ -0,0 +1,149 @@
+"""
+Deterministic test data provisioning for Mobinet NextGen automation framework.
+Derives a seed per test from the run seed and node ID, shares one Faker instance
+per worker, and memoizes generated datasets on disk so reruns reuse identical data.
+"""
+
+import hashlib
+import os
+import pickle
+from datetime import date
+
+from faker import Faker
+
+from utils.test_data_manager import TestDataManager
+
+
+# Bump when generated data changes for the same seed, to invalidate cached datasets
+GENERATOR_VERSION = 2
+
+DEFAULT_DATA_CACHE_DIR = os.path.join(".cache", "test_data")
+
+
+def derive_seed(run_seed, nodeid):
+    """
+    Derive a stable per-test seed.
+
+    Args:
+        run_seed (int): Seed of the run
+        nodeid (str): Pytest node ID
+
+    Returns:
+        int: 32-bit seed, identical on every worker and rerun
+    """
+    digest = hashlib.sha256(f"{run_seed}:{nodeid}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big')
+
+
+class TestDataProvider:
+    """
+    Session-level source of seeded TestDataManager instances and cached datasets.
+    Data generated for a test depends only on the run seed and its node ID, not on
+    which xdist worker runs it or which tests ran before it.
+    """
+
+    def __init__(self, config_data=None, run_seed=0, cache_dir=DEFAULT_DATA_CACHE_DIR, logger=None):
+        """
+        Initialize test data provider.
+
+        Args:
+            config_data (dict): Configuration data
+            run_seed (int): Seed of the run
+            cache_dir (str): Directory for memoized datasets (None disables the disk cache)
+            logger: Logger instance
+        """
+        self.config_data = config_data or {}
+        self.run_seed = run_seed
+        self.cache_dir = cache_dir
+        self.logger = logger
+
+        self._faker = None
+        self._memory = {}
+
+    @property
+    def faker(self):
+        """Multi-locale Faker built once per worker."""
+        if self._faker is None:
+            self._faker = Faker(['en_US', 'vi_VN'])
+        return self._faker
+
+    def seed_for(self, nodeid):
+        """Get the seed of a test."""
+        return derive_seed(self.run_seed, nodeid)
+
+    def manager(self, nodeid):
+        """
+        Get a TestDataManager seeded for a test.
+
+        Args:
+            nodeid (str): Pytest node ID
+
+        Returns:
+            TestDataManager: Manager sharing the worker's Faker instance
+        """
+        return TestDataManager(self.config_data, self.logger, seed=self.seed_for(nodeid), faker=self.faker)
+
+    def dataset(self, nodeid, method, *args):
+        """
+        Get the result of a TestDataManager generator for a test, memoized by seed.
+
+        Args:
+            nodeid (str): Pytest node ID
+            method (str): TestDataManager method name, e.g. 'get_role_specific_test_data'
+            *args: Arguments of the method
+
+        Returns:
+            Any: Generated data, identical across reruns of the test
+        """
+        name = "-".join([method] + [str(arg) for arg in args])
+        return self.cached(name, self.seed_for(nodeid), lambda: getattr(self.manager(nodeid), method)(*args))
+
+    def cached(self, name, seed, build):
+        """
+        Get a dataset, building it only if it is not memoized in memory or on disk.
+        Keys include today's date because generated dates are relative to the current day.
+
+        Args:
+            name (str): Dataset name
+            seed (int): Seed the dataset is generated from
+            build (callable): Builds the dataset when it is not cached (result must be picklable)
+
+        Returns:
+            Any: Dataset
+        """
+        key = f"{name}-{seed}-v{GENERATOR_VERSION}-{date.today().isoformat()}"
+        if key in self._memory:
+            return self._memory[key]
+
+        path = os.path.join(self.cache_dir, f"{key}.pickle") if self.cache_dir else None
+        dataset = self._read(path) if path else None
+
+        if dataset is None:
+            dataset = build()
+            if path:
+                self._write(path, dataset)
+        elif self.logger:
+            self.logger.debug("Reused cached test data %s", key)
+
+        self._memory[key] = dataset
+        return dataset
+
+    def _read(self, path):
+        """Read a cached dataset, treating a missing or unreadable file as a miss."""
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+            return None
+
+    def _write(self, path, dataset):
+        """Write a dataset atomically (several workers may build the same key)."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(dataset, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Could not cache test data {path}: {str(e)}")
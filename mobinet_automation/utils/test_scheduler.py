@@ -0,0 +1,295 @@
+"""
+Duration-aware test scheduling for Mobinet NextGen automation framework.
+Records per-test wall time across runs and packs tests onto pytest-xdist workers
+longest-processing-time first, keeping tests that share a role session together.
+"""
+
+import json
+import os
+import statistics
+import threading
+from datetime import datetime
+
+import pytest
+
+
+DEFAULT_DURATIONS_FILE = os.path.join("reports", "durations.json")
+
+# Group name prefix used for the xdist_group marker of each worker bin
+BIN_GROUP_PREFIX = "duration-bin-"
+
+
+class DurationStore:
+    """
+    Local store of per-test wall times from previous runs.
+    Durations are smoothed with an exponentially weighted mean so one slow run
+    does not dominate the schedule.
+    """
+
+    def __init__(self, path=DEFAULT_DURATIONS_FILE, smoothing=0.5, logger=None):
+        """
+        Initialize duration store.
+
+        Args:
+            path (str): JSON file holding recorded durations
+            smoothing (float): Weight of the newest run in the smoothed mean (0-1]
+            logger: Logger instance
+        """
+        self.path = path
+        self.smoothing = smoothing
+        self.logger = logger
+
+        self._durations = self._read()
+        self._lock = threading.Lock()
+
+    def get(self, nodeid, default=None):
+        """
+        Get the expected duration of a test.
+
+        Args:
+            nodeid (str): Pytest node ID
+            default (float): Value returned for unknown tests
+
+        Returns:
+            float: Expected duration in seconds
+        """
+        entry = self._durations.get(nodeid)
+        return entry['mean'] if entry else default
+
+    def known_durations(self):
+        """Get all recorded expected durations."""
+        return [entry['mean'] for entry in self._durations.values()]
+
+    def record(self, nodeid, duration):
+        """
+        Record the measured wall time of a test.
+
+        Args:
+            nodeid (str): Pytest node ID
+            duration (float): Measured duration in seconds
+        """
+        with self._lock:
+            entry = self._durations.get(nodeid)
+            if entry:
+                entry['mean'] = self.smoothing * duration + (1 - self.smoothing) * entry['mean']
+                entry['runs'] += 1
+            else:
+                entry = {'mean': duration, 'runs': 1}
+                self._durations[nodeid] = entry
+            entry['last'] = duration
+            entry['updated_at'] = datetime.now().isoformat()
+
+    def save(self):
+        """Write the store to disk atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with self._lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._durations, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+        if self.logger:
+            self.logger.info(f"Saved {len(self._durations)} test durations to {self.path}")
+
+    def _read(self):
+        """Read the store, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+class SchedulePlan:
+    """Assignment of tests to worker bins with predicted loads."""
+
+    __slots__ = ("assignments", "loads", "roles")
+
+    def __init__(self, worker_count):
+        self.assignments = {}
+        self.loads = [0.0] * worker_count
+        self.roles = [set() for _ in range(worker_count)]
+
+    @property
+    def makespan(self):
+        """Predicted wall time of the slowest worker."""
+        return max(self.loads) if self.loads else 0.0
+
+    def to_dict(self):
+        """Serializable summary of the plan."""
+        return {
+            'predicted_makespan': round(self.makespan, 2),
+            'predicted_loads': [round(load, 2) for load in self.loads],
+            'roles': [sorted(roles) for roles in self.roles]
+        }
+
+
+def build_schedule(tests, worker_count, login_cost=0.0):
+    """
+    Pack tests onto workers longest-processing-time first.
+    A worker that has not yet served a test's role is charged login_cost for it,
+    so tests sharing a role drift onto the same warm browser unless that would
+    lengthen the makespan.
+
+    Args:
+        tests (list): (nodeid, expected_duration, role) tuples; role may be None
+        worker_count (int): Number of workers
+        login_cost (float): Estimated seconds for a cold UI login
+
+    Returns:
+        SchedulePlan: Assignment of node IDs to worker indexes
+    """
+    plan = SchedulePlan(max(worker_count, 1))
+
+    for nodeid, duration, role in sorted(tests, key=lambda test: (-test[1], test[0])):
+        def finish_time(index):
+            cost = duration
+            if role and role not in plan.roles[index]:
+                cost += login_cost
+            return plan.loads[index] + cost
+
+        target = min(range(len(plan.loads)), key=lambda index: (finish_time(index), index))
+        plan.loads[target] = finish_time(target)
+        if role:
+            plan.roles[target].add(role)
+        plan.assignments[nodeid] = target
+
+    return plan
+
+
+def estimate_default_duration(store, fallback=10.0):
+    """
+    Expected duration for tests without history: the median of known tests.
+
+    Args:
+        store (DurationStore): Duration store
+        fallback (float): Value used when the store is empty
+
+    Returns:
+        float: Duration in seconds
+    """
+    known = store.known_durations()
+    return statistics.median(known) if known else fallback
+
+
+def strip_bin_suffix(nodeid):
+    """Remove the '@duration-bin-N' suffix xdist appends to grouped node IDs."""
+    head, separator, tail = nodeid.rpartition(f"@{BIN_GROUP_PREFIX}")
+    if separator and tail.isdigit():
+        return head
+    return nodeid
+
+
+class DurationSchedulerPlugin:
+    """
+    Pytest plugin recording test durations and, when enabled, assigning tests to
+    pytest-xdist workers through xdist_group markers (run with --dist loadgroup).
+    Every worker computes the same plan from the same store and collection.
+    """
+
+    def __init__(self, config, store, role_fixtures=None, login_cost=0.0, default_duration=10.0):
+        """
+        Initialize scheduler plugin.
+
+        Args:
+            config: Pytest config
+            store (DurationStore): Duration store
+            role_fixtures (dict): Fixture name to role key for authenticated sessions
+            login_cost (float): Estimated seconds for a cold UI login
+            default_duration (float): Duration assumed for tests without history on an empty store
+        """
+        self.enabled = config.getoption("duration_schedule", False)
+        self.is_worker = hasattr(config, "workerinput")
+        self.store = store
+        self.role_fixtures = role_fixtures or {}
+        self.login_cost = login_cost
+        self.default_duration = default_duration
+
+        self.predicted = None
+        self.test_durations = {}
+        self.worker_loads = {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        """Assign collected tests to worker bins (before xdist reads the group markers)."""
+        if not self.enabled:
+            return
+
+        worker_count = config.workerinput.get('workercount', 1) if self.is_worker else 1
+        default_duration = estimate_default_duration(self.store, self.default_duration)
+
+        tests = [
+            (item.nodeid, self.store.get(item.nodeid, default_duration), self._role_of(item))
+            for item in items
+        ]
+        plan = build_schedule(tests, worker_count, login_cost=self.login_cost)
+
+        if self.is_worker:
+            for item in items:
+                item.add_marker(pytest.mark.xdist_group(name=f"{BIN_GROUP_PREFIX}{plan.assignments[item.nodeid]}"))
+            config.workeroutput['duration_schedule'] = plan.to_dict()
+        else:
+            self.predicted = plan.to_dict()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collect the plan computed by an xdist worker."""
+        schedule = getattr(node, 'workeroutput', {}).get('duration_schedule')
+        if schedule:
+            self.predicted = schedule
+
+    def pytest_runtest_logreport(self, report):
+        """Accumulate setup, call and teardown time per test and per worker."""
+        if self.is_worker:
+            return
+
+        nodeid = strip_bin_suffix(report.nodeid)
+        worker_id = getattr(report, 'worker_id', 'main')
+
+        self.test_durations[nodeid] = self.test_durations.get(nodeid, 0.0) + report.duration
+        self.worker_loads[worker_id] = self.worker_loads.get(worker_id, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        """Persist this run's durations for the next schedule."""
+        if self.is_worker or not self.test_durations:
+            return
+
+        for nodeid, duration in self.test_durations.items():
+            self.store.record(nodeid, duration)
+
+        try:
+            self.store.save()
+        except OSError as e:
+            session.config.get_terminal_writer().line(f"Could not save test durations: {str(e)}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report predicted versus actual makespan."""
+        if not self.enabled or self.is_worker:
+            return
+
+        terminalreporter.section("duration schedule")
+
+        if self.predicted:
+            loads = ", ".join(f"{load:.1f}s" for load in self.predicted['predicted_loads'])
+            terminalreporter.line(f"Predicted makespan: {self.predicted['predicted_makespan']:.1f}s (worker loads: {loads})")
+        else:
+            terminalreporter.line("Predicted makespan: not available")
+
+        if self.worker_loads:
+            actual = max(self.worker_loads.values())
+            loads = ", ".join(f"{worker}={load:.1f}s" for worker, load in sorted(self.worker_loads.items()))
+            terminalreporter.line(f"Actual makespan:    {actual:.1f}s ({loads})")
+
+            if self.predicted and self.predicted['predicted_makespan']:
+                error = (actual - self.predicted['predicted_makespan']) / self.predicted['predicted_makespan'] * 100
+                terminalreporter.line(f"Prediction error:   {error:+.1f}%")
+
+    def _role_of(self, item):
+        """Get the role key of the authenticated session fixture a test uses."""
+        for fixture_name in getattr(item, 'fixturenames', ()):
+            if fixture_name in self.role_fixtures:
+                return self.role_fixtures[fixture_name]
+        return None
@@ -0,0 +1,251 @@
+"""
+Performance trace capture for Mobinet NextGen automation framework.
+Collects Chrome DevTools trace events and network activity from ChromeDriver's
+performance log during a test and writes them as a gzip trace and HAR.
+"""
+
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+
+PERFORMANCE_LOG = "performance"
+
+# Artifact suffixes appended to the base path by write_capture()
+TRACE_SUFFIX = ".trace.json.gz"
+HAR_SUFFIX = ".har.gz"
+
+# Trace categories of the DevTools Performance panel recording
+DEFAULT_TRACE_CATEGORIES = (
+    "devtools.timeline,disabled-by-default-devtools.timeline,disabled-by-default-devtools.timeline.frame,"
+    "v8.execute,blink.user_timing,loading,latencyInfo"
+)
+
+HAR_CREATOR = {'name': "mobinet-automation", 'version': "1.0"}
+
+
+def apply_chrome_capture_options(options, capture_config):
+    """
+    Enable the ChromeDriver performance log with network events and tracing.
+    ChromeDriver traces for the browser's whole life once enabled, so only the
+    browsers handed to capturing tests get these options.
+
+    Args:
+        options: ChromeOptions to extend
+        capture_config (dict): performance.trace_capture configuration
+    """
+    options.set_capability('goog:loggingPrefs', {PERFORMANCE_LOG: 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {
+        'enableNetwork': True,
+        'enablePage': False,
+        'traceCategories': capture_config.get('trace_categories') or DEFAULT_TRACE_CATEGORIES,
+    })
+
+
+class CaptureResult(NamedTuple):
+    """Trace and HAR of one test plus the time the capture itself cost."""
+    trace: dict
+    har: dict
+    overhead: float  # seconds spent draining, parsing and serializing
+    trace_events: int
+    har_entries: int
+
+
+def _headers(headers):
+    return [{'name': name, 'value': str(value)} for name, value in (headers or {}).items()]
+
+
+def _timing_span(timing, start, end):
+    """Duration between two ResourceTiming offsets, -1 when the phase did not happen."""
+    if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+        return -1
+    return round(timing[end] - timing[start], 3)
+
+
+class _HarBuilder:
+    """Assembles HAR 1.2 entries from Network.* DevTools events."""
+
+    def __init__(self):
+        self.entries = []
+        self._pending = {}
+
+    def add(self, method, params):
+        request_id = params.get('requestId')
+        if method == "Network.requestWillBeSent":
+            if 'redirectResponse' in params and request_id in self._pending:
+                self._response(request_id, params['redirectResponse'])
+                self._finish(request_id, params['timestamp'], redirect_url=params['request']['url'])
+            self._pending[request_id] = {
+                'request': params['request'],
+                'wall_time': params.get('wallTime', time.time()),
+                'timestamp': params['timestamp'],
+                'type': params.get('type'),
+            }
+        elif request_id not in self._pending:
+            return
+        elif method == "Network.responseReceived":
+            self._response(request_id, params['response'])
+        elif method == "Network.loadingFinished":
+            self._pending[request_id]['body_size'] = params.get('encodedDataLength', -1)
+            self._finish(request_id, params['timestamp'])
+        elif method == "Network.loadingFailed":
+            self._pending[request_id]['error'] = params.get('errorText')
+            self._finish(request_id, params['timestamp'])
+
+    def _response(self, request_id, response):
+        self._pending[request_id]['response'] = response
+
+    def _finish(self, request_id, timestamp, redirect_url=""):
+        pending = self._pending.pop(request_id)
+        request = pending['request']
+        response = pending.get('response') or {}
+        timing = response.get('timing') or {}
+
+        total = round((timestamp - pending['timestamp']) * 1000, 3)
+        send = _timing_span(timing, 'sendStart', 'sendEnd')
+        wait = _timing_span(timing, 'sendEnd', 'receiveHeadersEnd')
+        receive = -1
+        if timing.get('receiveHeadersEnd', -1) >= 0:
+            receive = max(round((timestamp - timing['requestTime']) * 1000 - timing['receiveHeadersEnd'], 3), 0)
+        http_version = response.get('protocol', "http/1.1").upper()
+        post_data = request.get('postData')
+
+        entry = {
+            'startedDateTime': datetime.fromtimestamp(pending['wall_time'], timezone.utc).isoformat(),
+            'time': total,
+            'request': {
+                'method': request['method'],
+                'url': request['url'],
+                'httpVersion': http_version,
+                'headers': _headers(request.get('headers')),
+                'queryString': [],
+                'cookies': [],
+                'headersSize': -1,
+                'bodySize': len(post_data) if post_data else 0,
+            },
+            'response': {
+                'status': response.get('status', 0),
+                'statusText': response.get('statusText', pending.get('error') or ""),
+                'httpVersion': http_version,
+                'headers': _headers(response.get('headers')),
+                'cookies': [],
+                'content': {'size': pending.get('body_size', -1), 'mimeType': response.get('mimeType', "")},
+                'redirectURL': redirect_url,
+                'headersSize': -1,
+                'bodySize': pending.get('body_size', -1),
+            },
+            'cache': {},
+            'timings': {
+                'blocked': next((timing[key] for key in ('dnsStart', 'connectStart', 'sendStart') if timing.get(key, -1) >= 0), -1),
+                'dns': _timing_span(timing, 'dnsStart', 'dnsEnd'),
+                'connect': _timing_span(timing, 'connectStart', 'connectEnd'),
+                'ssl': _timing_span(timing, 'sslStart', 'sslEnd'),
+                'send': max(send, 0),
+                'wait': max(wait, 0),
+                'receive': max(receive, 0),
+            },
+            '_resourceType': pending.get('type'),
+        }
+        if post_data:
+            entry['request']['postData'] = {'mimeType': request.get('headers', {}).get('Content-Type', ""), 'text': post_data}
+        self.entries.append(entry)
+
+    def har(self, page_title):
+        return {'log': {
+            'version': "1.2",
+            'creator': HAR_CREATOR,
+            'pages': [],
+            'entries': sorted(self.entries, key=lambda entry: entry['startedDateTime']),
+            'comment': page_title,
+        }}
+
+
+class TraceCapture:
+    """
+    Per-test capture on a browser created with apply_chrome_capture_options().
+    The performance log is drained at start so only the test's own events are kept.
+    """
+
+    def __init__(self, driver, logger=None):
+        self.driver = driver
+        self.logger = logger
+        self._overhead = 0.0
+        self._started = None
+
+    @staticmethod
+    def supported(driver):
+        """Whether the browser exposes the ChromeDriver performance log."""
+        try:
+            return PERFORMANCE_LOG in driver.log_types
+        except Exception:
+            return False
+
+    def start(self):
+        """Discard events logged before the test (previous tests of a pooled browser)."""
+        started = time.perf_counter()
+        self.driver.get_log(PERFORMANCE_LOG)
+        self._started = time.time()
+        self._overhead = time.perf_counter() - started
+
+    def stop(self, title=""):
+        """
+        Collect the test's events.
+
+        Args:
+            title (str): Description stored in the trace metadata and HAR (e.g. node ID)
+
+        Returns:
+            CaptureResult: Trace, HAR and capture overhead
+        """
+        started = time.perf_counter()
+        entries = self.driver.get_log(PERFORMANCE_LOG)
+
+        trace_events = []
+        har = _HarBuilder()
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            method = message.get('method', "")
+            if method == "Tracing.dataCollected":
+                trace_events.append(message['params'])
+            elif method.startswith("Network."):
+                har.add(method, message.get('params', {}))
+
+        trace = {
+            'traceEvents': trace_events,
+            'metadata': {'source': title, 'startTime': self._started, 'clock-domain': "LINUX_CLOCK_MONOTONIC"},
+        }
+        har_log = har.har(title)
+        self._overhead += time.perf_counter() - started
+
+        if self.logger:
+            self.logger.debug("Collected %d trace events and %d HAR entries from %d log entries",
+                              len(trace_events), len(har.entries), len(entries))
+        return CaptureResult(trace, har_log, self._overhead, len(trace_events), len(har.entries))
+
+
+def write_capture(result, base_path, compress_level=6):
+    """
+    Write a capture as <base_path>.trace.json.gz (DevTools Performance panel) and <base_path>.har.gz.
+
+    Args:
+        result (CaptureResult): Capture to write
+        base_path (str): Path without extension, e.g. next to the failure screenshot
+        compress_level (int): gzip level 1-9
+
+    Returns:
+        tuple: (trace path, HAR path, seconds spent writing)
+    """
+    started = time.perf_counter()
+    os.makedirs(os.path.dirname(base_path) or ".", exist_ok=True)
+
+    paths = []
+    for suffix, payload in ((TRACE_SUFFIX, result.trace), (HAR_SUFFIX, result.har)):
+        path = base_path + suffix
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=compress_level) as f:
+            json.dump(payload, f, separators=(",", ":"))
+        paths.append(path)
+
+    return paths[0], paths[1], time.perf_counter() - started
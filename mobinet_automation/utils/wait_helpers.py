@@ -4,6 +4,7 @@ Provides custom wait conditions and retry mechanisms for Mobinet automation.
 """
 
 import time
+from contextlib import contextmanager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
@@ -11,10 +12,128 @@ from selenium.common.exceptions import (
     TimeoutException, 
     StaleElementReferenceException, 
     NoSuchElementException,
-    ElementNotInteractableException
+    ElementNotInteractableException,
+    WebDriverException
 )
 
 
+# Locates elements for a Selenium (By, value) pair inside the browser.
+FIND_ELEMENTS_JS = """
+function findAll(by, value) {
+    var nodes;
+    switch (by) {
+        case 'id':
+            var element = document.getElementById(value);
+            return element ? [element] : [];
+        case 'class name': nodes = document.getElementsByClassName(value); break;
+        case 'css selector': nodes = document.querySelectorAll(value); break;
+        case 'tag name': nodes = document.getElementsByTagName(value); break;
+        case 'name': nodes = document.getElementsByName(value); break;
+        case 'xpath':
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var found = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) found.push(snapshot.snapshotItem(i));
+            return found;
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.filter.call(document.getElementsByTagName('a'), function (a) {
+                var text = a.textContent.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+        default: return [];
+    }
+    return Array.prototype.slice.call(nodes);
+}
+
+function isVisible(element) {
+    if (!(element.offsetWidth || element.offsetHeight || element.getClientRects().length)) return false;
+    return window.getComputedStyle(element).visibility !== 'hidden';
+}
+"""
+
+# Installs a MutationObserver plus fetch/XHR counters once per document.
+# documentId + mutations form a DOM version that changes on any DOM update or navigation.
+ACTIVITY_TRACKER_JS = """
+if (!window.__mobinetActivity) {
+    var state = {
+        documentId: Math.random().toString(36).slice(2),
+        pending: 0, mutations: 0,
+        lastMutation: performance.now(), lastNetwork: performance.now()
+    };
+    window.__mobinetActivity = state;
+
+    new MutationObserver(function (records) {
+        state.mutations += records.length;
+        state.lastMutation = performance.now();
+    }).observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+
+    var requestDone = function () {
+        state.pending = Math.max(0, state.pending - 1);
+        state.lastNetwork = performance.now();
+    };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            return originalFetch.apply(this, arguments).then(
+                function (response) { requestDone(); return response; },
+                function (error) { requestDone(); throw error; }
+            );
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        this.addEventListener('loadend', requestDone);
+        return originalSend.apply(this, arguments);
+    };
+}
+"""
+
+# Returns the current activity state, installing the tracker in the same round-trip.
+ACTIVITY_STATE_SCRIPT = ACTIVITY_TRACKER_JS + """
+var activity = window.__mobinetActivity;
+var now = performance.now();
+return {
+    ready: document.readyState === 'complete',
+    pending: activity.pending,
+    mutations: activity.mutations,
+    quietFor: now - activity.lastMutation,
+    idleFor: now - activity.lastNetwork
+};
+"""
+
+# Returns the number of <option> elements in a dropdown, or -1 if it is not in the DOM.
+DROPDOWN_OPTION_COUNT_SCRIPT = FIND_ELEMENTS_JS + """
+var dropdown = findAll(arguments[0], arguments[1])[0];
+if (!dropdown) return -1;
+return dropdown.getElementsByTagName('option').length;
+"""
+
+# Returns the option values of a dropdown, or null if it is not in the DOM.
+DROPDOWN_OPTION_VALUES_SCRIPT = FIND_ELEMENTS_JS + """
+var dropdown = findAll(arguments[0], arguments[1])[0];
+if (!dropdown) return null;
+return Array.prototype.map.call(dropdown.getElementsByTagName('option'), function (option) { return option.value; });
+"""
+
+ELEMENT_STABLE_SCRIPT = """
+var element = arguments[0], done = arguments[arguments.length - 1];
+var last = null, frames = 0;
+function tick() {
+    var rect = element.getBoundingClientRect();
+    var key = rect.top + ',' + rect.left;
+    if (key === last) { done(true); return; }
+    last = key;
+    if (++frames > 60) { done(false); return; }
+    requestAnimationFrame(tick);
+}
+requestAnimationFrame(tick);
+"""
+
+
 class WaitHelpers:
     """
     Advanced wait utilities for reliable test automation.
@@ -34,6 +153,23 @@ class WaitHelpers:
         self.default_timeout = default_timeout
         self.logger = logger
         
+    @contextmanager
+    def implicit_wait(self, seconds):
+        """
+        Temporarily apply an implicit wait for legacy code paths.
+        The framework runs with implicit wait 0 so explicit waits are not stretched;
+        the previous value is restored on exit.
+        
+        Args:
+            seconds (float): Implicit wait to apply inside the block
+        """
+        previous = self.driver.timeouts.implicit_wait
+        self.driver.implicitly_wait(seconds)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(previous)
+            
     def wait_for_element_visible(self, locator, timeout=None, description=""):
         """
         Wait for element to be visible.
@@ -50,14 +186,14 @@ class WaitHelpers:
         
         try:
             if self.logger:
-                self.logger.debug(f"Waiting for element visible: {locator} - {description}")
+                self.logger.debug("Waiting for element visible: %s - %s", locator, description)
                 
             element = WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             
             if self.logger:
-                self.logger.debug(f"Element found and visible: {locator}")
+                self.logger.debug("Element found and visible: %s", locator)
                 
             return element
             
@@ -82,14 +218,14 @@ class WaitHelpers:
         
         try:
             if self.logger:
-                self.logger.debug(f"Waiting for element clickable: {locator} - {description}")
+                self.logger.debug("Waiting for element clickable: %s - %s", locator, description)
                 
             element = WebDriverWait(self.driver, timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             
             if self.logger:
-                self.logger.debug(f"Element found and clickable: {locator}")
+                self.logger.debug("Element found and clickable: %s", locator)
                 
             return element
             
@@ -98,6 +234,21 @@ class WaitHelpers:
                 self.logger.error(f"Timeout waiting for clickable element: {locator} - {description}")
             raise TimeoutException(f"Element not clickable within {timeout} seconds: {locator}")
             
+    def get_dropdown_option_count(self, dropdown_locator):
+        """
+        Count dropdown options in a single script call.
+        
+        Args:
+            dropdown_locator (tuple): Dropdown element locator
+            
+        Returns:
+            int: Number of options, or -1 if the dropdown is not in the DOM
+        """
+        try:
+            return self.driver.execute_script(DROPDOWN_OPTION_COUNT_SCRIPT, *dropdown_locator)
+        except WebDriverException:
+            return -1
+            
     def wait_for_dropdown_options_loaded(self, dropdown_locator, minimum_options=1, timeout=None):
         """
         Wait for dropdown options to be loaded.
@@ -113,17 +264,12 @@ class WaitHelpers:
         timeout = timeout or self.default_timeout
         
         def dropdown_options_loaded(driver):
-            try:
-                dropdown = driver.find_element(*dropdown_locator)
-                options = dropdown.find_elements(By.TAG_NAME, "option")
-                return len(options) >= minimum_options
-            except:
-                return False
+            return self.get_dropdown_option_count(dropdown_locator) >= minimum_options
                 
         try:
             WebDriverWait(self.driver, timeout).until(dropdown_options_loaded)
             if self.logger:
-                self.logger.debug(f"Dropdown options loaded: {dropdown_locator}")
+                self.logger.debug("Dropdown options loaded: %s", dropdown_locator)
             return True
         except TimeoutException:
             if self.logger:
@@ -149,7 +295,7 @@ class WaitHelpers:
                 EC.text_to_be_present_in_element(locator, expected_text)
             )
             if self.logger:
-                self.logger.debug(f"Text '{expected_text}' found in element: {locator}")
+                self.logger.debug("Text '%s' found in element: %s", expected_text, locator)
             return True
         except TimeoutException:
             if self.logger:
@@ -174,7 +320,7 @@ class WaitHelpers:
                 EC.invisibility_of_element_located(locator)
             )
             if self.logger:
-                self.logger.debug(f"Element disappeared: {locator}")
+                self.logger.debug("Element disappeared: %s", locator)
             return True
         except TimeoutException:
             if self.logger:
@@ -313,7 +459,7 @@ class WaitHelpers:
             )
             
             if self.logger:
-                self.logger.debug(f"Hierarchical dropdowns status: {result}")
+                self.logger.debug("Hierarchical dropdowns status: %s", result)
                 
             return result
             
@@ -352,9 +498,232 @@ class WaitHelpers:
         try:
             WebDriverWait(self.driver, timeout).until(date_picker_loaded)
             if self.logger:
-                self.logger.debug(f"Date picker loaded: {date_picker_locator}")
+                self.logger.debug("Date picker loaded: %s", date_picker_locator)
             return True
         except TimeoutException:
             if self.logger:
                 self.logger.error(f"Timeout waiting for date picker: {date_picker_locator}")
-            return False
\ No newline at end of file
+            return False
+            
+    def install_activity_tracker(self):
+        """
+        Install the fetch/XHR and DOM activity tracker in the current document.
+        Must run before an action that starts requests, otherwise they are not counted;
+        a no-op when the document already has it.
+        
+        Returns:
+            bool: True if the tracker is installed
+        """
+        try:
+            self.driver.execute_script(ACTIVITY_TRACKER_JS)
+            return True
+        except WebDriverException:
+            return False
+            
+    def get_activity_state(self):
+        """
+        Get DOM and network activity for the current document.
+        Installs the activity tracker if it is missing (e.g. after a navigation); requests
+        already in flight at that point are not counted, see install_activity_tracker().
+        
+        Returns:
+            dict: ready, pending requests, mutation count and quiet/idle durations (ms),
+                  or None if the page could not be queried
+        """
+        try:
+            return self.driver.execute_script(ACTIVITY_STATE_SCRIPT)
+        except WebDriverException:
+            return None
+            
+    def _wait_for_activity(self, condition, timeout, description):
+        """Poll the activity tracker until condition(state) holds."""
+        timeout = timeout or self.default_timeout
+        
+        def activity_condition(driver):
+            state = self.get_activity_state()
+            return state is not None and condition(state)
+            
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(activity_condition)
+            if self.logger:
+                self.logger.debug("%s reached", description)
+            return True
+        except TimeoutException:
+            if self.logger:
+                self.logger.warning(f"Timeout waiting for {description}")
+            return False
+            
+    def wait_for_dom_quiescent(self, quiet_ms=200, timeout=None):
+        """
+        Wait until the DOM has not changed for quiet_ms milliseconds.
+        
+        Args:
+            quiet_ms (int): Required quiet period in milliseconds
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            bool: True if the DOM became quiescent
+        """
+        return self._wait_for_activity(
+            lambda state: state['ready'] and state['quietFor'] >= quiet_ms,
+            timeout,
+            f"DOM quiescent for {quiet_ms}ms"
+        )
+        
+    def wait_for_network_idle(self, idle_ms=200, timeout=None):
+        """
+        Wait until no fetch/XHR request has been in flight for idle_ms milliseconds.
+        
+        Args:
+            idle_ms (int): Required idle period in milliseconds
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            bool: True if the network became idle
+        """
+        return self._wait_for_activity(
+            lambda state: state['pending'] == 0 and state['idleFor'] >= idle_ms,
+            timeout,
+            f"network idle for {idle_ms}ms"
+        )
+        
+    def wait_for_ui_settled(self, quiet_ms=200, timeout=None):
+        """
+        Wait until the page is loaded, the network is idle and the DOM is quiescent.
+        Replaces fixed sleeps after actions that trigger requests or re-renders.
+        
+        Args:
+            quiet_ms (int): Required quiet period in milliseconds
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            bool: True if the UI settled
+        """
+        return self._wait_for_activity(
+            lambda state: (state['ready'] and state['pending'] == 0 and
+                           state['quietFor'] >= quiet_ms and state['idleFor'] >= quiet_ms),
+            timeout,
+            f"UI settled for {quiet_ms}ms"
+        )
+        
+    def wait_for_element_stable(self, element):
+        """
+        Wait until an element stops moving (e.g. after scrolling or animation).
+        Compares its position across animation frames, giving up after ~60 frames.
+        
+        Args:
+            element: WebElement to watch
+            
+        Returns:
+            bool: True if the element position is stable
+        """
+        try:
+            return bool(self.driver.execute_async_script(ELEMENT_STABLE_SCRIPT, element))
+        except WebDriverException as e:
+            if self.logger:
+                self.logger.warning(f"Could not confirm element is stable: {str(e)}")
+            return False
+            
+    def wait_for_element_value_changed(self, locator, previous_value, timeout=None):
+        """
+        Wait for an element's value to differ from previous_value.
+        
+        Args:
+            locator (tuple): (By strategy, locator string)
+            previous_value (str): Value observed before the action
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            bool: True if the value changed
+        """
+        timeout = timeout or self.default_timeout
+        
+        def value_changed(driver):
+            try:
+                return driver.find_element(*locator).get_attribute("value") != previous_value
+            except (NoSuchElementException, StaleElementReferenceException):
+                return False
+                
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(value_changed)
+            if self.logger:
+                self.logger.debug("Element value changed: %s", locator)
+            return True
+        except TimeoutException:
+            if self.logger:
+                self.logger.warning(f"Timeout waiting for value change: {locator}")
+            return False
+            
+    def wait_for_option_count_changed(self, dropdown_locator, previous_count, timeout=None):
+        """
+        Wait for the number of options in a dropdown to differ from previous_count.
+        
+        Args:
+            dropdown_locator (tuple): Dropdown element locator
+            previous_count (int): Option count observed before the action
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            bool: True if the option count changed
+        """
+        timeout = timeout or self.default_timeout
+        
+        def option_count_changed(driver):
+            count = self.get_dropdown_option_count(dropdown_locator)
+            return count >= 0 and count != previous_count
+                
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(option_count_changed)
+            if self.logger:
+                self.logger.debug("Dropdown option count changed: %s", dropdown_locator)
+            return True
+        except TimeoutException:
+            if self.logger:
+                self.logger.warning(f"Timeout waiting for option count change: {dropdown_locator}")
+            return False
+            
+    def get_dropdown_option_values(self, dropdown_locator):
+        """
+        Get the option values of a dropdown in a single script call.
+        
+        Args:
+            dropdown_locator (tuple): Dropdown element locator
+            
+        Returns:
+            list: Option values, or None if the dropdown is not in the DOM
+        """
+        try:
+            return self.driver.execute_script(DROPDOWN_OPTION_VALUES_SCRIPT, *dropdown_locator)
+        except WebDriverException:
+            return None
+            
+    def wait_for_options_replaced(self, dropdown_locator, previous_values, minimum_options=2, timeout=None):
+        """
+        Wait for a dependent dropdown to be repopulated after its parent changed.
+        The options must differ from previous_values and number at least minimum_options,
+        so neither the stale list nor the cleared placeholder-only list satisfies the wait.
+        
+        Args:
+            dropdown_locator (tuple): Dropdown element locator
+            previous_values (list): Option values observed before the parent changed
+            minimum_options (int): Options of a loaded list (placeholder included)
+            timeout (int): Custom timeout (optional)
+            
+        Returns:
+            bool: True if new options were loaded
+        """
+        timeout = timeout or self.default_timeout
+        
+        def options_replaced(driver):
+            values = self.get_dropdown_option_values(dropdown_locator)
+            return values is not None and len(values) >= minimum_options and values != previous_values
+                
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(options_replaced)
+            if self.logger:
+                self.logger.debug("Dropdown options replaced: %s", dropdown_locator)
+            return True
+        except TimeoutException:
+            if self.logger:
+                self.logger.warning(f"Timeout waiting for new dropdown options: {dropdown_locator}")
+            return False